@@ -120,6 +120,8 @@ class Address(object):
 
         self.__prefix = address_prefix
         self.__body = address_body
+        # Cache of to_bytes() which is used to build db keys
+        self.__bytes: Optional[bytes] = None
 
     @property
     def prefix(self) -> AddressPrefix:
@@ -241,10 +243,15 @@ class Address(object):
 
         :return: :class:`.bytes` data including information of Address object
         """
-        if self.__prefix == AddressPrefix.EOA:
-            return self.__body
-        else:
-            return self.__prefix.to_bytes(1, DATA_BYTE_ORDER) + self.__body
+        data: Optional[bytes] = self.__bytes
+        if data is None:
+            if self.__prefix == AddressPrefix.EOA:
+                data = self.__body
+            else:
+                data = self.__prefix.to_bytes(1, DATA_BYTE_ORDER) + self.__body
+            self.__bytes = data
+
+        return data
 
     @staticmethod
     def from_bytes_including_prefix(buf: bytes) -> Optional['Address']:
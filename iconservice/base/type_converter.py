@@ -15,7 +15,7 @@
 # limitations under the License.
 
 from copy import deepcopy
-from typing import Union, Any, get_type_hints
+from typing import Union, Any, Callable, Dict, Optional, get_type_hints
 
 from .address import Address, MalformedAddress, is_icon_address_valid
 from .exception import InvalidParamsException
@@ -33,6 +33,26 @@ class TypeConverter:
         if param_type is None:
             return params
 
+        converter = _compiled_converters.get(param_type)
+        if converter is None:
+            converter = _compile_template(type_convert_templates[param_type], {})
+            _compiled_converters[param_type] = converter
+
+        return converter(params)
+
+    @staticmethod
+    def convert_by_template(params: dict, param_type: ParamType) -> Any:
+        """Convert params by walking the template of param_type
+
+        It is slower than convert() and left as a reference implementation
+
+        :param params:
+        :param param_type:
+        :return:
+        """
+        if param_type is None:
+            return params
+
         copied_params = deepcopy(params)  # to avoid corrupting original data
         converted_params = TypeConverter._convert(copied_params, type_convert_templates[param_type])
         return converted_params
@@ -293,3 +313,174 @@ class TypeConverter:
             return bytes.hex(value)
         else:
             return f'0x{bytes.hex(value)}'
+
+
+# ParamType -> converter compiled from its template
+_compiled_converters: Dict[ParamType, Callable[[Any], Any]] = {}
+
+
+def _fallback(template: Any) -> Callable[[Any], Any]:
+    """Returns a converter which handles unusual params in the same way as TypeConverter._convert()
+
+    The params are copied first not to share any mutable object with the original ones
+
+    :param template:
+    :return:
+    """
+    def _convert(params: Any) -> Any:
+        return TypeConverter._convert(deepcopy(params), template)
+
+    return _convert
+
+
+def _compile_value(template: Any) -> Callable[[Any], Any]:
+    """Compile a template which is neither a dict nor a list
+
+    :param template: ValueType or a template to ignore
+    :return:
+    """
+    if isinstance(template, ValueType) and template:
+        if template == ValueType.LATER:
+            convert_str = None
+        elif template == ValueType.ADDRESS:
+            def convert_str(value: str) -> Optional['Address']:
+                return None if len(value) == 0 else TypeConverter._convert_value_address(value)
+        else:
+            convert_str = _VALUE_CONVERTERS[template]
+    else:
+        convert_str = None
+
+    fallback = _fallback(template)
+
+    if convert_str is None:
+        def _convert(value: Any) -> Any:
+            return value if isinstance(value, str) else fallback(value)
+    else:
+        def _convert(value: Any) -> Any:
+            return convert_str(value) if isinstance(value, str) else fallback(value)
+
+    return _convert
+
+
+def _compile_dict(template: dict, compiled: dict) -> Callable[[Any], Any]:
+    key_converter: Optional[dict] = template.get(KEY_CONVERTER) if KEY_CONVERTER in template else None
+    fields: Dict[str, Callable[[Any], Any]] = {}
+    switches: Dict[str, Callable[[Any, dict], Any]] = {}
+
+    for key, sub_template in template.items():
+        if isinstance(sub_template, dict) and CONVERT_USING_SWITCH_KEY in sub_template:
+            switches[key] = _compile_switch(sub_template[CONVERT_USING_SWITCH_KEY], compiled)
+        else:
+            fields[key] = _compile_template(sub_template, compiled)
+
+    convert_unknown = _compile_template(None, compiled)
+    fallback = _fallback(template)
+
+    def _convert(params: Any) -> Any:
+        if not isinstance(params, dict) or not params:
+            return fallback(params)
+
+        if key_converter is not None:
+            params = TypeConverter._convert_key(params, key_converter)
+
+        new_params = {}
+        for key, value in params.items():
+            switch = switches.get(key)
+            if switch is None:
+                new_params[key] = fields.get(key, convert_unknown)(value)
+            else:
+                new_params[key] = switch(value, new_params)
+
+        return new_params
+
+    return _convert
+
+
+def _compile_switch(template: dict, compiled: dict) -> Callable[[Any, dict], Any]:
+    """Compile a template whose value is selected by another value converted before
+
+    :param template: template with SWITCH_KEY
+    :param compiled:
+    :return:
+    """
+    switch_key: str = template.get(SWITCH_KEY)
+    # name selected by switch_key -> converters of the fields
+    targets: Dict[Any, Dict[str, Callable[[Any], Any]]] = {}
+
+    for name, target_template in template.items():
+        if isinstance(target_template, dict):
+            # Unlike _compile_dict(), neither KEY_CONVERTER nor CONVERT_USING_SWITCH_KEY is applied to its fields
+            fields = {key: _compile_template(sub_template, compiled)
+                      for key, sub_template in target_template.items()}
+            targets[name] = fields
+
+    convert_unknown = _compile_template(None, compiled)
+
+    def _convert(params: Any, new_params: dict) -> Any:
+        fields = targets.get(new_params.get(switch_key)) if isinstance(params, dict) and params else None
+        if fields is None:
+            return TypeConverter._convert_using_switch(deepcopy(params), new_params, template)
+
+        return {key: fields.get(key, convert_unknown)(value) for key, value in params.items()}
+
+    return _convert
+
+
+def _compile_list(template: list, compiled: dict) -> Callable[[Any], Any]:
+    convert_item = _compile_template(template[0], compiled)
+    if isinstance(template[0], list):
+        row_converters = tuple(_compile_template(sub_template, compiled) for sub_template in template[0])
+    else:
+        row_converters = None
+
+    fallback = _fallback(template)
+
+    def _convert(params: Any) -> Any:
+        if not isinstance(params, list) or not params:
+            return fallback(params)
+
+        new_params = []
+        for item in params:
+            if not isinstance(item, list):
+                new_params.append(convert_item(item))
+            elif row_converters is not None:
+                new_params.append([convert(element) for element, convert in zip(item, row_converters)])
+            else:
+                new_params.append(fallback([item])[0])
+
+        return new_params
+
+    return _convert
+
+
+def _compile_template(template: Any, compiled: dict) -> Callable[[Any], Any]:
+    """Compile a template of type_convert_templates into a converter
+    which returns the same result as TypeConverter._convert() without copying the whole params first
+
+    :param template:
+    :param compiled: id(template) -> converter already compiled (templates are shared by each other)
+    :return: converter
+    """
+    converter = compiled.get(id(template))
+    if converter is not None:
+        return converter
+
+    if isinstance(template, dict) and template:
+        converter = _compile_dict(template, compiled)
+    elif isinstance(template, list) and template:
+        converter = _compile_list(template, compiled)
+    else:
+        converter = _compile_value(template)
+
+    compiled[id(template)] = converter
+    return converter
+
+
+_VALUE_CONVERTERS = {
+    ValueType.INT: TypeConverter._convert_value_int,
+    ValueType.HEXADECIMAL: TypeConverter._convert_value_hexadecimal,
+    ValueType.STRING: TypeConverter._convert_value_string,
+    ValueType.BOOL: TypeConverter._convert_value_bool,
+    ValueType.ADDRESS_OR_MALFORMED_ADDRESS: TypeConverter._convert_value_address_or_malformed_address,
+    ValueType.BYTES: TypeConverter._convert_value_bytes
+}
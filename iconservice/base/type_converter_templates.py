@@ -38,6 +38,7 @@ class ParamType(IntEnum):
     ICX_GET_TOTAL_SUPPLY = 303
     ICX_GET_SCORE_API = 304
     ISE_GET_STATUS = 305
+    ISE_GET_EVENT_LOGS = 306
 
     WRITE_PRECOMMIT = 400
     REMOVE_PRECOMMIT = 500
@@ -161,6 +162,18 @@ class ConstantKeys:
     ICX_GET_TOTAL_SUPPLY = "icx_getTotalSupply"
     ICX_GET_SCORE_API = "icx_getScoreApi"
     ISE_GET_STATUS = "ise_getStatus"
+    ISE_GET_EVENT_LOGS = "ise_getEventLogs"
+
+    # ise_getEventLogs
+    SCORE_ADDRESS = "scoreAddress"
+    TX_INDEX = "txIndex"
+    EVENT = "event"
+    INDEXED = "indexed"
+    FROM_BLOCK = "fromBlock"
+    TO_BLOCK = "toBlock"
+    LIMIT = "limit"
+    EVENT_LOGS = "eventLogs"
+    NEXT_BLOCK_HEIGHT = "nextBlockHeight"
 
     DEPOSIT_TERM = "term"
     DEPOSIT_ID = "id"
@@ -303,6 +316,15 @@ type_convert_templates[ParamType.ISE_GET_STATUS] = {
     ConstantKeys.FILTER: [ValueType.STRING]
 }
 
+# Indexed arguments are converted according to the types in the event signature
+type_convert_templates[ParamType.ISE_GET_EVENT_LOGS] = {
+    ConstantKeys.SCORE_ADDRESS: ValueType.ADDRESS,
+    ConstantKeys.EVENT: ValueType.STRING,
+    ConstantKeys.FROM_BLOCK: ValueType.INT,
+    ConstantKeys.TO_BLOCK: ValueType.INT,
+    ConstantKeys.LIMIT: ValueType.INT
+}
+
 type_convert_templates[ParamType.QUERY] = {
     ConstantKeys.METHOD: ValueType.STRING,
     ConstantKeys.PARAMS: {
@@ -312,7 +334,8 @@ type_convert_templates[ParamType.QUERY] = {
             ConstantKeys.ICX_GET_BALANCE: type_convert_templates[ParamType.ICX_GET_BALANCE],
             ConstantKeys.ICX_GET_TOTAL_SUPPLY: type_convert_templates[ParamType.ICX_GET_TOTAL_SUPPLY],
             ConstantKeys.ICX_GET_SCORE_API: type_convert_templates[ParamType.ICX_GET_SCORE_API],
-            ConstantKeys.ISE_GET_STATUS: type_convert_templates[ParamType.ISE_GET_STATUS]
+            ConstantKeys.ISE_GET_STATUS: type_convert_templates[ParamType.ISE_GET_STATUS],
+            ConstantKeys.ISE_GET_EVENT_LOGS: type_convert_templates[ParamType.ISE_GET_EVENT_LOGS]
         }
     }
 }
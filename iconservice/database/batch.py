@@ -15,14 +15,15 @@
 # limitations under the License.
 
 
+import hashlib
+from bisect import bisect_left
 from collections import OrderedDict, namedtuple
 from collections.abc import MutableMapping
-from typing import Optional
+from typing import Optional, List, Iterable, Tuple
 
 from iconcommons.logger import Logger
 
 from ..base.exception import DatabaseException, AccessDeniedException
-from ..utils import sha3_256
 
 from ..base.block import Block
 from ..icx import IcxStorage
@@ -30,21 +31,68 @@ from ..icx import IcxStorage
 
 TransactionBatchValue = namedtuple('TransactionBatchValue', ['value', 'include_state_root_hash'])
 
+# Marks a key which does not exist in a batch
+_NOT_EXIST = object()
 
-def digest(ordered_dict: OrderedDict):
-    # items in data MUST be byte-like objects
-    data = []
 
-    for key, tx_batch_value in ordered_dict.items():
-        if tx_batch_value.include_state_root_hash is True:
-            value: bytes = tx_batch_value.value
+class StreamingDigest(object):
+    """Creates the same sha3_256 hash value as sha3_256(b'|'.join(data))
+    without building a whole joined buffer
+
+    Key-value pairs are joined by chunks and fed into an incremental sha3_256 hasher
+    """
+    CHUNK_SIZE = 1024
+
+    def __init__(self):
+        self._hasher = hashlib.sha3_256()
+        self._is_empty = True
+        self._chunk: List[bytes] = []
+
+    def update(self, items: Iterable[Tuple[bytes, tuple]]):
+        """Feed key-value pairs into the hasher
+
+        :param items: iterable which returns (key, TransactionBatchValue)
+        """
+        chunk: List[bytes] = self._chunk
+
+        for key, (value, include_state_root_hash) in items:
+            if include_state_root_hash is not True:
+                continue
+
+            chunk.append(key)
+            if value is not None:
+                chunk.append(value)
+
+            if len(chunk) >= self.CHUNK_SIZE:
+                self._flush()
+
+    def digest(self) -> bytes:
+        """Returns the hash value of the data fed so far
+
+        More data can be fed after calling this method
+        """
+        self._flush()
+        return self._hasher.digest()
+
+    def _flush(self):
+        chunk: List[bytes] = self._chunk
+        if not chunk:
+            return
+
+        if self._is_empty:
+            self._is_empty = False
         else:
-            continue
-        data.append(key)
-        if value is not None:
-            data.append(value)
-    value: bytes = b'|'.join(data)
-    return sha3_256(value)
+            self._hasher.update(b'|')
+
+        self._hasher.update(b'|'.join(chunk))
+        chunk.clear()
+
+
+def digest(ordered_dict: OrderedDict):
+    # items in data MUST be byte-like objects
+    streaming_digest = StreamingDigest()
+    streaming_digest.update(ordered_dict.items())
+    return streaming_digest.digest()
 
 
 class Batch(OrderedDict):
@@ -72,6 +120,9 @@ class Batch(OrderedDict):
 class TransactionBatch(MutableMapping):
     """Contains the states changed by a transaction.
 
+    All states changed by nested calls are kept in a single OrderedDict.
+    Each nested call has its own undo log to restore the states on revert_call()
+
     key: Score Address
     value: IconScoreBatch
     """
@@ -82,68 +133,91 @@ class TransactionBatch(MutableMapping):
         """
         super().__init__()
         self.hash = tx_hash
-        self._call_batches = [OrderedDict()]
+        self._batch = OrderedDict()
+        # undo log: key -> the value before a nested call changed it
+        self._undo_logs: List[dict] = []
+        # The number of keys which are changed again in a nested call
+        self._overwritten_count = 0
 
     def __getitem__(self, item):
-        for call_batch in reversed(self._call_batches):
-            if item in call_batch:
-                return call_batch[item]
-
-        return None
+        return self._batch.get(item)
 
     def __setitem__(self, key, value):
-        call_batch: OrderedDict = self._call_batches[-1]
-        call_batch[key] = value
+        if self._undo_logs:
+            undo_log: dict = self._undo_logs[-1]
+            if key not in undo_log:
+                prev_value = self._batch.get(key, _NOT_EXIST)
+                undo_log[key] = prev_value
+                if prev_value is not _NOT_EXIST:
+                    self._overwritten_count += 1
+
+        self._batch[key] = value
 
     def __delitem__(self, key):
         raise DatabaseException('delete item is not allowed')
 
     def __contains__(self, item):
-        for call_batch in self._call_batches:
-            if item in call_batch:
-                return True
-
-        return False
+        return item in self._batch
 
     def __iter__(self):
-        for call_batch in self._call_batches:
-            for key in call_batch:
-                yield key
+        return iter(self._batch)
 
     def __len__(self):
-        length = 0
-
-        for call_batch in self._call_batches:
-            length += len(call_batch)
-
-        return length
+        # Same as the total number of keys changed in each call
+        return len(self._batch) + self._overwritten_count
 
     def enter_call(self):
-        self._call_batches.append(OrderedDict())
+        self._undo_logs.append({})
 
     def revert_call(self):
-        call_batch: OrderedDict = self._call_batches[-1]
-        call_batch.clear()
+        if not self._undo_logs:
+            self._batch.clear()
+            return
 
-    def leave_call(self):
-        call_batch: OrderedDict = self._call_batches.pop()
+        batch: OrderedDict = self._batch
+        undo_log: dict = self._undo_logs[-1]
 
-        if call_batch:
-            self._call_batches[-1].update(call_batch)
+        for key, prev_value in undo_log.items():
+            if prev_value is _NOT_EXIST:
+                del batch[key]
+            else:
+                batch[key] = prev_value
+                self._overwritten_count -= 1
+
+        undo_log.clear()
+
+    def leave_call(self):
+        undo_log: dict = self._undo_logs.pop()
+        if not undo_log:
+            return
+
+        if self._undo_logs:
+            parent_undo_log: dict = self._undo_logs[-1]
+            for key, prev_value in undo_log.items():
+                if key in parent_undo_log:
+                    self._overwritten_count -= 1
+                else:
+                    parent_undo_log[key] = prev_value
+        else:
+            for prev_value in undo_log.values():
+                if prev_value is not _NOT_EXIST:
+                    self._overwritten_count -= 1
 
     def digest(self) -> bytes:
-        if len(self._call_batches) != 1:
-            raise DatabaseException(f'Wrong call_batch count: {len(self._call_batches)}')
+        if self._undo_logs:
+            raise DatabaseException(f'Wrong call_batch count: {self.call_count}')
 
-        return digest(self._call_batches[0])
+        return digest(self._batch)
 
     @property
     def call_count(self) -> int:
-        return len(self._call_batches)
+        return len(self._undo_logs) + 1
 
     def clear(self):
         self.hash = None
-        self._call_batches = [OrderedDict()]
+        self._batch.clear()
+        self._undo_logs.clear()
+        self._overwritten_count = 0
 
 
 class BlockBatch(Batch):
@@ -159,14 +233,78 @@ class BlockBatch(Batch):
         """
         super().__init__()
         self.block = block
+        # BlockBatch of the uncommitted precommit block which this block is invoked on top of
+        self.parent: Optional['BlockBatch'] = None
+        # Kept warm while tx_batches only append new keys to this batch
+        # None means that already digested data has been changed
+        self._streaming_digest: Optional[StreamingDigest] = StreamingDigest()
+        # Sorted keys to find the keys with a prefix without scanning all keys
+        # New keys are merged into it on demand and None means that it should be rebuilt
+        self._sorted_keys: Optional[List[bytes]] = []
+        self._new_keys: List[bytes] = []
 
     def __setitem__(self, key, value):
         raise AccessDeniedException("Can not set data on block batch directly.")
 
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._streaming_digest = None
+        self._sorted_keys = None
+
     def update(self, tx_batch: 'TransactionBatch', **kwargs):
+        new_items = []
+
         for key, value in tx_batch.items():
+            prev_value = self.get(key, _NOT_EXIST)
+            if prev_value is _NOT_EXIST:
+                new_items.append((key, value))
+            elif prev_value != value:
+                self._streaming_digest = None
+
             super().__setitem__(key, value)
 
+        if self._streaming_digest is not None:
+            self._streaming_digest.update(new_items)
+
+        self._new_keys.extend(key for key, _ in new_items)
+
+    def keys_with_prefix(self, prefix: bytes) -> List[bytes]:
+        """Returns the keys which start with prefix in the order of keys
+
+        :param prefix:
+        :return: keys
+        """
+        sorted_keys: List[bytes] = self._get_sorted_keys()
+        ret = []
+
+        for i in range(bisect_left(sorted_keys, prefix), len(sorted_keys)):
+            key: bytes = sorted_keys[i]
+            if not key.startswith(prefix):
+                break
+            ret.append(key)
+
+        return ret
+
+    def _get_sorted_keys(self) -> List[bytes]:
+        sorted_keys: Optional[List[bytes]] = self._sorted_keys
+
+        if sorted_keys is None or len(sorted_keys) + len(self._new_keys) != len(self):
+            sorted_keys = sorted(self.keys())
+        elif len(self._new_keys) > 0:
+            # Sorting is linear to merge the sorted keys and a few new keys
+            sorted_keys.extend(self._new_keys)
+            sorted_keys.sort()
+
+        self._sorted_keys = sorted_keys
+        self._new_keys = []
+        return sorted_keys
+
+    def digest(self) -> bytes:
+        if self._streaming_digest is None:
+            return super().digest()
+
+        return self._streaming_digest.digest()
+
     def update_block_hash(self, block_hash: bytes):
         self.block = Block(block_height=self.block.height,
                            block_hash=block_hash,
@@ -179,8 +317,14 @@ class BlockBatch(Batch):
         block_key: bytes = IcxStorage.LAST_BLOCK_KEY
         block_value: tuple = TransactionBatchValue(self.block.to_bytes(revision), False)
 
+        if block_key not in self:
+            self._new_keys.append(block_key)
         super().__setitem__(block_key, block_value)
 
     def clear(self) -> None:
         self.block = None
+        self.parent = None
+        self._streaming_digest = StreamingDigest()
+        self._sorted_keys = []
+        self._new_keys = []
         super().clear()
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple, Iterable, List
+
+# Marks a key which has been looked up but does not exist in db
+_NOT_FOUND = object()
+
+
+class LRUCache(object):
+    """Size-bounded LRU cache for committed key-value pairs in StateDB
+
+    A key which does not exist in db is cached as well (negative lookup).
+    It is shared by the invoke thread and the query thread.
+    """
+
+    def __init__(self, capacity: int):
+        """Constructor
+
+        :param capacity: the maximum number of keys to keep
+        """
+        assert capacity > 0
+
+        self._capacity = capacity
+        self._lock = Lock()
+        self._items = OrderedDict()
+        # Increased whenever db is changed
+        # to prevent a stale value read from db being cached after the change
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._items
+
+    def get(self, key: bytes, generation: Optional[int] = None) -> Tuple[bool, Optional[bytes]]:
+        """Returns a cached value for a given key
+
+        :param key:
+        :param generation: if given, cached values are used only in this generation
+        :return: (hit, value)
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self.misses += 1
+                return False, None
+
+            value = self._items.get(key, _NOT_FOUND)
+            if value is _NOT_FOUND:
+                self.misses += 1
+                return False, None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def get_many(self, keys: List[bytes], generation: Optional[int] = None) -> Dict[bytes, Optional[bytes]]:
+        """Returns cached values for given keys
+
+        :param keys:
+        :param generation: if given, cached values are used only in this generation
+        :return: key -> value for the cached keys only
+        """
+        values = {}
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self.misses += len(keys)
+                return values
+
+            items = self._items
+            for key in keys:
+                value = items.get(key, _NOT_FOUND)
+                if value is _NOT_FOUND:
+                    self.misses += 1
+                else:
+                    items.move_to_end(key)
+                    self.hits += 1
+                    values[key] = value
+
+        return values
+
+    def put_if_unchanged(self, key: bytes, value: Optional[bytes], generation: int):
+        """Cache a value read from db
+        only if db has not been changed since the read started
+
+        :param key:
+        :param value: None means that the key does not exist in db
+        :param generation: cache generation taken before reading db
+        """
+        with self._lock:
+            if generation == self._generation:
+                self._put(key, value)
+
+    def put_many_if_unchanged(self, it: Iterable[Tuple[bytes, Optional[bytes]]], generation: int):
+        """Cache values read from db
+        only if db has not been changed since the read started
+
+        :param it: iterable which return tuple(key, value)
+        :param generation: cache generation taken before reading db
+        """
+        with self._lock:
+            if generation == self._generation:
+                for key, value in it:
+                    self._put(key, value)
+
+    def update(self, it: Iterable[Tuple[bytes, Optional[bytes]]]):
+        """Refresh the cached values with key-value pairs which have been written to db
+
+        :param it: iterable which return tuple(key, value) where value is None for a deleted key
+        """
+        with self._lock:
+            self._generation += 1
+
+            for key, value in it:
+                self._put(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._items.clear()
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def _put(self, key: bytes, value: Optional[bytes]):
+        items = self._items
+        items[key] = value
+        items.move_to_end(key)
+
+        if len(items) > self._capacity:
+            items.popitem(last=False)
+
+    def __str__(self):
+        return f"LRUCache(capacity={self._capacity}, size={len(self._items)}, " \
+               f"hits={self.hits}, misses={self.misses})"
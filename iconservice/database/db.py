@@ -13,12 +13,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TYPE_CHECKING, Optional, Tuple, Iterable
+from threading import Lock
+from typing import TYPE_CHECKING, Optional, Tuple, Iterable, List, Dict
 
 import plyvel
 from iconcommons.logger import Logger
 
-from .batch import TransactionBatchValue
+from .batch import BlockBatch, TransactionBatchValue
+from .cache import LRUCache
 from ..base.exception import DatabaseException, InvalidParamsException, AccessDeniedException
 from ..icon_constant import ICON_DB_LOG_TAG
 from ..iconscore.icon_score_context import ContextGetter, IconScoreContextType
@@ -40,33 +42,180 @@ def _is_db_writable_on_context(context: 'IconScoreContext'):
         return not context.readonly
 
 
+class DatabaseSnapshot(object):
+    """LevelDB snapshot which is shared by the queries on the same committed state
+
+    It is released by reference counting
+    """
+
+    def __init__(self, snapshot: 'plyvel.Snapshot', generation: Optional[int]):
+        """Constructor
+
+        :param snapshot: plyvel snapshot
+        :param generation: cache generation which the snapshot is consistent with
+            None if the cache cannot be used with the snapshot
+        """
+        self.snapshot = snapshot
+        self.generation = generation
+        self.refcount = 0
+
+
 class KeyValueDatabase(object):
     @staticmethod
     def from_path(path: str,
-                  create_if_missing: bool = True) -> 'KeyValueDatabase':
+                  create_if_missing: bool = True,
+                  cache_size: int = 0) -> 'KeyValueDatabase':
         """
 
         :param path: db path
         :param create_if_missing:
+        :param cache_size: the maximum number of keys to cache (0: no cache)
         :return: KeyValueDatabase instance
         """
         db = plyvel.DB(path, create_if_missing=create_if_missing)
-        return KeyValueDatabase(db)
+        cache = LRUCache(cache_size) if cache_size > 0 else None
+        return KeyValueDatabase(db, cache)
 
-    def __init__(self, db: plyvel.DB) -> None:
+    def __init__(self, db: plyvel.DB, cache: Optional['LRUCache'] = None) -> None:
         """Constructor
 
         :param db: plyvel db instance
+        :param cache: read-through cache for committed states
         """
         self._db = db
+        self._cache = cache
 
-    def get(self, key: bytes) -> bytes:
+        # Snapshot of the last committed state shared by queries
+        self._snapshot: Optional['DatabaseSnapshot'] = None
+        self._snapshot_lock = Lock()
+        # The number of writes in progress
+        self._writers = 0
+
+    @property
+    def cache(self) -> Optional['LRUCache']:
+        return self._cache
+
+    def get(self, key: bytes, snapshot: Optional['DatabaseSnapshot'] = None) -> bytes:
         """Get the value for the specified key.
 
         :param key: (bytes): key to retrieve
+        :param snapshot: snapshot to read from instead of the latest state
         :return: value for the specified key, or None if not found
         """
-        return self._db.get(key)
+        db = self._db if snapshot is None else snapshot.snapshot
+        cache = self._cache
+        if cache is None or (snapshot is not None and snapshot.generation is None):
+            return db.get(key)
+
+        if snapshot is None:
+            hit, value = cache.get(key)
+            generation: int = cache.generation
+        else:
+            hit, value = cache.get(key, snapshot.generation)
+            generation: int = snapshot.generation
+
+        if hit:
+            return value
+
+        value = db.get(key)
+        cache.put_if_unchanged(key, value, generation)
+
+        return value
+
+    def get_many(self, keys: List[bytes], snapshot: Optional['DatabaseSnapshot'] = None) -> List[Optional[bytes]]:
+        """Get the values for the specified keys at once
+
+        Keys which are not cached are read from a snapshot of db in sorted order
+
+        :param keys: keys to retrieve
+        :param snapshot: snapshot to read from instead of the latest state
+        :return: values in the same order as keys (None if not found)
+        """
+        cache = self._cache
+        if snapshot is not None and snapshot.generation is None:
+            cache = None
+
+        if cache is None:
+            values: Dict[bytes, Optional[bytes]] = {}
+            generation: int = 0
+        elif snapshot is None:
+            values: Dict[bytes, Optional[bytes]] = cache.get_many(keys)
+            generation: int = cache.generation
+        else:
+            values: Dict[bytes, Optional[bytes]] = cache.get_many(keys, snapshot.generation)
+            generation: int = snapshot.generation
+
+        missing_keys: List[bytes] = sorted(set(key for key in keys if key not in values))
+        if snapshot is not None:
+            for key in missing_keys:
+                values[key] = snapshot.snapshot.get(key)
+        elif len(missing_keys) == 1:
+            key: bytes = missing_keys[0]
+            values[key] = self._db.get(key)
+        elif missing_keys:
+            with self._db.snapshot() as db_snapshot:
+                for key in missing_keys:
+                    values[key] = db_snapshot.get(key)
+
+        if cache is not None and missing_keys:
+            cache.put_many_if_unchanged(((key, values[key]) for key in missing_keys), generation)
+
+        return [values[key] for key in keys]
+
+    def acquire_snapshot(self) -> 'DatabaseSnapshot':
+        """Returns the snapshot of the last committed state
+
+        The same snapshot is shared until db is changed.
+        It should be returned with release_snapshot() after use
+
+        :return: snapshot
+        """
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+
+            if snapshot is None:
+                if self._writers > 0:
+                    # The cache may not be consistent with db while it is being written
+                    snapshot = DatabaseSnapshot(self._db.snapshot(), None)
+                else:
+                    generation: int = 0 if self._cache is None else self._cache.generation
+                    snapshot = DatabaseSnapshot(self._db.snapshot(), generation)
+                    # Held by this db until db is changed
+                    snapshot.refcount += 1
+                    self._snapshot = snapshot
+
+            snapshot.refcount += 1
+            return snapshot
+
+    def release_snapshot(self, snapshot: 'DatabaseSnapshot') -> None:
+        """Release a snapshot acquired with acquire_snapshot()
+
+        :param snapshot:
+        """
+        with self._snapshot_lock:
+            self._release_snapshot(snapshot)
+
+    @staticmethod
+    def _release_snapshot(snapshot: 'DatabaseSnapshot'):
+        snapshot.refcount -= 1
+        if snapshot.refcount == 0:
+            snapshot.snapshot.close()
+
+    def _begin_write(self):
+        with self._snapshot_lock:
+            self._writers += 1
+
+    def _end_write(self):
+        """Unpin the snapshot of the state before the write
+        so that the next query reads the new state
+        """
+        with self._snapshot_lock:
+            self._writers -= 1
+
+            snapshot = self._snapshot
+            if snapshot is not None:
+                self._snapshot = None
+                self._release_snapshot(snapshot)
 
     def put(self, key: bytes, value: bytes) -> None:
         """Set a value for the specified key.
@@ -74,18 +223,49 @@ class KeyValueDatabase(object):
         :param key: (bytes): key to set
         :param value: (bytes): data to be stored
         """
-        self._db.put(key, value)
+        self._begin_write()
+
+        try:
+            self._db.put(key, value)
+
+            if self._cache is not None:
+                self._cache.update(((key, value),))
+        finally:
+            self._end_write()
 
     def delete(self, key: bytes) -> None:
         """Delete the key/value pair for the specified key.
 
         :param key: key to delete
         """
-        self._db.delete(key)
+        self._begin_write()
+
+        try:
+            self._db.delete(key)
+
+            if self._cache is not None:
+                self._cache.update(((key, None),))
+        finally:
+            self._end_write()
+
+    def clear_cache(self) -> None:
+        """Drop all cached values
+
+        Call it when db has been changed without this instance, e.g. rollback
+        """
+        self._begin_write()
+
+        try:
+            if self._cache is not None:
+                self._cache.clear()
+        finally:
+            self._end_write()
 
     def close(self) -> None:
         """Close the database.
         """
+        self.clear_cache()
+
         if self._db:
             self._db.close()
             self._db = None
@@ -97,8 +277,26 @@ class KeyValueDatabase(object):
         """
         return KeyValueDatabase(self._db.prefixed_db(prefix))
 
-    def iterator(self) -> iter:
-        return self._db.iterator()
+    def iterator(self,
+                 prefix: bytes = b'',
+                 snapshot: Optional['DatabaseSnapshot'] = None,
+                 start: Optional[bytes] = None,
+                 stop: Optional[bytes] = None) -> iter:
+        """Returns an iterator over the key-value pairs in the order of keys
+
+        :param prefix: only the keys which start with prefix are returned (b'': all keys)
+        :param snapshot: snapshot to read from instead of the latest state
+        :param start: the first key to return, which is ignored with prefix (None: from the first key)
+        :param stop: the key to stop before, which is ignored with prefix (None: to the last key)
+        :return: plyvel iterator which returns (key, value)
+        """
+        db = self._db if snapshot is None else snapshot.snapshot
+        if prefix:
+            return db.iterator(prefix=prefix)
+        if start is not None or stop is not None:
+            return db.iterator(start=start, stop=stop)
+
+        return db.iterator()
 
     def write_batch(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
         """Write a batch to the database for the specified states dict.
@@ -113,14 +311,29 @@ class KeyValueDatabase(object):
         if it is None:
             return size
 
-        with self._db.write_batch() as wb:
-            for key, value in it:
-                if value:
-                    wb.put(key, value)
-                else:
-                    wb.delete(key)
+        # Written key-value pairs to refresh the cache with after writing db
+        items: Optional[list] = None if self._cache is None else []
 
-                size += 1
+        self._begin_write()
+
+        try:
+            with self._db.write_batch() as wb:
+                for key, value in it:
+                    if value:
+                        wb.put(key, value)
+                    else:
+                        wb.delete(key)
+                        value = None
+
+                    if items is not None:
+                        items.append((key, value))
+
+                    size += 1
+
+            if items:
+                self._cache.update(items)
+        finally:
+            self._end_write()
 
         return size
 
@@ -205,7 +418,7 @@ class ContextDatabase(object):
         context_type = context.type
 
         if context_type in (IconScoreContextType.DIRECT, IconScoreContextType.QUERY):
-            return self.key_value_db.get(key)
+            return self.key_value_db.get(key, self._get_snapshot(context))
         else:
             return self.get_from_batch(context, key)
 
@@ -217,7 +430,8 @@ class ContextDatabase(object):
         Search order
         1. TransactionBatch
         2. BlockBatch
-        3. StateDB
+        3. BlockBatches of uncommitted parent blocks
+        4. StateDB
 
         :param context:
         :param key:
@@ -231,12 +445,192 @@ class ContextDatabase(object):
         if key in tx_batch:
             return tx_batch[key].value
 
+        read_set = context.read_set
+        if read_set is not None:
+            read_set.add(key)
+
         # get value from block_batch
         if key in block_batch:
             return block_batch[key].value
 
+        # get value from block_batches of uncommitted parent blocks
+        parent = block_batch.parent if isinstance(block_batch, BlockBatch) else None
+        while parent is not None:
+            if key in parent:
+                return parent[key].value
+            parent = parent.parent
+
         # get value from state_db
-        return self.key_value_db.get(key)
+        return self.key_value_db.get(key, self._get_snapshot(context))
+
+    def get_many(self, context: Optional['IconScoreContext'], keys: List[bytes]) -> List[Optional[bytes]]:
+        """Returns values indicated by keys from batch or StateDB at once
+
+        Values found in tx_batch and block_batches are resolved in memory
+        and the others are read from StateDB in a single call
+
+        :param context:
+        :param keys:
+        :return: values in the same order as keys
+        """
+        if context.type in (IconScoreContextType.DIRECT, IconScoreContextType.QUERY):
+            return self.key_value_db.get_many(keys, self._get_snapshot(context))
+
+        tx_batch = context.tx_batch
+        block_batch = context.block_batch
+        read_set = context.read_set
+
+        values: List[Optional[bytes]] = []
+        # index of values -> key to read from StateDB
+        missing = {}
+
+        for i, key in enumerate(keys):
+            if key in tx_batch:
+                values.append(tx_batch[key].value)
+                continue
+
+            if read_set is not None:
+                read_set.add(key)
+
+            batch = block_batch
+            while batch is not None:
+                if key in batch:
+                    values.append(batch[key].value)
+                    break
+                batch = batch.parent if isinstance(batch, BlockBatch) else None
+            else:
+                values.append(None)
+                missing[i] = key
+
+        if missing:
+            snapshot: Optional['DatabaseSnapshot'] = self._get_snapshot(context)
+            for i, value in zip(missing, self.key_value_db.get_many(list(missing.values()), snapshot)):
+                values[i] = value
+
+        return values
+
+    def get_items(self, context: Optional['IconScoreContext'], keys: List[bytes]) -> Dict[bytes, Optional[bytes]]:
+        """Returns the values of given keys at once
+
+        Pending changes in BlockBatches of the current and uncommitted parent blocks are applied,
+        but those in TransactionBatch are not, because they can be changed while the items are in use.
+        Read each value with get_from_items() to see the changes in TransactionBatch
+
+        :param context:
+        :param keys:
+        :return: key -> value (None for a key not found or deleted in a pending block)
+        """
+        items: Dict[bytes, Optional[bytes]] = {}
+
+        context_type = context.type
+        if context_type == IconScoreContextType.DIRECT:
+            # Changes are written to StateDB directly, so get_from_items() reads values one by one
+            return items
+
+        missing: List[bytes] = []
+        if context_type == IconScoreContextType.QUERY:
+            missing = keys
+        else:
+            for key in keys:
+                batch = context.block_batch
+                while batch is not None:
+                    if key in batch:
+                        items[key] = batch[key].value
+                        break
+                    batch = batch.parent if isinstance(batch, BlockBatch) else None
+                else:
+                    missing.append(key)
+
+        if missing:
+            items.update(zip(missing, self.key_value_db.get_many(missing, self._get_snapshot(context))))
+
+        return items
+
+    def get_from_items(self,
+                       context: Optional['IconScoreContext'],
+                       key: bytes,
+                       items: Dict[bytes, Optional[bytes]]) -> Optional[bytes]:
+        """Same as get() except that the value under TransactionBatch is read from items
+        which get_items() has returned
+
+        :param context:
+        :param key: one of the keys passed to get_items()
+        :param items: the result of get_items()
+        :return: value
+        """
+        context_type = context.type
+        if context_type == IconScoreContextType.DIRECT:
+            return self.key_value_db.get(key, self._get_snapshot(context))
+
+        if context_type != IconScoreContextType.QUERY:
+            tx_batch = context.tx_batch
+            if key in tx_batch:
+                return tx_batch[key].value
+
+            read_set = context.read_set
+            if read_set is not None:
+                read_set.add(key)
+
+        return items.get(key)
+
+    def iterator(self, context: Optional['IconScoreContext'], prefix: bytes) -> List[Tuple[bytes, bytes]]:
+        """Returns the key-value pairs whose keys start with a given prefix
+        including the changes in TransactionBatch
+
+        :param context:
+        :param prefix:
+        :return: (key, value) list sorted by key
+        """
+        with self.key_value_db.iterator(prefix, self._get_snapshot(context)) as it:
+            if context.type == IconScoreContextType.DIRECT:
+                return list(it)
+
+            items: Dict[bytes, Optional[bytes]] = dict(it)
+
+        if context.type != IconScoreContextType.QUERY:
+            # Apply the changes from the oldest uncommitted block
+            batches = []
+            batch = context.block_batch
+            while batch is not None:
+                batches.append(batch)
+                batch = batch.parent if isinstance(batch, BlockBatch) else None
+
+            for batch in reversed(batches):
+                keys = batch.keys_with_prefix(prefix) if isinstance(batch, BlockBatch) \
+                    else [key for key in batch if key.startswith(prefix)]
+                for key in keys:
+                    items[key] = batch[key].value
+
+            tx_batch = context.tx_batch
+            for key in tx_batch:
+                if key.startswith(prefix):
+                    items[key] = tx_batch[key].value
+
+            read_set = context.read_set
+            if read_set is not None:
+                read_set.update(key for key in items if key not in tx_batch)
+
+        return sorted((key, value) for key, value in items.items() if value is not None)
+
+    def _get_snapshot(self, context: 'IconScoreContext') -> Optional['DatabaseSnapshot']:
+        """Returns the snapshot which all reads on a given context go through
+
+        The snapshot is acquired on the first read and released by IconScoreContext.release_snapshots()
+
+        :param context:
+        :return: None if the context reads the latest state
+        """
+        snapshots: Optional[Dict['KeyValueDatabase', 'DatabaseSnapshot']] = context.snapshots
+        if not isinstance(snapshots, dict):
+            return None
+
+        key_value_db = self.key_value_db
+        snapshot: Optional['DatabaseSnapshot'] = snapshots.get(key_value_db)
+        if snapshot is None:
+            snapshot = key_value_db.acquire_snapshot()
+            snapshots[key_value_db] = snapshot
+
+        return snapshot
 
     @staticmethod
     def _check_tx_batch_value(context: Optional['IconScoreContext'],
@@ -385,6 +779,8 @@ class IconScoreDatabase(ContextGetter):
         self._observer: Optional[DatabaseObserver] = None
 
         self._prefix_hash_key: bytes = self._make_prefix_hash_key()
+        # Every key in StateDB is this prefix followed by a key passed by SCORE
+        self._key_prefix: bytes = self._prefix_hash_key + b'|'
 
     def _make_prefix_hash_key(self) -> bytes:
         data = [self.address.to_bytes()]
@@ -399,12 +795,67 @@ class IconScoreDatabase(ContextGetter):
         :param key: key to retrieve
         :return: value for the specified key, or None if not found
         """
-        hashed_key = self._hash_key(key)
-        value = self._context_db.get(self._context, hashed_key)
+        return self._get(self._key_prefix + key)
+
+    def _get(self, hashed_key: bytes) -> bytes:
+        context = self._context
+        value = self._context_db.get(context, hashed_key)
         if self._observer:
-            self._observer.on_get(self._context, key, value)
+            self._observer.on_get(context, hashed_key[len(self._key_prefix):], value)
         return value
 
+    def get_items(self, keys: List[bytes]) -> Dict[bytes, Optional[bytes]]:
+        """
+        Reads the values of given keys at once without charging steps
+
+        Each value should be read from the result with get_from_items()
+
+        :param keys: keys to read
+        :return: items to pass to get_from_items()
+        """
+        key_prefix: bytes = self._key_prefix
+        return self._context_db.get_items(self._context, [key_prefix + key for key in keys])
+
+    def get_from_items(self, key: bytes, items: Dict[bytes, Optional[bytes]]) -> bytes:
+        """
+        Gets the value for the specified key from the result of get_items()
+        Charges the same step as get()
+
+        :param key: key to retrieve
+        :param items: the result of get_items()
+        :return: value for the specified key, or None if not found
+        """
+        return self._get_from_items(self._key_prefix + key, items)
+
+    def _get_from_items(self, hashed_key: bytes, items: Dict[bytes, Optional[bytes]]) -> bytes:
+        context = self._context
+        value = self._context_db.get_from_items(context, hashed_key, items)
+        if self._observer:
+            self._observer.on_get(context, hashed_key[len(self._key_prefix):], value)
+        return value
+
+    def iterator(self, prefix: bytes = b''):
+        """
+        Returns a generator of the key-value pairs whose keys start with prefix in the order of keys
+        Charges the same step as get() on every pair returned
+
+        :param prefix: prefix of keys (b'': all keys in this db)
+        :return: generator which returns (key, value)
+        """
+        start: int = len(self._key_prefix)
+        for hashed_key, value in self._iterator(self._key_prefix + prefix):
+            yield hashed_key[start:], value
+
+    def _iterator(self, hashed_prefix: bytes):
+        context = self._context
+        items: List[Tuple[bytes, bytes]] = self._context_db.iterator(context, hashed_prefix)
+
+        start: int = len(self._key_prefix)
+        for hashed_key, value in items:
+            if self._observer:
+                self._observer.on_get(context, hashed_key[start:], value)
+            yield hashed_key, value
+
     def put(self, key: bytes, value: bytes):
         """
         Sets a value for the specified key.
@@ -412,16 +863,20 @@ class IconScoreDatabase(ContextGetter):
         :param key: key to set
         :param value: value to set
         """
-        self._validate_ownership()
-        hashed_key = self._hash_key(key)
+        self._put(self._key_prefix + key, value)
+
+    def _put(self, hashed_key: bytes, value: bytes):
+        context = self._context
+        self._validate_ownership(context)
         if self._observer:
-            old_value = self._context_db.get(self._context, hashed_key)
+            key = hashed_key[len(self._key_prefix):]
+            old_value = self._context_db.get(context, hashed_key)
             if value:
-                self._observer.on_put(self._context, key, old_value, value)
+                self._observer.on_put(context, key, old_value, value)
             elif old_value:
                 # If new value is None, then deletes the field
-                self._observer.on_delete(self._context, key, old_value)
-        self._context_db.put(self._context, hashed_key, value)
+                self._observer.on_delete(context, key, old_value)
+        self._context_db.put(context, hashed_key, value)
 
     def get_sub_db(self, prefix: bytes) -> 'IconScoreSubDatabase':
         """
@@ -446,14 +901,17 @@ class IconScoreDatabase(ContextGetter):
 
         :param key: key to delete
         """
-        self._validate_ownership()
-        hashed_key = self._hash_key(key)
+        self._delete(self._key_prefix + key)
+
+    def _delete(self, hashed_key: bytes):
+        context = self._context
+        self._validate_ownership(context)
         if self._observer:
-            old_value = self._context_db.get(self._context, hashed_key)
+            old_value = self._context_db.get(context, hashed_key)
             # If old value is None, won't fire the callback
             if old_value:
-                self._observer.on_delete(self._context, key, old_value)
-        self._context_db.delete(self._context, hashed_key)
+                self._observer.on_delete(context, hashed_key[len(self._key_prefix):], old_value)
+        self._context_db.delete(context, hashed_key)
 
     def close(self):
         self._context_db.close(self._context)
@@ -469,13 +927,16 @@ class IconScoreDatabase(ContextGetter):
         :return: key bytes
         """
 
-        return b'|'.join((self._prefix_hash_key, key))
+        return self._key_prefix + key
 
-    def _validate_ownership(self):
+    def _validate_ownership(self, context: Optional['IconScoreContext'] = None):
         """Prevent a SCORE from accessing the database of another SCORE
 
         """
-        if self._context.current_address != self.address:
+        if context is None:
+            context = self._context
+
+        if context.current_address != self.address:
             raise AccessDeniedException("Invalid database ownership")
 
 
@@ -494,13 +955,10 @@ class IconScoreSubDatabase(object):
         self._prefix = prefix
         self._score_db = score_db
 
-        self._prefix_hash_key: bytes = self._make_prefix_hash_key()
-
-    def _make_prefix_hash_key(self) -> bytes:
-        data = []
-        if self._prefix is not None:
-            data.append(self._prefix)
-        return b'|'.join(data)
+        self._prefix_hash_key: bytes = prefix
+        # Prefix of the keys in StateDB resolved from the chain of prefixes at once,
+        # so a key is built with a single concatenation on every access
+        self._key_prefix: bytes = score_db._key_prefix + prefix + b'|'
 
     def get(self, key: bytes) -> bytes:
         """
@@ -509,8 +967,37 @@ class IconScoreSubDatabase(object):
         :param key: key to retrieve
         :return: value for the specified key, or None if not found
         """
-        hashed_key = self._hash_key(key)
-        return self._score_db.get(hashed_key)
+        return self._score_db._get(self._key_prefix + key)
+
+    def get_items(self, keys: List[bytes]) -> Dict[bytes, Optional[bytes]]:
+        """
+        Reads the values of given keys at once without charging steps
+
+        :param keys: keys to read
+        :return: items to pass to get_from_items()
+        """
+        return self._score_db.get_items([self._hash_key(key) for key in keys])
+
+    def get_from_items(self, key: bytes, items: Dict[bytes, Optional[bytes]]) -> bytes:
+        """
+        Gets the value for the specified key from the result of get_items()
+
+        :param key: key to retrieve
+        :param items: the result of get_items()
+        :return: value for the specified key, or None if not found
+        """
+        return self._score_db._get_from_items(self._key_prefix + key, items)
+
+    def iterator(self, prefix: bytes = b''):
+        """
+        Returns a generator of the key-value pairs whose keys start with prefix in the order of keys
+
+        :param prefix: prefix of keys (b'': all keys in this db)
+        :return: generator which returns (key, value)
+        """
+        start: int = len(self._key_prefix)
+        for hashed_key, value in self._score_db._iterator(self._key_prefix + prefix):
+            yield hashed_key[start:], value
 
     def put(self, key: bytes, value: bytes):
         """
@@ -519,8 +1006,7 @@ class IconScoreSubDatabase(object):
         :param key: key to set
         :param value: value to set
         """
-        hashed_key = self._hash_key(key)
-        self._score_db.put(hashed_key, value)
+        self._score_db._put(self._key_prefix + key, value)
 
     def get_sub_db(self, prefix: bytes) -> 'IconScoreSubDatabase':
         """
@@ -532,10 +1018,7 @@ class IconScoreSubDatabase(object):
         if prefix is None:
             raise InvalidParamsException("Invalid prefix")
 
-        if self._prefix is not None:
-            prefix = b'|'.join((self._prefix, prefix))
-
-        return IconScoreSubDatabase(self.address, self._score_db, prefix)
+        return IconScoreSubDatabase(self.address, self._score_db, self._prefix + b'|' + prefix)
 
     def delete(self, key: bytes):
         """
@@ -543,8 +1026,7 @@ class IconScoreSubDatabase(object):
 
         :param key: key to delete
         """
-        hashed_key = self._hash_key(key)
-        self._score_db.delete(hashed_key)
+        self._score_db._delete(self._key_prefix + key)
 
     def close(self):
         self._score_db.close()
@@ -554,7 +1036,7 @@ class IconScoreSubDatabase(object):
         to StateDB to avoid key conflicts among SCOREs
 
         :params key: key passed by SCORE
-        :return: key bytes
+        :return: key bytes relative to IconScoreDatabase
         """
 
-        return b'|'.join((self._prefix_hash_key, key))
+        return self._prefix + b'|' + key
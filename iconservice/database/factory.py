@@ -32,19 +32,21 @@ class ContextDatabaseFactory(object):
     _state_db_root_path: str = None
     _mode: 'Mode' = Mode.SINGLE_DB
     _shared_context_db: 'ContextDatabase' = None
+    _cache_size: int = 0
 
     @classmethod
-    def open(cls, state_db_root_path: str, mode: 'Mode'):
+    def open(cls, state_db_root_path: str, mode: 'Mode', cache_size: int = 0):
         cls.close()
 
         cls._state_db_root_path = state_db_root_path
         cls._mode = mode
+        cls._cache_size = cache_size
 
     @classmethod
     def get_shared_db(cls) -> ContextDatabase:
         if cls._shared_context_db is None:
             path = os.path.join(cls._state_db_root_path, ICON_DEX_DB_NAME)
-            key_value_db = KeyValueDatabase.from_path(path)
+            key_value_db = KeyValueDatabase.from_path(path, cache_size=cls._cache_size)
             cls._shared_context_db = ContextDatabase(
                 key_value_db, is_shared=True)
 
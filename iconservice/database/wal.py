@@ -12,7 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from enum import Flag, auto
+from enum import Flag, IntEnum, auto
 
 from ..icon_constant import DATA_BYTE_ORDER
 from ..iiss.reward_calc.msg_data import TxData
@@ -23,7 +23,9 @@ __all__ = (
     "WriteAheadLogWriter", "WriteAheadLogReader", "WALogable", "StateWAL", "IissWAL", "WALState", "WALDBType"
 )
 
+import mmap
 import struct
+import zlib
 from abc import ABCMeta
 from typing import Optional, Tuple, Iterable, List
 import os
@@ -41,18 +43,31 @@ from ..database.batch import BlockBatch, TransactionBatchValue
 
 TAG = "WAL"
 _MAGIC_KEY = b"IWAL"
-_FILE_VERSION = 1
-_HEADER_SIZE = 52
-_HEADER_STRUCT_FORMAT = ">4sIII32sI"
+_FILE_VERSION = 2
+_HEADER_SIZE = 44
+_HEADER_STRUCT_FORMAT = ">4sII32s"
 
 # FILE OFFSET
 _OFFSET_MAGIC_KEY = 0
 _OFFSET_VERSION = _OFFSET_MAGIC_KEY + 4
-_OFFSET_REVISION = _OFFSET_VERSION + 4
-_OFFSET_STATE = _OFFSET_REVISION + 4
-_OFFSET_INSTANT_BLOCK_HASH = _OFFSET_STATE + 4
-_OFFSET_LOG_COUNT = _OFFSET_INSTANT_BLOCK_HASH + 32
-_OFFSET_LOG_START_OFFSETS = _OFFSET_LOG_COUNT + 4
+
+# A record is followed by crc32 of its header and data
+_RECORD_HEADER_SIZE = 5
+_RECORD_HEADER_STRUCT_FORMAT = ">BI"
+_CRC_SIZE = 4
+
+_READ_CHUNK_SIZE = 1024 * 1024
+
+# Version 1 which rewrites the header in place
+_V1_FILE_VERSION = 1
+_V1_HEADER_SIZE = 52
+_V1_HEADER_STRUCT_FORMAT = ">4sIII32sI"
+
+
+class _RecordType(IntEnum):
+    BLOCK = 0
+    LOG = 1
+    STATE = 2
 
 
 class WALDBType(Enum):
@@ -159,10 +174,14 @@ def _bytes_to_uint32(data: bytes):
 class WriteAheadLogWriter(object):
     """Write write-ahead-logging for block, state_db and rc_db on commit
 
-    | magic_key(4) | version(4) | revision(4) | state(4) | instant_block_hash(32) |
-    | data count(4) | log start address_0 (4) | log start address_1 (4) | ...
-    | block data size(4) | block data | size(4) | data | size(4) | data | ...
+    | magic_key(4) | version(4) | revision(4) | instant_block_hash(32) |
+    | record | record | ...
+
+    record: | type(1) | data size(4) | data | crc32(4) |
 
+    The first record is a block and is followed by logs and states.
+    Records are only appended to the file and a state record overrides the previous one.
+    A record which is not completely written on a crash is found by its crc32 and ignored.
     Every number is written in big endian format
     """
 
@@ -182,6 +201,8 @@ class WriteAheadLogWriter(object):
         self._instant_block_hash = instant_block_hash
         self._block = block
         self._fp = None
+        # Keeps its buffer to pack all logs without reallocation
+        self._packer = msgpack.Packer(autoreset=False)
 
         Logger.debug(tag=TAG, msg="__init__() end")
 
@@ -198,23 +219,16 @@ class WriteAheadLogWriter(object):
             raise
 
     def _write_header(self) -> int:
-        values = [
-            self._magic_key,
-            self._version,
-            self._revision,
-            self._state,
-            self._instant_block_hash,
-            self._log_count
-        ]
-
-        for _ in range(self._max_log_count):
-            values.append(0)
-
-        struct_format = _HEADER_STRUCT_FORMAT + "I" * self._max_log_count
-        data: bytes = struct.pack(struct_format, *values)
+        data: bytes = struct.pack(_HEADER_STRUCT_FORMAT,
+                                  self._magic_key,
+                                  self._version,
+                                  self._revision,
+                                  self._instant_block_hash)
         return self._fp.write(data)
 
     def flush(self):
+        """Make all records written so far durable
+        """
         fp = self._fp
 
         if fp:
@@ -227,68 +241,49 @@ class WriteAheadLogWriter(object):
             self._fp = None
 
     def _write_block(self) -> int:
-        block = self._block
-
-        data: bytes = block.to_bytes(self._revision)
-        self._write_uint32(len(data))
-        ret = self._fp.write(data) + 4
-
-        return ret
+        data: bytes = self._block.to_bytes(self._revision)
+        return self._write_record(_RecordType.BLOCK, data)
 
     def write_walogable(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
-        self._fp.seek(0, 2)
-        start_offset: int = self._fp.tell()
-
-        size = 0
-        self._write_uint32(size)
-
-        for key, value in it:
-            size += self._write_key_value(key, value)
-
-        # Return to the WALogable start offset, writing its data size
-        self._fp.seek(-size - 4, 1)
-        self._write_uint32(size)
-
-        self._write_log_start_offset(self._log_count, start_offset)
-        self._write_log_count()
-
-        return size
+        if self._log_count >= self._max_log_count:
+            raise InternalServiceErrorException(f"Too many logs: max_log_count={self._max_log_count}")
 
-    def _write_key_value(self, key: bytes, value: bytes) -> int:
-        assert isinstance(key, bytes)
-
-        data: bytes = msgpack.packb([key, value])
-        size = self._fp.write(data)
-        assert size == len(data)
+        packer = self._packer
+        try:
+            # Same as packb([key, value]) without making a list for each entry
+            for key, value in it:
+                assert isinstance(key, bytes)
+                packer.pack_array_header(2)
+                packer.pack(key)
+                packer.pack(value)
+
+            with packer.getbuffer() as data:
+                size: int = len(data)
+                self._write_record(_RecordType.LOG, data)
+        finally:
+            packer.reset()
 
+        self._log_count += 1
         return size
 
     def write_state(self, state: int, add: bool = False):
-        offset = _OFFSET_STATE
+        """Append a state record
 
+        The record is passed to OS to survive a crash of the process but not synced to disk.
+        Recovery with a WAL whose state record is lost only repeats the work done already.
+        """
         if add:
             state |= self._state
 
-        self._fp.seek(offset, 0)
-        self._write_uint32(state)
+        self._write_record(_RecordType.STATE, _uint32_to_bytes(state))
+        self._fp.flush()
         self._state = state
 
-    def _write_log_count(self) -> int:
-        offset = _OFFSET_LOG_COUNT
-        self._log_count += 1
-
-        self._fp.seek(offset, 0)
-        data: bytes = _uint32_to_bytes(self._log_count)
-        return self._fp.write(data)
-
-    def _write_log_start_offset(self, index: int, start_offset: int) -> int:
-        offset = _OFFSET_LOG_START_OFFSETS + index * 4
-        self._fp.seek(offset, 0)
+    def _write_record(self, record_type: '_RecordType', data: bytes) -> int:
+        header: bytes = struct.pack(_RECORD_HEADER_STRUCT_FORMAT, record_type, len(data))
+        crc: int = zlib.crc32(data, zlib.crc32(header))
 
-        return self._write_uint32(start_offset)
-
-    def _write_uint32(self, value: int) -> int:
-        return self._fp.write(_uint32_to_bytes(value))
+        return self._fp.write(header) + self._fp.write(data) + self._fp.write(_uint32_to_bytes(crc))
 
     def _check_file_pointer(self):
         if self._fp is None:
@@ -298,6 +293,9 @@ class WriteAheadLogWriter(object):
 class WriteAheadLogReader(object):
     """Read data from a write ahead log file
 
+    The file is mapped to memory and logs are unpacked from it without reading them into bytes.
+    Records after an incomplete one are ignored.
+    A file of version 1 is also readable for the backup files made before.
     """
 
     def __init__(self):
@@ -305,12 +303,15 @@ class WriteAheadLogReader(object):
         self._version: int = 0
         self._revision: int = 0
         self._state: int = 0
-        self._log_count: int = 0
-        self._log_start_offsets: Optional[List[int]] = None
+        # (offset, size) of each log
+        self._logs: List[Tuple[int, int]] = []
         self._instant_block_hash: bytes = b""
         self._block: Optional['Block'] = None
 
-        self._fp = None
+        # Read like a file
+        self._fp: Optional[mmap.mmap] = None
+        # A view of the whole file to access logs
+        self._view: Optional[memoryview] = None
 
     @property
     def magic_key(self) -> Optional[bytes]:
@@ -338,22 +339,50 @@ class WriteAheadLogReader(object):
 
     @property
     def log_count(self) -> int:
-        return self._log_count
+        return len(self._logs)
 
     def __str__(self):
         return f"version={self._version}, " \
                f"state={self._state}, " \
                f"instant_block_hash={bytes_to_hex(self._instant_block_hash)}, " \
-               f"log_count={self._log_count}, " \
+               f"log_count={self.log_count}, " \
                f"block={self._block}"
 
     def open(self, path: str):
-        self._fp = open(path, "rb")
-        self._read_header()
-        self._read_block()
+        self._state = 0
+        self._logs = []
+
+        with open(path, "rb") as f:
+            file_size: int = os.fstat(f.fileno()).st_size
+            if file_size < _OFFSET_VERSION + 4:
+                raise IllegalFormatException(f"Out of data: file_size({file_size})")
+
+            self._fp = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._fp)
+
+        data: bytes = self._fp.read(_OFFSET_VERSION + 4)
+        self._check_bytes_data(data, _OFFSET_VERSION + 4)
+        magic_key, version = struct.unpack(">4sI", data)
+
+        if magic_key != _MAGIC_KEY:
+            raise IllegalFormatException(f"Invalid magic key: {bytes_to_hex(data)}")
+
+        self._fp.seek(0)
+        if version == _FILE_VERSION:
+            self._read_header()
+            self._read_records()
+        elif version == _V1_FILE_VERSION:
+            self._read_v1_header()
+            self._read_v1_block()
+        else:
+            raise IllegalFormatException(
+                f"Invalid version: Actual({version}) != Expected({_FILE_VERSION})")
 
     def close(self):
-        if self._fp:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._fp is not None:
             self._fp.close()
             self._fp = None
 
@@ -361,29 +390,93 @@ class WriteAheadLogReader(object):
         data: bytes = self._fp.read(_HEADER_SIZE)
         self._check_bytes_data(data, _HEADER_SIZE)
 
-        magic_key, version, revision, state, instant_block_hash, log_count = \
-            struct.unpack_from(_HEADER_STRUCT_FORMAT, data)
+        self._magic_key, self._version, self._revision, self._instant_block_hash = \
+            struct.unpack(_HEADER_STRUCT_FORMAT, data)
 
-        if magic_key != _MAGIC_KEY:
-            raise IllegalFormatException(f"Invalid magic key: {bytes_to_hex(data)}")
+    def _read_records(self):
+        record_type, data = self._read_record()
+        if record_type != _RecordType.BLOCK:
+            raise IllegalFormatException(f"Block not found: {record_type}")
+        self._block = Block.from_bytes(data)
 
-        if version != _FILE_VERSION:
-            raise IllegalFormatException(
-                f"Invalid version: Actual({version}) != Expected({_FILE_VERSION})")
+        while True:
+            try:
+                record_type, data = self._read_record()
+            except IllegalFormatException as e:
+                # The last record might not be completely written on a crash
+                Logger.info(tag=TAG, msg=f"Incomplete record: {e}")
+                break
+
+            if record_type is None:
+                break
+            elif record_type == _RecordType.STATE:
+                self._state = _bytes_to_uint32(data)
+            elif record_type != _RecordType.LOG:
+                raise IllegalFormatException(f"Invalid record type: {record_type}")
+
+    def _read_record(self) -> Tuple[Optional[int], Optional[bytes]]:
+        """Returns the type and data of the next record
+
+        The data of a log is not kept in memory but its offset and size are
+
+        :return: (record type, data), (None, None) at the end of file
+        """
+        header: bytes = self._fp.read(_RECORD_HEADER_SIZE)
+        if len(header) == 0:
+            return None, None
+        self._check_bytes_data(header, _RECORD_HEADER_SIZE)
+
+        record_type, size = struct.unpack(_RECORD_HEADER_STRUCT_FORMAT, header)
+        offset: int = self._fp.tell()
+        crc: int = zlib.crc32(header)
+        data: Optional[bytes] = None
+
+        if record_type == _RecordType.LOG:
+            with self._view[offset:offset + size] as view:
+                self._check_bytes_data(view, size)
+                crc = zlib.crc32(view, crc)
+            self._fp.seek(size, os.SEEK_CUR)
+        else:
+            data = self._fp.read(size)
+            self._check_bytes_data(data, size)
+            crc = zlib.crc32(data, crc)
+
+        checksum: int = self._read_uint32()
+        if checksum != crc:
+            raise IllegalFormatException(f"Invalid checksum: offset={offset}")
+
+        if record_type == _RecordType.LOG:
+            self._logs.append((offset, size))
+
+        return record_type, data
+
+    def _read_v1_header(self):
+        data: bytes = self._fp.read(_V1_HEADER_SIZE)
+        self._check_bytes_data(data, _V1_HEADER_SIZE)
+
+        magic_key, version, revision, state, instant_block_hash, log_count = \
+            struct.unpack_from(_V1_HEADER_STRUCT_FORMAT, data)
 
         self._magic_key = magic_key
         self._version = version
         self._revision = revision
         self._state = state
-        self._log_count = log_count
         self._instant_block_hash = instant_block_hash
-        self._log_start_offsets = []
 
-        for _ in range(self._log_count):
-            offset = self._read_uint32()
-            self._log_start_offsets.append(offset)
+        log_start_offsets: List[int] = [self._read_uint32() for _ in range(log_count)]
+        header_end: int = self._fp.tell()
+
+        for offset in log_start_offsets:
+            if offset > self._fp.size():
+                raise IllegalFormatException(f"Invalid log offset: {offset}")
+
+            # A log starts with its size
+            self._fp.seek(offset, 0)
+            self._logs.append((offset + 4, self._read_uint32()))
 
-    def _read_block(self):
+        self._fp.seek(header_end, 0)
+
+    def _read_v1_block(self):
         size: int = self._read_uint32()
         data: bytes = self._fp.read(size)
         self._check_bytes_data(data, size)
@@ -398,29 +491,26 @@ class WriteAheadLogReader(object):
         return _bytes_to_uint32(data)
 
     def get_iterator(self, index: int) -> Iterable[Tuple[bytes, Optional[bytes]]]:
-        self._seek_to_log_start_offset(index)
-        size: int = self._read_uint32()
+        offset, size = self._logs[index]
+        end: int = offset + size
 
         unpacker = msgpack.Unpacker(use_list=False, raw=True)
 
-        while size > 0:
-            size_to_read = min(size, 16384)
-            data: bytes = self._fp.read(size_to_read)
-            self._check_bytes_data(data, size_to_read)
-
-            size -= size_to_read
+        while offset < end:
+            next_offset: int = min(offset + _READ_CHUNK_SIZE, end)
 
-            unpacker.feed(data)
-            for key, value in unpacker:
-                yield key, value
+            # No view is alive on yield not to prevent the file from being closed
+            with self._view[offset:next_offset] as view:
+                self._check_bytes_data(view, next_offset - offset)
+                unpacker.feed(view)
+            offset = next_offset
 
-    def _seek_to_log_start_offset(self, index: int):
-        offset = self._log_start_offsets[index]
-        self._fp.seek(offset, 0)
+            # Each log is unpacked as a tuple of (key, value)
+            yield from unpacker
 
     @classmethod
     def _check_bytes_data(cls, data: bytes, size: int):
-        if not isinstance(data, bytes):
+        if not isinstance(data, (bytes, memoryview)):
             raise IllegalFormatException("Data is not bytes")
 
         if len(data) != size:
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+from collections import namedtuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .base.address import Address
+from .base.exception import InvalidParamsException
+from .base.type_converter import TypeConverter
+from .database.db import KeyValueDatabase
+from .iconscore.icon_score_event_log import EventLog, EventLogEmitter
+from .utils.bloom import BLOOM_BYTES, get_bloom_value
+from .utils.msgpack_for_db import MsgPackForDB
+
+if TYPE_CHECKING:
+    from .iconscore.icon_score_constant import BaseType
+    from .iconscore.icon_score_result import TransactionResult
+
+# Key layout
+#   last block height: 0x00
+#   event log:         0x01 | height(8) | tx_index(4) | log_index(4)
+#   index:             0x02 | score_address(21) | hash(signature)(16) | index(1) | hash(indexed item)(16)
+#                           | height(8) | tx_index(4) | log_index(4)
+#   bloom:             0x03 | level(1) | start height(8)
+_LAST_BLOCK_HEIGHT_KEY = b'\x00'
+_LOG_PREFIX = b'\x01'
+_INDEX_PREFIX = b'\x02'
+_BLOOM_PREFIX = b'\x03'
+
+# The number of blocks which a bloom covers on each level
+# A bloom on a level is the union of the blooms on the lower level within its range
+BLOOM_SPANS = (1, 1 << 10, 1 << 20)
+
+_HASH_SIZE = 16
+_INDEX_VALUE = b'\x01'
+
+# Python types of the argument types in an event signature
+_ARGUMENT_TYPES = {
+    'int': int,
+    'str': str,
+    'bytes': bytes,
+    'bool': bool,
+    'Address': Address
+}
+
+IndexedEventLog = namedtuple('IndexedEventLog', ['block_height', 'tx_index', 'tx_hash', 'event_log'])
+
+
+def _pack_height(height: int) -> bytes:
+    return height.to_bytes(8, 'big')
+
+
+def _pack_position(height: int, tx_index: int, log_index: int) -> bytes:
+    return height.to_bytes(8, 'big') + tx_index.to_bytes(4, 'big') + log_index.to_bytes(4, 'big')
+
+
+def _hash(data: bytes) -> bytes:
+    return hashlib.sha3_256(data).digest()[:_HASH_SIZE]
+
+
+def _make_index_prefix(score_address: 'Address', signature_hash: bytes, index: int, item_hash: bytes) -> bytes:
+    return b''.join((_INDEX_PREFIX,
+                     score_address.to_bytes_including_prefix(),
+                     signature_hash,
+                     index.to_bytes(1, 'big'),
+                     item_hash))
+
+
+def convert_indexed(event_signature: str, values: List[Optional[str]]) -> List[Optional['BaseType']]:
+    """Converts the indexed arguments in a query to the types declared in an event signature
+
+    :param event_signature: e.g. "Transfer(Address,Address,int,bytes)"
+    :param values: the values of indexed arguments in JSON-RPC format except the signature (None: any value)
+    :return: [event_signature, indexed arguments...] to pass to EventIndex.find()
+    """
+    try:
+        types: List[str] = event_signature[event_signature.index('(') + 1:event_signature.rindex(')')].split(',')
+    except ValueError:
+        raise InvalidParamsException(f'Invalid event signature: {event_signature}')
+
+    if len(values) > len(types):
+        raise InvalidParamsException(f'Too many indexed arguments: {event_signature}')
+
+    annotations: dict = {}
+    params: dict = {}
+    for i, value in enumerate(values):
+        arg_type: Optional[type] = _ARGUMENT_TYPES.get(types[i])
+        if arg_type is None:
+            raise InvalidParamsException(f'Invalid event signature: {event_signature}')
+
+        annotations[i] = arg_type
+        params[i] = value
+
+    TypeConverter.convert_data_params(annotations, params)
+    return [event_signature] + [params[i] for i in range(len(values))]
+
+
+class EventIndex(object):
+    """Index of the event logs in committed blocks, which is kept in its own LevelDB
+
+    Event logs are found by a range scan over their score address, signature and an indexed argument.
+    Other queries skip the blocks whose blooms do not contain the queried items,
+    checking the blooms of block ranges first.
+    All data of a block are keyed by its height and removed on rollback.
+    """
+
+    def __init__(self, db: 'KeyValueDatabase'):
+        self._db = db
+
+    @staticmethod
+    def from_path(path: str) -> 'EventIndex':
+        return EventIndex(KeyValueDatabase.from_path(path))
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    @property
+    def last_block_height(self) -> int:
+        """The height of the last indexed block (-1: no block)
+        """
+        value: Optional[bytes] = self._db.get(_LAST_BLOCK_HEIGHT_KEY)
+        return -1 if value is None else int.from_bytes(value, 'big')
+
+    @staticmethod
+    def _make_index_keys(event_log: 'EventLog', position: bytes) -> List[bytes]:
+        get_ordered_bytes = EventLogEmitter.get_ordered_bytes
+        signature_hash: bytes = _hash(get_ordered_bytes(0, event_log.indexed[0]))
+
+        return [_make_index_prefix(event_log.score_address,
+                                   signature_hash,
+                                   i,
+                                   _hash(get_ordered_bytes(i, indexed_item))) + position
+                for i, indexed_item in enumerate(event_log.indexed)]
+
+    def commit(self, block_height: int, tx_results: List['TransactionResult'], logs_bloom: int):
+        """Index the event logs in a committed block
+
+        :param block_height:
+        :param tx_results: the results of all transactions in the block
+        :param logs_bloom: the union of logs_bloom of tx_results
+        """
+        items: Dict[bytes, Optional[bytes]] = {}
+
+        for tx_result in tx_results:
+            if not tx_result.event_logs:
+                continue
+
+            for log_index, event_log in enumerate(tx_result.event_logs):
+                position: bytes = _pack_position(block_height, tx_result.tx_index, log_index)
+                items[_LOG_PREFIX + position] = MsgPackForDB.dumps(
+                    [tx_result.tx_hash, event_log.score_address, event_log.indexed, event_log.data])
+
+                for key in self._make_index_keys(event_log, position):
+                    items[key] = _INDEX_VALUE
+
+        if logs_bloom:
+            for level, span in enumerate(BLOOM_SPANS):
+                key: bytes = self._make_bloom_key(level, block_height - block_height % span)
+                value: int = logs_bloom if level == 0 else logs_bloom | self._get_bloom(key)
+                items[key] = value.to_bytes(BLOOM_BYTES, 'big')
+
+        items[_LAST_BLOCK_HEIGHT_KEY] = _pack_height(block_height)
+        self._db.write_batch(items.items())
+
+    def rollback(self, block_height: int):
+        """Remove the event logs in the blocks above a given height
+
+        :param block_height: the height of the last block after rollback
+        """
+        if self.last_block_height <= block_height:
+            return
+
+        items: Dict[bytes, Optional[bytes]] = {}
+        next_height: int = block_height + 1
+
+        for key, value in self._db.iterator(start=_LOG_PREFIX + _pack_height(next_height), stop=_INDEX_PREFIX):
+            items[key] = None
+
+            _, score_address, indexed, data = MsgPackForDB.loads(value)
+            for index_key in self._make_index_keys(EventLog(score_address, indexed, data), key[1:]):
+                items[index_key] = None
+
+        for level, span in enumerate(BLOOM_SPANS):
+            start: int = next_height - next_height % span
+            for key, _ in self._db.iterator(start=self._make_bloom_key(level, start),
+                                            stop=_BLOOM_PREFIX + (level + 1).to_bytes(1, 'big')):
+                items[key] = None
+
+            if start < next_height:
+                # Rebuild the bloom of the range which includes the remaining blocks
+                logs_bloom: int = 0
+                for _, value in self._db.iterator(start=self._make_bloom_key(0, start),
+                                                  stop=self._make_bloom_key(0, next_height)):
+                    logs_bloom |= int.from_bytes(value, 'big')
+
+                if logs_bloom:
+                    items[self._make_bloom_key(level, start)] = logs_bloom.to_bytes(BLOOM_BYTES, 'big')
+
+        items[_LAST_BLOCK_HEIGHT_KEY] = _pack_height(block_height) if block_height >= 0 else None
+        self._db.write_batch(items.items())
+
+    @staticmethod
+    def _make_bloom_key(level: int, start: int) -> bytes:
+        return _BLOOM_PREFIX + level.to_bytes(1, 'big') + _pack_height(start)
+
+    def _get_bloom(self, key: bytes) -> int:
+        value: Optional[bytes] = self._db.get(key)
+        return 0 if value is None else int.from_bytes(value, 'big')
+
+    def find(self,
+             from_height: int,
+             to_height: int,
+             score_address: Optional['Address'] = None,
+             indexed: Optional[List[Optional['BaseType']]] = None) -> Iterator['IndexedEventLog']:
+        """Yields the event logs which match all given conditions
+        in the order of block height, tx index and log index
+
+        :param from_height: the first block height to search
+        :param to_height: the last block height to search
+        :param score_address: score address which emitted event logs (None: any SCORE)
+        :param indexed: [event signature, indexed arguments...] where None matches any value
+        """
+        get_ordered_bytes = EventLogEmitter.get_ordered_bytes
+        filters: List[Tuple[int, bytes]] = \
+            [(i, get_ordered_bytes(i, value)) for i, value in enumerate(indexed or ()) if value is not None]
+
+        if score_address is not None and len(filters) > 0 and filters[0][0] == 0:
+            logs = self._find_by_index(score_address, filters, from_height, to_height)
+        else:
+            bloom_items: List[bytes] = [value for _, value in filters]
+            if score_address is not None:
+                bloom_items.append(get_ordered_bytes(0xff, score_address))
+            logs = self._find_by_bloom(get_bloom_value(bloom_items), from_height, to_height)
+
+        for position, value in logs:
+            tx_hash, log_score_address, log_indexed, data = MsgPackForDB.loads(value)
+
+            # Filter out logs found by a bloom or a hash collision
+            if score_address is not None and log_score_address != score_address:
+                continue
+            if any(i >= len(log_indexed) or get_ordered_bytes(i, log_indexed[i]) != ordered_bytes
+                   for i, ordered_bytes in filters):
+                continue
+
+            yield IndexedEventLog(int.from_bytes(position[:8], 'big'),
+                                  int.from_bytes(position[8:12], 'big'),
+                                  tx_hash,
+                                  EventLog(log_score_address, log_indexed, data))
+
+    def _find_by_index(self,
+                       score_address: 'Address',
+                       filters: List[Tuple[int, bytes]],
+                       from_height: int,
+                       to_height: int) -> Iterator[Tuple[bytes, bytes]]:
+        # An indexed argument is more selective than the event signature
+        index, ordered_bytes = filters[-1]
+        prefix: bytes = _make_index_prefix(score_address, _hash(filters[0][1]), index, _hash(ordered_bytes))
+
+        for key, _ in self._db.iterator(start=prefix + _pack_height(from_height),
+                                        stop=prefix + _pack_height(to_height + 1)):
+            position: bytes = key[len(prefix):]
+            value: Optional[bytes] = self._db.get(_LOG_PREFIX + position)
+            if value is not None:
+                yield position, value
+
+    def _find_by_bloom(self, mask: int, from_height: int, to_height: int) -> Iterator[Tuple[bytes, bytes]]:
+        for height in self._get_heights(mask, len(BLOOM_SPANS) - 1, from_height, to_height):
+            for key, value in self._db.iterator(prefix=_LOG_PREFIX + _pack_height(height)):
+                yield key[1:], value
+
+    def _get_heights(self, mask: int, level: int, from_height: int, to_height: int) -> Iterator[int]:
+        """Yields the heights of the blocks whose blooms contain all bits of a mask
+
+        The ranges without any event log have no bloom and are skipped.
+        """
+        span: int = BLOOM_SPANS[level]
+        start: int = from_height - from_height % span
+
+        for key, value in self._db.iterator(start=self._make_bloom_key(level, start),
+                                            stop=self._make_bloom_key(level, to_height + 1)):
+            if int.from_bytes(value, 'big') & mask != mask:
+                continue
+
+            range_start: int = int.from_bytes(key[2:], 'big')
+            if level == 0:
+                yield range_start
+            else:
+                yield from self._get_heights(mask,
+                                             level - 1,
+                                             max(from_height, range_start),
+                                             min(to_height, range_start + span - 1))
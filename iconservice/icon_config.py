@@ -15,7 +15,8 @@
 from .icon_constant import (
     ConfigKey, ICX_IN_LOOP, TERM_PERIOD, IISS_DAY_BLOCK, PREP_MAIN_PREPS,
     PREP_MAIN_AND_SUB_PREPS, PENALTY_GRACE_PERIOD, LOW_PRODUCTIVITY_PENALTY_THRESHOLD,
-    BLOCK_VALIDATION_PENALTY_THRESHOLD, BACKUP_FILES, BLOCK_INVOKE_TIMEOUT_S
+    BLOCK_VALIDATION_PENALTY_THRESHOLD, BACKUP_FILES, BLOCK_INVOKE_TIMEOUT_S, STATE_DB_CACHE_SIZE,
+    PARALLEL_TX_WORKERS, QUERY_WORKERS, QUERY_CACHE_SIZE, BLOCK_PROFILER_SIZE
 )
 
 default_icon_config = {
@@ -62,5 +63,18 @@ default_icon_config = {
     ConfigKey.STEP_TRACE_FLAG: False,
     ConfigKey.PRECOMMIT_DATA_LOG_FLAG: False,
     ConfigKey.BACKUP_FILES: BACKUP_FILES,
-    ConfigKey.BLOCK_INVOKE_TIMEOUT: BLOCK_INVOKE_TIMEOUT_S
+    ConfigKey.BACKUP_IN_BACKGROUND: False,
+    ConfigKey.BACKUP_IN_DB: False,
+    ConfigKey.BLOCK_INVOKE_TIMEOUT: BLOCK_INVOKE_TIMEOUT_S,
+    ConfigKey.STATE_DB_CACHE_SIZE: STATE_DB_CACHE_SIZE,
+    ConfigKey.PARALLEL_TX_EXECUTION: False,
+    ConfigKey.PARALLEL_TX_WORKERS: PARALLEL_TX_WORKERS,
+    ConfigKey.QUERY_WORKERS: QUERY_WORKERS,
+    ConfigKey.QUERY_CACHE_SIZE: QUERY_CACHE_SIZE,
+    ConfigKey.QUERY_CACHE_EXCLUDES: [],
+    ConfigKey.BLOCK_PROFILER_SIZE: BLOCK_PROFILER_SIZE,
+    ConfigKey.BLOCK_PROFILER_DUMP_PATH: "",
+    ConfigKey.SCORE_INSTANCE_POOL: False,
+    ConfigKey.SCORE_WARM_UP: 0,
+    ConfigKey.EVENT_INDEX: False
 }
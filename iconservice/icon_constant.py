@@ -117,7 +117,10 @@ class Revision(Enum):
     REALTIME_P2P_ENDPOINT_UPDATE = 8
     OPTIMIZE_DIRTY_PREP_UPDATE = 8
 
-    LATEST = 8
+    # Revision 9
+    CONTAINER_DB_BULK_ACCESS = 9
+
+    LATEST = 9
 
 
 RC_DB_VERSION_0 = 0
@@ -132,6 +135,8 @@ RC_DATA_VERSION_TABLE = {
 }
 
 IISS_DB = 'iiss'
+EVENT_INDEX_DB = 'event_index'
+BACKUP_DB = 'backup_db'
 RC_SOCKET = 'iiss.sock'
 
 META_DB = 'meta'
@@ -184,10 +189,43 @@ class ConfigKey:
 
     # The maximum number of backup files for rollback
     BACKUP_FILES = "backupFiles"
+    # Write backup files for rollback in background not to delay commit
+    BACKUP_IN_BACKGROUND = "backupInBackground"
+    # Keep backups for rollback in a LevelDB instead of a file per block
+    BACKUP_IN_DB = "backupInDb"
 
     # Block invoke timeout in second
     BLOCK_INVOKE_TIMEOUT = "blockInvokeTimeout"
 
+    # The maximum number of committed states cached in memory (0: disabled)
+    STATE_DB_CACHE_SIZE = "stateDbCacheSize"
+
+    # Execute independent coin transfers in a block concurrently
+    PARALLEL_TX_EXECUTION = "parallelTxExecution"
+    PARALLEL_TX_WORKERS = "parallelTxWorkers"
+
+    # The number of threads which process queries concurrently
+    QUERY_WORKERS = "queryWorkers"
+
+    # The maximum bytes of cached icx_call results on the last block (0: disabled)
+    QUERY_CACHE_SIZE = "queryCacheSize"
+    # SCORE addresses whose icx_call results are not cached
+    QUERY_CACHE_EXCLUDES = "queryCacheExcludes"
+
+    # The number of recent blocks to keep the profiles of invoke and commit phases (0: disabled)
+    BLOCK_PROFILER_SIZE = "blockProfilerSize"
+    # Path of a file to append block profiles to in JSON lines (empty: disabled)
+    BLOCK_PROFILER_DUMP_PATH = "blockProfilerDumpPath"
+
+    # Reuse the instances of SCOREs whose member variables are only container DBs or constants
+    SCORE_INSTANCE_POOL = "scoreInstancePool"
+
+    # The number of the most called SCOREs to import in background on startup (0: disabled)
+    SCORE_WARM_UP = "scoreWarmUp"
+
+    # Index the event logs of committed blocks to query them with ise_getEventLogs
+    EVENT_INDEX = "eventIndex"
+
 
 class EnableThreadFlag(IntFlag):
     INVOKE = 1
@@ -311,6 +349,21 @@ BACKUP_FILES = 10
 
 BLOCK_INVOKE_TIMEOUT_S = 15
 
+STATE_DB_CACHE_SIZE = 100_000
+
+PARALLEL_TX_WORKERS = 4
+
+QUERY_WORKERS = 1
+
+QUERY_CACHE_SIZE = 16 * 1024 * 1024
+
+BLOCK_PROFILER_SIZE = 100
+
+EVENT_LOGS_QUERY_LIMIT = 1000
+
+# The number of transactions whose input data sizes are kept from validation to invoke
+INPUT_DATA_SIZE_CACHE_SIZE = 10_000
+
 
 class RCStatus(IntEnum):
     NOT_READY = 0
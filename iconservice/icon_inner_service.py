@@ -26,13 +26,15 @@ from iconservice.base.exception import ExceptionCode, IconServiceBaseException,
 from iconservice.base.type_converter import TypeConverter, ParamType
 from iconservice.base.type_converter_templates import ConstantKeys
 from iconservice.icon_constant import ICON_INNER_LOG_TAG, ICON_SERVICE_LOG_TAG, \
-    EnableThreadFlag, ENABLE_THREAD_FLAG
+    EnableThreadFlag, ENABLE_THREAD_FLAG, ConfigKey
 from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.utils import check_error_response, to_camel_case
+from iconservice.utils.profiler import Phase, Stopwatch
 
 if TYPE_CHECKING:
     from earlgrey import RobustConnection
     from iconcommons.icon_config import IconConfig
+    from iconservice.utils.profiler import BlockProfiler
 
 THREAD_INVOKE = 'invoke'
 THREAD_QUERY = 'query'
@@ -48,16 +50,20 @@ class IconScoreInnerTask(object):
         self._thread_flag = ENABLE_THREAD_FLAG
 
         self._icon_service_engine = IconServiceEngine()
-        self._open()
 
         self._thread_pool = {THREAD_INVOKE: ThreadPoolExecutor(1),
-                             THREAD_QUERY: ThreadPoolExecutor(1),
                              THREAD_VALIDATE: ThreadPoolExecutor(1)}
+        self._open()
 
     def _open(self):
         Logger.info("icon_score_service open", ICON_INNER_LOG_TAG)
         self._icon_service_engine.open(self._conf)
 
+        # Queries read the same snapshot of StateDB with their own context stacks on each thread
+        query_workers: int = self._conf[ConfigKey.QUERY_WORKERS]
+        Logger.info(f"query_workers: {query_workers}", ICON_INNER_LOG_TAG)
+        self._thread_pool[THREAD_QUERY] = ThreadPoolExecutor(query_workers, thread_name_prefix=THREAD_QUERY)
+
     def _is_thread_flag_on(self, flag: 'EnableThreadFlag') -> bool:
         return (self._thread_flag & flag) == flag
 
@@ -130,9 +136,11 @@ class IconScoreInnerTask(object):
 
         response = None
         try:
+            stopwatch = Stopwatch()
             params = TypeConverter.convert(request, ParamType.INVOKE)
             converted_block_params = params['block']
             block = Block.from_dict(converted_block_params)
+            type_conversion_time: Tuple[float, float] = stopwatch.elapsed()
 
             converted_tx_requests = params['transactions']
 
@@ -151,6 +159,7 @@ class IconScoreInnerTask(object):
                 prev_block_votes=converted_prev_votes,
                 is_block_editable=converted_is_block_editable)
 
+            stopwatch = Stopwatch()
             if convert_tx_result_to_dict:
                 convert_tx_results = [tx_result.to_dict(to_camel_case) for tx_result in tx_results]
             else:
@@ -168,6 +177,11 @@ class IconScoreInnerTask(object):
 
             Logger.info(f'invoke origin response with {results}', ICON_INNER_LOG_TAG)
             response = MakeResponse.make_response(results)
+
+            block_profiler: Optional['BlockProfiler'] = self._icon_service_engine.block_profiler
+            if block_profiler is not None:
+                block_profiler.add(block.hash, Phase.TYPE_CONVERSION, *type_conversion_time)
+                block_profiler.add(block.hash, Phase.TYPE_CONVERSION, *stopwatch.elapsed())
         except FatalException as e:
             self._log_exception(e, ICON_SERVICE_LOG_TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
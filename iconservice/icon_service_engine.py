@@ -16,12 +16,13 @@
 import os
 from copy import deepcopy
 from enum import IntEnum
-from typing import TYPE_CHECKING, List, Any, Optional, Tuple, Dict, Union
+from typing import TYPE_CHECKING, List, Any, Optional, Tuple, Dict, Union, Set
 
 from iconcommons.logger import Logger
 
 from iconservice.rollback import check_backup_exists
 from iconservice.rollback.backup_cleaner import BackupCleaner
+from iconservice.rollback.backup_db import BackupDatabase
 from iconservice.rollback.backup_manager import BackupManager
 from iconservice.rollback.rollback_manager import RollbackManager
 from .base.address import Address, generate_score_address, generate_score_address_for_tbears
@@ -30,7 +31,7 @@ from .base.block import Block, EMPTY_BLOCK
 from .base.exception import (
     ExceptionCode, IconServiceBaseException, ScoreNotFoundException,
     AccessDeniedException, IconScoreException, InvalidParamsException, InvalidBaseTransactionException,
-    MethodNotFoundException, InternalServiceErrorException, DatabaseException)
+    MethodNotFoundException, InternalServiceErrorException, DatabaseException, InvalidRequestException)
 from .base.message import Message
 from .base.transaction import Transaction
 from .base.type_converter_templates import ConstantKeys
@@ -39,13 +40,15 @@ from .database.wal import WriteAheadLogReader, WALDBType
 from .database.wal import WriteAheadLogWriter, IissWAL, StateWAL, WALState
 from .deploy import DeployEngine, DeployStorage
 from .deploy.icon_builtin_score_loader import IconBuiltinScoreLoader
+from .event_index import EventIndex, IndexedEventLog, convert_indexed
 from .fee import FeeEngine, FeeStorage, DepositHandler
 from .icon_constant import (
     ICON_DEX_DB_NAME, ICON_SERVICE_LOG_TAG, IconServiceFlag, ConfigKey,
     IISS_METHOD_TABLE, PREP_METHOD_TABLE, NEW_METHOD_TABLE, Revision, BASE_TRANSACTION_INDEX,
     IISS_DB, IISS_INITIAL_IREP, DEBUG_METHOD_TABLE, PREP_MAIN_PREPS, PREP_MAIN_AND_SUB_PREPS,
     ISCORE_EXCHANGE_RATE, STEP_LOG_TAG, TERM_PERIOD, BlockVoteStatus, WAL_LOG_TAG, ROLLBACK_LOG_TAG,
-    BLOCK_INVOKE_TIMEOUT_S
+    BLOCK_INVOKE_TIMEOUT_S, STATE_DB_CACHE_SIZE, PARALLEL_TX_WORKERS, QUERY_CACHE_SIZE, BLOCK_PROFILER_SIZE,
+    EVENT_LOGS_QUERY_LIMIT, EVENT_INDEX_DB, BACKUP_DB
 )
 from .iconscore.icon_pre_validator import IconPreValidator
 from .iconscore.icon_score_class_loader import IconScoreClassLoader
@@ -55,11 +58,14 @@ from .iconscore.icon_score_context_util import IconScoreContextUtil
 from .iconscore.icon_score_engine import IconScoreEngine
 from .iconscore.icon_score_event_log import EventLogEmitter
 from .iconscore.icon_score_mapper import IconScoreMapper
+from .iconscore.icon_score_query_cache import IconScoreQueryCache
 from .iconscore.icon_score_result import TransactionResult
 from .iconscore.icon_score_step import IconScoreStepCounterFactory, StepType, get_input_data_size, \
     get_deploy_content_size
 from .iconscore.icon_score_trace import Trace, TraceType
+from .iconscore.score_warm_up import ScoreWarmUp
 from .icx import IcxEngine, IcxStorage
+from .icx.coin_part import CoinPart
 from .icx.issue import IssueEngine, IssueStorage
 from .icx.issue.base_transaction_creator import BaseTransactionCreator
 from .iiss import IISSEngine, IISSStorage, check_decentralization_condition
@@ -71,11 +77,13 @@ from .meta import MetaDBStorage
 from .precommit_data_manager import PrecommitData, PrecommitDataManager, PrecommitFlag
 from .prep import PRepEngine, PRepStorage
 from .prep.data import PRep
+from .speculative_executor import SpeculativeExecutor, SpeculativeResult
 from .rollback.metadata import Metadata as RollbackMetadata
 from .utils import print_log_with_level
 from .utils import sha3_256, int_to_bytes, ContextEngine, ContextStorage
 from .utils import to_camel_case, bytes_to_hex
-from .utils.bloom import BloomFilter
+from .utils.bloom import BloomFilter, get_bloom_value
+from .utils.profiler import BlockProfiler, BlockProfile, Phase, measure
 from .utils.timer import Timer
 
 if TYPE_CHECKING:
@@ -85,6 +93,8 @@ if TYPE_CHECKING:
     from .prep.data import Term
     from .iiss.storage import RewardRate
     from .database.db import KeyValueDatabase
+    from .database.batch import TransactionBatch
+    from .icx.icx_account import Account
     from .iiss.reward_calc.msg_data import BlockProduceInfoData
 
 
@@ -113,8 +123,13 @@ class IconServiceEngine(ContextContainer):
         self._wal_reader: Optional['WriteAheadLogReader'] = None
         self._backup_manager: Optional[BackupManager] = None
         self._backup_cleaner: Optional[BackupCleaner] = None
+        self._backup_db: Optional[BackupDatabase] = None
         self._conf: Optional[Dict[str, Union[str, int]]] = None
         self._block_invoke_timeout_s: int = BLOCK_INVOKE_TIMEOUT_S
+        self._speculative_executor: Optional['SpeculativeExecutor'] = None
+        self._query_cache: Optional['IconScoreQueryCache'] = None
+        self._block_profiler: Optional['BlockProfiler'] = None
+        self._event_index: Optional['EventIndex'] = None
 
         # JSON-RPC handlers
         self._handlers = {
@@ -124,7 +139,8 @@ class IconServiceEngine(ContextContainer):
             'icx_sendTransaction': self._handle_icx_send_transaction,
             'debug_estimateStep': self._handle_estimate_step,
             'icx_getScoreApi': self._handle_icx_get_score_api,
-            'ise_getStatus': self._handle_ise_get_status
+            'ise_getStatus': self._handle_ise_get_status,
+            'ise_getEventLogs': self._handle_ise_get_event_logs
         }
 
         self._precommit_data_manager = PrecommitDataManager()
@@ -151,7 +167,9 @@ class IconServiceEngine(ContextContainer):
         os.makedirs(backup_root_path, exist_ok=True)
 
         # Share one context db with all SCORE
-        ContextDatabaseFactory.open(state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB)
+        ContextDatabaseFactory.open(state_db_root_path,
+                                    ContextDatabaseFactory.Mode.SINGLE_DB,
+                                    conf.get(ConfigKey.STATE_DB_CACHE_SIZE, STATE_DB_CACHE_SIZE))
         self._state_db_root_path = state_db_root_path
         self._rc_data_path = rc_data_path
         self._backup_root_path = backup_root_path
@@ -162,8 +180,12 @@ class IconServiceEngine(ContextContainer):
 
         self._deposit_handler = DepositHandler()
         self._icon_pre_validator = IconPreValidator()
-        self._backup_manager = BackupManager(backup_root_path, rc_data_path)
-        self._backup_cleaner = BackupCleaner(backup_root_path, conf[ConfigKey.BACKUP_FILES])
+        if conf.get(ConfigKey.BACKUP_IN_DB, False):
+            self._backup_db = BackupDatabase.from_path(os.path.join(backup_root_path, BACKUP_DB))
+        self._backup_manager = BackupManager(backup_root_path, rc_data_path, self._backup_db)
+        self._backup_cleaner = BackupCleaner(backup_root_path, conf[ConfigKey.BACKUP_FILES], self._backup_db)
+        if conf.get(ConfigKey.BACKUP_IN_BACKGROUND, False):
+            self._backup_manager.start()
 
         IconScoreClassLoader.init(score_root_path)
         IconScoreContext.score_root_path = score_root_path
@@ -178,6 +200,7 @@ class IconServiceEngine(ContextContainer):
         IconScoreContext.step_trace_flag = conf.get(ConfigKey.STEP_TRACE_FLAG, False)
         IconScoreContext.log_level = conf[ConfigKey.LOG].get("level", "debug")
         IconScoreContext.precommitdata_log_flag = conf[ConfigKey.PRECOMMIT_DATA_LOG_FLAG]
+        IconScoreContext.score_instance_pool = conf.get(ConfigKey.SCORE_INSTANCE_POOL, False)
         self._init_component_context()
 
         # Recover incomplete state on wal and rollback process
@@ -219,6 +242,11 @@ class IconServiceEngine(ContextContainer):
         self._init_global_value_by_governance_score(context)
 
         self._set_block_invoke_timeout(conf)
+        self._set_speculative_executor(conf)
+        self._set_query_cache(conf)
+        self._set_block_profiler(conf)
+        self._set_score_warm_up(conf, score_root_path)
+        self._set_event_index(conf)
 
         # DO NOT change the values in conf
         self._conf = conf
@@ -317,6 +345,10 @@ class IconServiceEngine(ContextContainer):
     def is_reward_calculator_ready(cls) -> bool:
         return IconScoreContext.engine.iiss.is_reward_calculator_ready()
 
+    @property
+    def block_profiler(self) -> Optional['BlockProfiler']:
+        return self._block_profiler
+
     @staticmethod
     def _make_service_flag(flag_table: dict) -> int:
         make_flag = 0
@@ -449,14 +481,34 @@ class IconServiceEngine(ContextContainer):
             IconScoreContext.icon_score_mapper.close()
             IconScoreContext.icon_score_mapper = None
 
+            if IconScoreContext.score_warm_up is not None:
+                IconScoreContext.score_warm_up.save()
+                IconScoreContext.score_warm_up = None
+
             self._close_component_context(context)
 
             IconScoreClassLoader.exit(context.score_root_path)
         finally:
             self._pop_context()
+
+            # Backups being written in background read state_db
+            if self._backup_manager is not None:
+                self._backup_manager.close()
+            if self._backup_db is not None:
+                self._backup_db.close()
+                self._backup_db = None
+
             ContextDatabaseFactory.close()
             self._clear_context()
 
+            if self._speculative_executor is not None:
+                self._speculative_executor.close()
+                self._speculative_executor = None
+
+            if self._event_index is not None:
+                self._event_index.close()
+                self._event_index = None
+
     def invoke(self,
                block: 'Block',
                tx_requests: list,
@@ -495,9 +547,13 @@ class IconServiceEngine(ContextContainer):
                 precommit_data.main_prep_as_dict
 
         # Check for block validation before invoke
-        self._precommit_data_manager.validate_block_to_invoke(block)
+        # The block can be invoked on top of an uncommitted precommit block (parent)
+        parent: Optional['PrecommitData'] = self._precommit_data_manager.validate_block_to_invoke(block)
 
-        context: 'IconScoreContext' = self._context_factory.create(IconScoreContextType.INVOKE, block=block)
+        context: 'IconScoreContext' = \
+            self._context_factory.create(IconScoreContextType.INVOKE, block=block, parent=parent)
+        if self._block_profiler is not None:
+            context.profile = self._block_profiler.start(block)
 
         # TODO: prev_block_votes must be support to low version about prev_block_validators by using meta storage.
         prev_block_votes: List[Tuple['Address', int]] = self._get_prev_block_votes(context,
@@ -514,16 +570,18 @@ class IconServiceEngine(ContextContainer):
         precommit_flag = PrecommitFlag.NONE
         added_transactions = {}
 
-        self._before_transaction_process(context,
-                                         is_block_editable,
-                                         tx_requests,
-                                         added_transactions,
-                                         prev_block_generator,
-                                         prev_block_votes)
+        with measure(context.profile, Phase.BEFORE_TX_PROCESS):
+            self._before_transaction_process(context,
+                                             is_block_editable,
+                                             tx_requests,
+                                             added_transactions,
+                                             prev_block_generator,
+                                             prev_block_votes)
 
         if block.height == 0:
             # Assume that there is only one tx in genesis_block
-            tx_result = self._invoke_genesis(context, tx_requests[0], 0)
+            with measure(context.profile, Phase.CALL):
+                tx_result = self._invoke_genesis(context, tx_requests[0], 0)
             block_result.append(tx_result)
             context.block_batch.update(context.tx_batch)
             context.tx_batch.clear()
@@ -531,6 +589,11 @@ class IconServiceEngine(ContextContainer):
             tx_timer = Timer()
             tx_timer.start()
 
+            # Results of the transactions executed speculatively against the current block_batch
+            speculative_results: Dict[int, 'SpeculativeResult'] = {}
+            # Keys written by the transactions committed after the speculative results were made
+            written_keys: Set[bytes] = set()
+
             for index, tx_request in enumerate(tx_requests):
                 # Adjust the number of transactions in a block to make sure that
                 # a leader can broadcast a block candidate to validators in a specific period.
@@ -540,15 +603,31 @@ class IconServiceEngine(ContextContainer):
                         msg=f"Stop to invoke remaining transactions: {index} / {len(tx_requests)}")
                     break
 
-                if index == BASE_TRANSACTION_INDEX and context.is_decentralized():
-                    if not tx_request['params'].get('dataType') == "base":
-                        raise InvalidBaseTransactionException(
-                            "Invalid block: first transaction must be an base transaction")
-                    tx_result = self._invoke_base_request(context, tx_request, is_block_editable)
-                else:
-                    tx_result = self._invoke_request(context, tx_request, index)
+                with measure(context.profile, Phase.CALL):
+                    if index == BASE_TRANSACTION_INDEX and context.is_decentralized():
+                        if not tx_request['params'].get('dataType') == "base":
+                            raise InvalidBaseTransactionException(
+                                "Invalid block: first transaction must be an base transaction")
+                        tx_result = self._invoke_base_request(context, tx_request, is_block_editable)
+                        self._log_step_trace(context)
+                    elif self._speculative_executor is not None and precommit_flag == PrecommitFlag.NONE:
+                        if index not in speculative_results:
+                            speculative_results = self._speculative_executor.run(
+                                lambda request, i: self._invoke_request_speculatively(context, request, i),
+                                tx_requests, index)
+                            written_keys.clear()
+
+                        tx_result = self._commit_speculative_result(
+                            context, speculative_results.pop(index, None), written_keys)
+                        if tx_result is None:
+                            tx_result = self._invoke_request(context, tx_request, index)
+                            self._log_step_trace(context)
+
+                        written_keys.update(context.tx_batch)
+                    else:
+                        tx_result = self._invoke_request(context, tx_request, index)
+                        self._log_step_trace(context)
 
-                self._log_step_trace(context)
                 block_result.append(tx_result)
                 context.update_batch()
 
@@ -570,33 +649,42 @@ class IconServiceEngine(ContextContainer):
                 # change the reward calculation period from 43200 to 43120 which is the same as term_period
                 context.storage.iiss.put_calc_period(context, context.term_period)
 
-        main_prep_as_dict, term, rc_state_hash = self._after_transaction_process(context,
-                                                                                 precommit_flag,
-                                                                                 rc_db_revision,
-                                                                                 prev_block_generator,
-                                                                                 prev_block_votes)
+        with measure(context.profile, Phase.AFTER_TX_PROCESS):
+            main_prep_as_dict, term, rc_state_hash = self._after_transaction_process(context,
+                                                                                     precommit_flag,
+                                                                                     rc_db_revision,
+                                                                                     prev_block_generator,
+                                                                                     prev_block_votes)
 
         # Save precommit data
         # It will be written to levelDB on commit
-        precommit_data = PrecommitData(context.revision,
-                                       rc_db_revision,
-                                       context.block_batch,
-                                       block_result,
-                                       context.rc_block_batch,
-                                       context.preps,
-                                       term,
-                                       prev_block_generator,
-                                       prev_block_validators,
-                                       context.new_icon_score_mapper,
-                                       precommit_flag,
-                                       rc_state_hash,
-                                       added_transactions,
-                                       main_prep_as_dict)
+        with measure(context.profile, Phase.DIGEST):
+            precommit_data = PrecommitData(context.revision,
+                                           rc_db_revision,
+                                           context.block_batch,
+                                           block_result,
+                                           context.rc_block_batch,
+                                           context.preps,
+                                           term,
+                                           prev_block_generator,
+                                           prev_block_validators,
+                                           context.new_icon_score_mapper,
+                                           precommit_flag,
+                                           rc_state_hash,
+                                           added_transactions,
+                                           main_prep_as_dict)
         if context.precommitdata_log_flag:
             Logger.info(tag=ICON_SERVICE_LOG_TAG,
                         msg=f"Created precommit_data: \n{precommit_data}")
         self._precommit_data_manager.push(precommit_data)
 
+        profile: Optional['BlockProfile'] = context.profile
+        if profile is not None:
+            profile.tx_count = len(block_result)
+            profile.state_keys = len(context.block_batch)
+            profile.rc_keys = len(context.rc_block_batch)
+            profile.add(Phase.INVOKE, *profile.stopwatch.elapsed())
+
         return \
             block_result, \
             precommit_data.state_root_hash, \
@@ -1066,6 +1154,70 @@ class IconServiceEngine(ContextContainer):
 
         return self._call(context, method, params)
 
+    def _invoke_request_speculatively(self,
+                                      context: 'IconScoreContext',
+                                      request: dict,
+                                      index: int) -> 'SpeculativeResult':
+        """Invoke a transaction request with a new context
+        against the current block states of a given invoke context
+
+        :param context: invoke context
+        :param request:
+        :param index:
+        :return:
+        """
+        speculative_context: 'IconScoreContext' = self._context_factory.create_speculative(context)
+        tx_result: 'TransactionResult' = self._invoke_request(speculative_context, request, index)
+        return SpeculativeResult(speculative_context, tx_result)
+
+    def _commit_speculative_result(self,
+                                   context: 'IconScoreContext',
+                                   result: Optional['SpeculativeResult'],
+                                   written_keys: Set[bytes]) -> Optional['TransactionResult']:
+        """Apply the result of a speculatively executed transaction to a given invoke context
+        as if the transaction has been invoked with it
+
+        :param context: invoke context
+        :param result: speculative result
+        :param written_keys: keys written by the transactions committed after the result was made
+        :return: tx_result or None if the result is not valid anymore
+        """
+        if result is None:
+            return None
+
+        speculative_context: 'IconScoreContext' = result.context
+        tx_result: 'TransactionResult' = result.tx_result
+
+        # Every transaction deposits its fee to the treasury account.
+        # The fee is deposited again to the current treasury balance below
+        # instead of the one in the snapshot, so the treasury does not make a conflict
+        treasury: 'Address' = context.storage.icx.fee_treasury
+        if treasury in (speculative_context.tx.origin, tx_result.to):
+            return None
+
+        treasury_key: bytes = CoinPart.make_key(treasury)
+        if not result.is_valid(written_keys, {treasury_key}):
+            return None
+
+        self._log_step_trace(speculative_context)
+
+        tx_batch: 'TransactionBatch' = context.tx_batch
+        for key, value in speculative_context.tx_batch.items():
+            if key != treasury_key:
+                tx_batch[key] = value
+        context.tx = speculative_context.tx
+
+        if treasury_key in speculative_context.tx_batch:
+            # The treasury is the last one changed by a transaction in _charge_transaction_fee()
+            treasury_account: 'Account' = context.storage.icx.get_treasury_account(context)
+            treasury_account.deposit(tx_result.step_used * tx_result.step_price)
+            context.storage.icx.put_account(context, treasury_account)
+
+        tx_result.cumulative_step_used = context.cumulative_step_used + tx_result.step_used
+        context.cumulative_step_used += tx_result.step_used
+
+        return tx_result
+
     @classmethod
     def _estimate_step_by_request(cls, request, context) -> int:
         """Calculates simply and estimates step with request data.
@@ -1146,21 +1298,25 @@ class IconServiceEngine(ContextContainer):
         :return: The amount of step
         """
         context = self._context_factory.create(IconScoreContextType.ESTIMATION, block=self._get_last_block())
-        self._set_revision_to_context(context)
-        # Fills the step_limit as the max step limit to proceed the transaction.
-        step_limit: int = context.step_counter.max_step_limit
-        context.step_counter.reset(step_limit)
 
-        params: dict = request['params']
-        data_type: str = params.get('dataType')
-        to: Address = params['to']
+        try:
+            self._set_revision_to_context(context)
+            # Fills the step_limit as the max step limit to proceed the transaction.
+            step_limit: int = context.step_counter.max_step_limit
+            context.step_counter.reset(step_limit)
 
-        if data_type == "deploy" or not to.is_contract:
-            # Calculates simply and estimates step with request data.
-            return self._estimate_step_by_request(request, context)
-        else:
-            # Processes the transaction and estimates step.
-            return self._estimate_step_by_execution(request, context, step_limit)
+            params: dict = request['params']
+            data_type: str = params.get('dataType')
+            to: Address = params['to']
+
+            if data_type == "deploy" or not to.is_contract:
+                # Calculates simply and estimates step with request data.
+                return self._estimate_step_by_request(request, context)
+            else:
+                # Processes the transaction and estimates step.
+                return self._estimate_step_by_execution(request, context, step_limit)
+        finally:
+            context.release_snapshots()
 
     def query(self, method: str, params: dict) -> Any:
         """Process a query message call from outside
@@ -1179,19 +1335,23 @@ class IconServiceEngine(ContextContainer):
             IconScoreContextType.QUERY,
             block=self._get_last_block()
         )
-        self._set_revision_to_context(context)
-        step_limit: int = context.step_counter.max_step_limit
 
-        if params:
-            from_: 'Address' = params.get('from', None)
-            context.msg = Message(sender=from_)
-            step_limit: int = params.get('stepLimit', step_limit)
+        try:
+            self._set_revision_to_context(context)
+            step_limit: int = context.step_counter.max_step_limit
 
-        context.traces = []
-        context.step_counter.reset(step_limit)
+            if params:
+                from_: 'Address' = params.get('from', None)
+                context.msg = Message(sender=from_)
+                step_limit: int = params.get('stepLimit', step_limit)
 
-        ret = self._call(context, method, params)
-        return ret
+            context.traces = []
+            context.step_counter.reset(step_limit)
+
+            ret = self._call(context, method, params)
+            return ret
+        finally:
+            context.release_snapshots()
 
     def validate_transaction(self, request: dict) -> None:
         """Validate JSON-RPC transaction request
@@ -1228,7 +1388,7 @@ class IconServiceEngine(ContextContainer):
                 # minimum_step is the sum of
                 # default STEP cost and input STEP costs if data field exists
                 data = params['data']
-                input_size = get_input_data_size(context.revision, data)
+                input_size = get_input_data_size(context.revision, data, params.get('txHash'))
                 minimum_step += input_size * self._step_counter_factory.get_step_cost(StepType.INPUT)
 
             self._icon_pre_validator.execute(context, params, step_price, minimum_step)
@@ -1241,6 +1401,7 @@ class IconServiceEngine(ContextContainer):
                 self._validate_deployer_whitelist(context, params)
         finally:
             self._pop_context()
+            context.release_snapshots()
 
     def _call(self,
               context: 'IconScoreContext',
@@ -1331,10 +1492,28 @@ class IconServiceEngine(ContextContainer):
             data = params.get('data', None)
 
             context.step_counter.apply_step(StepType.CONTRACT_CALL, 1)
-            return IconScoreEngine.query(context,
-                                         icon_score_address,
-                                         data_type,
-                                         data)
+
+            query_cache: Optional['IconScoreQueryCache'] = self._query_cache
+            if query_cache is None \
+                    or context.type != IconScoreContextType.QUERY \
+                    or not query_cache.is_cacheable(icon_score_address):
+                return IconScoreEngine.query(context,
+                                             icon_score_address,
+                                             data_type,
+                                             data)
+
+            key: tuple = query_cache.make_key(context.block.hash, params)
+            hit, result = query_cache.get(key)
+            if hit:
+                return result
+
+            generation: int = query_cache.generation
+            result = IconScoreEngine.query(context,
+                                           icon_score_address,
+                                           data_type,
+                                           data)
+            query_cache.put_if_unchanged(key, result, generation)
+            return result
 
     @staticmethod
     def _create_rc_result(context: 'IconScoreContext', start_block: int, end_block: int) -> dict:
@@ -1422,12 +1601,13 @@ class IconServiceEngine(ContextContainer):
             context.func_type = IconScoreFuncType.WRITABLE
 
             # Charge a fee to from account
-            step_used_details, final_step_price = \
-                self._charge_transaction_fee(
-                    context,
-                    params,
-                    tx_result.status,
-                    context.step_counter.step_used)
+            with measure(context.profile, Phase.FEE):
+                step_used_details, final_step_price = \
+                    self._charge_transaction_fee(
+                        context,
+                        params,
+                        tx_result.status,
+                        context.step_counter.step_used)
 
             # Finalize tx_result
             tx_result.step_price = final_step_price
@@ -1476,7 +1656,9 @@ class IconServiceEngine(ContextContainer):
 
         # Every send_transaction are calculated DEFAULT STEP at first
         context.step_counter.apply_step(StepType.DEFAULT, 1)
-        input_size = get_input_data_size(context.revision, params.get('data', None))
+        # The size computed on validation is reused only on invoke. txHash of the other requests is not verified.
+        tx_hash: Optional[bytes] = params.get('txHash') if context.type == IconScoreContextType.INVOKE else None
+        input_size = get_input_data_size(context.revision, params.get('data', None), tx_hash)
         context.step_counter.apply_step(StepType.INPUT, input_size)
 
         # TODO Branch IISS Engine
@@ -1776,15 +1958,16 @@ class IconServiceEngine(ContextContainer):
         :param event_logs: The event logs
         :return: Bloom data
         """
-        logs_bloom = BloomFilter()
+        get_ordered_bytes = EventLogEmitter.get_ordered_bytes
+        values: List[bytes] = []
 
         for event_log in event_logs:
-            logs_bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
+            values.append(get_ordered_bytes(0xff, event_log.score_address))
             for i, indexed_item in enumerate(event_log.indexed):
-                indexed_bytes = EventLogEmitter.get_ordered_bytes(i, indexed_item)
-                logs_bloom.add(indexed_bytes)
+                values.append(get_ordered_bytes(i, indexed_item))
 
-        return logs_bloom
+        # Set the bits of all values at once
+        return BloomFilter(get_bloom_value(values))
 
     @classmethod
     def _handle_icx_get_score_api(cls,
@@ -1808,6 +1991,60 @@ class IconServiceEngine(ContextContainer):
         if not bool(params) or params.get('filter'):
             last_block_status = self._make_last_block_status()
             response['lastBlock'] = last_block_status
+
+        if params and 'blockProfiles' in params.get('filter', ()) and self._block_profiler is not None:
+            response['blockProfiles'] = self._block_profiler.to_list()
+
+        return response
+
+    def _handle_ise_get_event_logs(self, _context: 'IconScoreContext', params: dict) -> dict:
+        """Returns the event logs in committed blocks which match given conditions
+
+        Event logs are returned up to the limit, which is capped at EVENT_LOGS_QUERY_LIMIT,
+        and the rest of them are found from nextBlockHeight.
+        The event logs in the same block are never split.
+
+        :param _context:
+        :param params: scoreAddress, event, indexed, fromBlock, toBlock and limit which are all optional
+        :return:
+        """
+        if self._event_index is None:
+            raise InvalidRequestException(f"{ConfigKey.EVENT_INDEX} is disabled")
+
+        params = params or {}
+        last_block_height: int = self._event_index.last_block_height
+        from_height: int = params.get(ConstantKeys.FROM_BLOCK, 0)
+        to_height: int = min(params.get(ConstantKeys.TO_BLOCK, last_block_height), last_block_height)
+        limit: int = params.get(ConstantKeys.LIMIT, EVENT_LOGS_QUERY_LIMIT)
+        if from_height < 0 or limit <= 0:
+            raise InvalidParamsException(f"Invalid params: {params}")
+        limit = min(limit, EVENT_LOGS_QUERY_LIMIT)
+
+        event: Optional[str] = params.get(ConstantKeys.EVENT)
+        indexed_values: list = params.get(ConstantKeys.INDEXED, [])
+        if event is None and len(indexed_values) > 0:
+            raise InvalidParamsException(f"{ConstantKeys.EVENT} is required to find by indexed arguments")
+        indexed: Optional[list] = None if event is None else convert_indexed(event, indexed_values)
+
+        event_logs: List[dict] = []
+        next_block_height: Optional[int] = None
+
+        for log in self._event_index.find(from_height, to_height, params.get(ConstantKeys.SCORE_ADDRESS), indexed):
+            log: 'IndexedEventLog'
+            if len(event_logs) >= limit and log.block_height != event_logs[-1][ConstantKeys.BLOCK_HEIGHT]:
+                next_block_height = log.block_height
+                break
+
+            event_log: dict = log.event_log.to_dict(to_camel_case)
+            event_log[ConstantKeys.BLOCK_HEIGHT] = log.block_height
+            event_log[ConstantKeys.TX_INDEX] = log.tx_index
+            event_log[ConstantKeys.TX_HASH] = log.tx_hash
+            event_logs.append(event_log)
+
+        response = {ConstantKeys.EVENT_LOGS: event_logs}
+        if next_block_height is not None:
+            response[ConstantKeys.NEXT_BLOCK_HEIGHT] = next_block_height
+
         return response
 
     def _make_last_block_status(self) -> Optional[dict]:
@@ -1842,15 +2079,22 @@ class IconServiceEngine(ContextContainer):
 
         precommit_data: 'PrecommitData' = self._get_updated_precommit_data(instant_block_hash, block_hash)
         context = self._context_factory.create(IconScoreContextType.DIRECT, block=precommit_data.block)
+        if self._block_profiler is not None:
+            context.profile = self._block_profiler.get(instant_block_hash)
 
-        if precommit_data.revision < Revision.IISS.value:
-            self._commit_before_iiss(context, precommit_data)
-        else:
-            self._commit_after_iiss(context, precommit_data, instant_block_hash)
+        with measure(context.profile, Phase.COMMIT):
+            if precommit_data.revision < Revision.IISS.value:
+                self._commit_before_iiss(context, precommit_data)
+            else:
+                self._commit_after_iiss(context, precommit_data, instant_block_hash)
+
+        if self._block_profiler is not None:
+            self._block_profiler.finish(instant_block_hash)
 
     def _commit_before_iiss(self, context: 'IconScoreContext', precommit_data: 'PrecommitData'):
         state_wal: 'StateWAL' = StateWAL(precommit_data.block_batch)
-        self._process_state_commit(context, precommit_data, state_wal)
+        with measure(context.profile, Phase.STATE_WRITE):
+            self._process_state_commit(context, precommit_data, state_wal)
 
     def _commit_after_iiss(self,
                            context: 'IconScoreContext',
@@ -1860,37 +2104,40 @@ class IconServiceEngine(ContextContainer):
         start_calc_block_height: int = context.engine.iiss.get_start_block_of_calc(context)
         is_calc_period_start_block: bool = context.block.height == start_calc_block_height
 
-        wal_writer, state_wal, iiss_wal = \
-            self._process_wal(context, precommit_data, is_calc_period_start_block, instant_block_hash)
-        wal_writer.flush()
-
-        # Backup the previous block state
-        self._backup_manager.run(
-            icx_db=self._icx_context_db.key_value_db,
-            rc_db=context.storage.rc.key_value_db,
-            revision=context.revision,
-            prev_block=self._get_last_block(),
-            block_batch=precommit_data.block_batch,
-            iiss_wal=iiss_wal,
-            is_calc_period_start_block=is_calc_period_start_block,
-            instant_block_hash=instant_block_hash)
-
-        # Clean up the oldest backup file
-        self._backup_cleaner.run_on_commit(context.block.height)
+        with measure(context.profile, Phase.WAL):
+            wal_writer, state_wal, iiss_wal = \
+                self._process_wal(context, precommit_data, is_calc_period_start_block, instant_block_hash)
+            # WAL should be durable before any db is changed
+            # States appended below are not synced: losing one only makes recovery repeat the work done already
+            wal_writer.flush()
+
+        with measure(context.profile, Phase.BACKUP):
+            # Backup the previous block state
+            self._backup_manager.run(
+                icx_db=self._icx_context_db.key_value_db,
+                rc_db=context.storage.rc.key_value_db,
+                revision=context.revision,
+                prev_block=self._get_last_block(),
+                block_batch=precommit_data.block_batch,
+                iiss_wal=iiss_wal,
+                is_calc_period_start_block=is_calc_period_start_block,
+                instant_block_hash=instant_block_hash,
+                backup_cleaner=self._backup_cleaner)
 
         # Write iiss_wal to rc_db
-        standby_db_info: Optional['RewardCalcDBInfo'] = \
-            self._process_iiss_commit(context, precommit_data, iiss_wal, is_calc_period_start_block)
-        wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
-        wal_writer.flush()
+        with measure(context.profile, Phase.RC_COMMIT):
+            standby_db_info: Optional['RewardCalcDBInfo'] = \
+                self._process_iiss_commit(context, precommit_data, iiss_wal, is_calc_period_start_block)
+            wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
 
         # Write state_wal to state_db
-        self._process_state_commit(context, precommit_data, state_wal)
-        wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
-        wal_writer.flush()
+        with measure(context.profile, Phase.STATE_WRITE):
+            self._process_state_commit(context, precommit_data, state_wal)
+            wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
 
         # send IPC
-        self._process_ipc(context, wal_writer, precommit_data, standby_db_info, instant_block_hash)
+        with measure(context.profile, Phase.IPC):
+            self._process_ipc(context, wal_writer, precommit_data, standby_db_info, instant_block_hash)
         wal_writer.close()
 
         try:
@@ -1955,10 +2202,18 @@ class IconServiceEngine(ContextContainer):
         if new_icon_score_mapper:
             IconScoreContext.icon_score_mapper.update(new_icon_score_mapper)
 
+        # Index event logs before writing states
+        # The index above the last block is removed on open() if the states are not written
+        if self._event_index is not None:
+            self._event_index.commit(precommit_data.block.height,
+                                     precommit_data.block_result,
+                                     int(precommit_data.logs_bloom))
+
         self._icx_context_db.write_batch(context, state_wal)
 
         context.storage.icx.set_last_block(precommit_data.block_batch.block)
-        self._precommit_data_manager.commit(precommit_data.block_batch.block)
+        self._precommit_data_manager.commit(precommit_data)
+        self._clear_query_cache()
 
         # after status DB commit
         if precommit_data.precommit_flag & PrecommitFlag.STEP_ALL_CHANGED != PrecommitFlag.NONE:
@@ -2006,7 +2261,6 @@ class IconServiceEngine(ContextContainer):
         context.engine.iiss.send_commit(
             precommit_data.block.height, commit_block_hash)
         wal_writer.write_state(WALState.SEND_COMMIT_BLOCK.value, add=True)
-        wal_writer.flush()
 
         if standby_db_info is not None:
             iiss_db_path: str = context.storage.rc.rename_standby_db_to_iiss_db(standby_db_info.path)
@@ -2021,9 +2275,12 @@ class IconServiceEngine(ContextContainer):
         """
         Logger.warning(tag=self.TAG, msg=f"remove_precommit_state() start: height={block_height}")
 
-        self._precommit_data_manager.validate_precommit_block(instant_block_hash)
+        self._precommit_data_manager.validate_precommit_block(instant_block_hash, allow_uncommitted_parent=True)
         self._precommit_data_manager.remove_precommit_state(instant_block_hash)
 
+        if self._block_profiler is not None:
+            self._block_profiler.discard(instant_block_hash)
+
         Logger.warning(tag=self.TAG, msg="remove_precommit_state() end")
 
     def rollback(self, block_height: int, block_hash: bytes) -> dict:
@@ -2042,6 +2299,9 @@ class IconServiceEngine(ContextContainer):
         # If rollback is not possible for the current state,
         # self._is_rollback_needed() should raise an InternalServiceErrorException
         try:
+            # Backup files should be completely written before checking them
+            self._backup_manager.wait()
+
             if self._is_rollback_needed(last_block, block_height, block_hash):
                 # Get the start block height of this term
                 term_start_block_height: int = IconScoreContext.engine.prep.term.start_block_height
@@ -2058,6 +2318,12 @@ class IconServiceEngine(ContextContainer):
 
                 self._remove_rollback_metadata()
 
+                # Remove obsolete block backup files used for rollback
+                if block_height + 1 < last_block.height:
+                    self._backup_cleaner.run(
+                        start_block_height=block_height + 1,
+                        end_block_height=last_block.height - 1)
+
         except BaseException as e:
             Logger.error(tag=ROLLBACK_LOG_TAG, msg=str(e))
             raise InternalServiceErrorException(
@@ -2079,7 +2345,12 @@ class IconServiceEngine(ContextContainer):
             # No need to rollback
             return False
 
-        if check_backup_exists(self._backup_root_path, last_block.height, block_height):
+        if self._backup_db is not None:
+            backup_exists: bool = self._backup_db.exists(last_block.height, block_height)
+        else:
+            backup_exists: bool = check_backup_exists(self._backup_root_path, last_block.height, block_height)
+
+        if backup_exists:
             # There are enough backup files to rollback
             return True
 
@@ -2104,12 +2375,20 @@ class IconServiceEngine(ContextContainer):
 
         # Rollback state_db and rc_data_db to those of a given block_height
         rollback_manager = RollbackManager(
-            self._backup_root_path, self._rc_data_path, self._icx_context_db.key_value_db)
+            self._backup_root_path, self._rc_data_path, self._icx_context_db.key_value_db, self._backup_db)
         rollback_manager.run(
             last_block_height=context.block.height,
             rollback_block_height=rollback_block_height,
             term_start_block_height=term_start_block_height)
 
+        # Drop cached states which might be newer than those of rollback_block_height
+        self._icx_context_db.key_value_db.clear_cache()
+        self._clear_query_cache()
+
+        # Remove the event logs in the blocks which have been rolled back
+        if self._event_index is not None:
+            self._event_index.rollback(rollback_block_height)
+
         # Rollback the state of reward_calculator prior to iconservice
         IconScoreContext.engine.iiss.rollback_reward_calculator(rollback_block_height, rollback_block_hash)
 
@@ -2171,8 +2450,11 @@ class IconServiceEngine(ContextContainer):
             IconScoreContextType.QUERY, block=self._get_last_block()
         )
 
-        self._set_revision_to_context(context)
-        return inner_call(context, request)
+        try:
+            self._set_revision_to_context(context)
+            return inner_call(context, request)
+        finally:
+            context.release_snapshots()
 
     def _recover_dbs(self, rc_data_path: str):
         """
@@ -2193,7 +2475,7 @@ class IconServiceEngine(ContextContainer):
         if metadata:
             # Resume the previous rollback for the databases managed by iconservice
             rollback_manager = RollbackManager(
-                self._backup_root_path, self._rc_data_path, self._icx_context_db.key_value_db)
+                self._backup_root_path, self._rc_data_path, self._icx_context_db.key_value_db, self._backup_db)
             rollback_manager.run(
                 last_block_height=metadata.last_block.height,
                 rollback_block_height=metadata.block_height,
@@ -2414,6 +2696,77 @@ class IconServiceEngine(ContextContainer):
 
         Logger.info(tag=self.TAG, msg=f"{ConfigKey.BLOCK_INVOKE_TIMEOUT}: {self._block_invoke_timeout_s}")
 
+    def _set_speculative_executor(self, conf: Dict[str, Union[str, int]]):
+        if not conf.get(ConfigKey.PARALLEL_TX_EXECUTION, False):
+            return
+
+        max_workers: int = conf.get(ConfigKey.PARALLEL_TX_WORKERS, PARALLEL_TX_WORKERS)
+        self._speculative_executor = SpeculativeExecutor(max_workers)
+
+        Logger.info(tag=self.TAG, msg=f"{ConfigKey.PARALLEL_TX_WORKERS}: {max_workers}")
+
+    def _set_query_cache(self, conf: Dict[str, Union[str, int]]):
+        max_size: int = conf.get(ConfigKey.QUERY_CACHE_SIZE, QUERY_CACHE_SIZE)
+        if max_size <= 0:
+            return
+
+        excludes: List['Address'] = \
+            [Address.from_string(address) for address in conf.get(ConfigKey.QUERY_CACHE_EXCLUDES, [])]
+        self._query_cache = IconScoreQueryCache(max_size, excludes)
+
+        Logger.info(tag=self.TAG, msg=f"{ConfigKey.QUERY_CACHE_SIZE}: {max_size} "
+                                      f"{ConfigKey.QUERY_CACHE_EXCLUDES}: {excludes}")
+
+    def _set_block_profiler(self, conf: Dict[str, Union[str, int]]):
+        max_blocks: int = conf.get(ConfigKey.BLOCK_PROFILER_SIZE, BLOCK_PROFILER_SIZE)
+        if max_blocks <= 0:
+            return
+
+        dump_path: str = conf.get(ConfigKey.BLOCK_PROFILER_DUMP_PATH, "")
+        self._block_profiler = BlockProfiler(max_blocks, dump_path)
+
+        Logger.info(tag=self.TAG, msg=f"{ConfigKey.BLOCK_PROFILER_SIZE}: {max_blocks} "
+                                      f"{ConfigKey.BLOCK_PROFILER_DUMP_PATH}: {dump_path}")
+
+    @staticmethod
+    def _set_score_warm_up(conf: Dict[str, Union[str, int]], score_root_path: str):
+        """Import the most called SCOREs of the last run in background
+
+        :param conf:
+        :param score_root_path:
+        """
+        max_scores: int = conf.get(ConfigKey.SCORE_WARM_UP, 0)
+        if max_scores <= 0:
+            return
+
+        score_warm_up = ScoreWarmUp(score_root_path, max_scores)
+        score_warm_up.start()
+        IconScoreContext.score_warm_up = score_warm_up
+
+        Logger.info(tag=IconServiceEngine.TAG, msg=f"{ConfigKey.SCORE_WARM_UP}: {max_scores}")
+
+    def _set_event_index(self, conf: Dict[str, Union[str, int]]):
+        if not conf.get(ConfigKey.EVENT_INDEX, False):
+            return
+
+        self._event_index = EventIndex.from_path(os.path.join(self._state_db_root_path, EVENT_INDEX_DB))
+
+        # Remove the event logs in the block whose states had not been written to StateDB
+        last_block: Optional['Block'] = self._get_last_block()
+        self._event_index.rollback(-1 if last_block is None else last_block.height)
+
+        Logger.info(tag=self.TAG, msg=f"{ConfigKey.EVENT_INDEX}: "
+                                      f"lastBlockHeight={self._event_index.last_block_height}")
+
+    def _clear_query_cache(self):
+        """Drop the query results of the previous block
+        """
+        if self._query_cache is None:
+            return
+
+        Logger.debug(tag=self.TAG, msg=f"{self._query_cache}")
+        self._query_cache.clear()
+
     def _continue_to_invoke(self, tx_request: Dict, tx_timer: 'Timer') -> bool:
         """If this is a block created by a leader,
         check to continue transaction invoking with block_invoke_timeout
@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TypeVar, Optional, Any, Union, TYPE_CHECKING
+from typing import TypeVar, Optional, Any, Union, TYPE_CHECKING, Dict, List
 
 from iconservice.icon_constant import IconScoreContextType, Revision
 from iconservice.iconscore.icon_score_context import ContextContainer
@@ -32,11 +32,32 @@ ARRAY_DB_ID = b'\x00'
 DICT_DB_ID = b'\x01'
 VAR_DB_ID = b'\x02'
 
+# ArrayDB with fewer elements than this reads them one by one instead of at once
+BULK_READ_MIN_SIZE = 16
+# The number of elements read at once, which bounds the reads not charged yet when iteration stops early
+BULK_READ_CHUNK_SIZE = 64
+
 
 def get_encoded_key(key: V) -> bytes:
     return ContainerUtil.encode_key(key)
 
 
+def _encode_str(key: str) -> bytes:
+    return key.encode('utf-8')
+
+
+def _encode_bytes(key: bytes) -> bytes:
+    return key
+
+
+_KEY_ENCODERS = {
+    int: int_to_bytes,
+    str: _encode_str,
+    Address: Address.to_bytes,
+    bytes: _encode_bytes
+}
+
+
 class ContainerUtil(object):
 
     @classmethod
@@ -55,8 +76,7 @@ class ContainerUtil(object):
         else:
             raise InvalidParamsException(f'Unsupported container class: {container_cls}')
 
-        encoded_key: bytes = get_encoded_key(var_key)
-        return b'|'.join([container_id, encoded_key])
+        return container_id + b'|' + get_encoded_key(var_key)
 
     @classmethod
     def encode_key(cls, key: K) -> bytes:
@@ -65,6 +85,11 @@ class ContainerUtil(object):
         :param key:
         :return:
         """
+        # Dispatch on the exact type first and fall back to isinstance() for subclasses
+        encode = _KEY_ENCODERS.get(type(key))
+        if encode is not None:
+            return encode(key)
+
         if key is None:
             raise InvalidParamsException('key is None')
 
@@ -200,7 +225,20 @@ class DictDB(object):
             encoded_key: bytes = get_encoded_key(key)
             return ContainerUtil.decode_object(self._db.get(encoded_key), self.__value_type)
         else:
-            return DictDB(key, self._db, self.__value_type, self.__depth - 1)
+            return self.__get_sub_dict(key)
+
+    def __get_sub_dict(self, key: K) -> 'DictDB':
+        """Same as DictDB(key, self._db, value_type, depth - 1)
+        without resolving the container class and validating the prefix again
+
+        :param key:
+        :return: DictDB of the next depth
+        """
+        sub_dict = DictDB.__new__(DictDB)
+        sub_dict._db = self._db.get_sub_db(DICT_DB_ID + b'|' + get_encoded_key(key))
+        sub_dict.__value_type = self.__value_type
+        sub_dict.__depth = self.__depth - 1
+        return sub_dict
 
     def __delitem__(self, key: K):
         self.__remove(key)
@@ -219,6 +257,31 @@ class DictDB(object):
     def __iter__(self):
         raise InvalidContainerAccessException("Iteration not supported in DictDB")
 
+    def keys(self, key_type: type = bytes) -> List[K]:
+        """
+        Returns all keys in this DictDB in the order of their encoded bytes
+        Costs the same step as reading the value of every key
+
+        An encoded key containing b'|' cannot be told apart from a key of another container
+        whose name starts with the name of this one and b'|', so InvalidContainerAccessException
+        is raised if any is found.
+
+        :param key_type: type to decode keys to: int, str, Address, bytes
+        :return: keys
+        """
+        if not _is_bulk_access_enabled():
+            raise InvalidContainerAccessException("Iteration not supported in DictDB")
+        if self.__depth != 1:
+            raise InvalidContainerAccessException('DictDB depth mismatch')
+
+        keys: List[K] = []
+        for key, _ in self._db.iterator():
+            if b'|' in key:
+                raise InvalidContainerAccessException(f"Ambiguous key in DictDB: {key.hex()}")
+            keys.append(ContainerUtil.decode_object(key, key_type))
+
+        return keys
+
 
 class ArrayDB(object):
     """
@@ -311,7 +374,11 @@ class ArrayDB(object):
         else:
             raise InvalidParamsException('ArrayDB out of index')
 
-    def __getitem__(self, index: int) -> V:
+    def __getitem__(self, index: Union[int, slice]) -> Union[V, List[V]]:
+        if isinstance(index, slice) and _is_bulk_access_enabled():
+            size: int = self.__get_size()
+            return list(self._get_generator(self._db, size, self.__value_type, range(*index.indices(size))))
+
         return self._get(self._db, self.__get_size(), index, self.__value_type)
 
     def __contains__(self, item: V):
@@ -342,9 +409,26 @@ class ArrayDB(object):
         raise InvalidParamsException('ArrayDB out of index')
 
     @classmethod
-    def _get_generator(cls, db: Union['IconScoreDatabase', 'IconScoreSubDatabase'], size: int, value_type: type):
-        for index in range(size):
-            yield cls._get(db, size, index, value_type)
+    def _get_generator(cls,
+                       db: Union['IconScoreDatabase', 'IconScoreSubDatabase'],
+                       size: int,
+                       value_type: type,
+                       indexes: Optional[range] = None):
+        if indexes is None:
+            indexes = range(size)
+
+        if len(indexes) < BULK_READ_MIN_SIZE:
+            for index in indexes:
+                yield cls._get(db, size, index, value_type)
+            return
+
+        # Only the elements in indexes are read in chunks
+        # and the step for each element is charged when it is returned as before
+        for i in range(0, len(indexes), BULK_READ_CHUNK_SIZE):
+            keys: List[bytes] = [get_encoded_key(index) for index in indexes[i:i + BULK_READ_CHUNK_SIZE]]
+            items: Dict[bytes, Optional[bytes]] = db.get_items(keys)
+            for key in keys:
+                yield ContainerUtil.decode_object(db.get_from_items(key, items), value_type)
 
 
 class VarDB(object):
@@ -386,6 +470,11 @@ class VarDB(object):
         self._db.delete(self.__var_byte_key)
 
 
+def _is_bulk_access_enabled() -> bool:
+    context = ContextContainer._get_context()
+    return context.revision >= Revision.CONTAINER_DB_BULK_ACCESS.value
+
+
 def get_default_value(value_type: type) -> Any:
     if value_type == int:
         return 0
@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from .icon_score_step import get_input_data_size
 from ..base.address import Address, ZERO_SCORE_ADDRESS, generate_score_address
@@ -90,7 +90,7 @@ class IconPreValidator:
         else:
             IconPreValidator._check_input_data_type(input_data)
 
-        IconPreValidator._check_input_data_size(input_data)
+        IconPreValidator._check_input_data_size(input_data, params.get('txHash'))
 
     @staticmethod
     def _check_message_data(data: Any):
@@ -123,7 +123,7 @@ class IconPreValidator:
             raise InvalidRequestException('Invalid data type')
 
     @staticmethod
-    def _check_input_data_size(input_data: Any):
+    def _check_input_data_size(input_data: Any, tx_hash: Optional[bytes] = None):
         """
         Validates transaction data whether total bytes is less than MAX_DATA_SIZE
         If the property is a key-value object, counts key and value.
@@ -133,10 +133,11 @@ class IconPreValidator:
         But the field of 'data' has not been converted (TypeConvert marks it as LATER)
 
         :param input_data: data field of icx_sendTransaction JSON-RPC request
+        :param tx_hash: hash of the transaction
         """
 
         if input_data is not None:
-            size = get_input_data_size(Revision.LATEST.value, input_data)
+            size = get_input_data_size(Revision.LATEST.value, input_data, tx_hash)
 
             if size > MAX_DATA_SIZE:
                 raise InvalidRequestException('Invalid message length')
@@ -28,7 +28,6 @@ from .icon_score_constant import CONST_INDEXED_ARGS_COUNT, FORMAT_IS_NOT_FUNCTIO
 from .icon_score_context import ContextGetter, IconScoreContextType
 from .icon_score_context_util import IconScoreContextUtil
 from .icon_score_event_log import EventLogEmitter
-from .icon_score_step import StepType
 from .icx import Icx
 from .internal_call import InternalCall
 from ..base.address import Address, GOVERNANCE_SCORE_ADDRESS
@@ -481,7 +480,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
             length = 1
             if value:
                 length = len(value)
-            context.step_counter.apply_step(StepType.GET, length)
+            context.step_counter.charge_get(length)
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -503,12 +502,10 @@ class IconScoreBase(IconScoreObject, ContextGetter,
         if context and context.step_counter and not context.readonly:
             if old_value:
                 # modifying a value
-                context.step_counter.apply_step(
-                    StepType.REPLACE, len(new_value))
+                context.step_counter.charge_replace(len(new_value))
             else:
                 # newly storing a value
-                context.step_counter.apply_step(
-                    StepType.SET, len(new_value))
+                context.step_counter.charge_set(len(new_value))
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -525,8 +522,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
         """
 
         if context and context.step_counter and not context.readonly:
-            context.step_counter.apply_step(
-                StepType.DELETE, len(old_value))
+            context.step_counter.charge_delete(len(old_value))
 
     @property
     def msg(self) -> 'Message':
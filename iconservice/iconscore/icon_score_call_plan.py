@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple
+
+from .icon_score_constant import CONST_CLASS_CALL_PLANS
+from ..base.address import Address
+from ..base.type_converter import TypeConverter
+from ..utils import get_main_type_from_annotations_type
+
+if TYPE_CHECKING:
+    from .icon_score_base import IconScoreBase
+
+# Values of these types can be shared without copying
+_IMMUTABLE_TYPES = frozenset((int, str, bytes, bool, Address, type(None)))
+
+_CONVERTERS = {
+    int: TypeConverter._convert_value_int,
+    str: TypeConverter._convert_value_string,
+    bool: TypeConverter._convert_value_bool,
+    Address: TypeConverter._convert_value_address,
+    bytes: TypeConverter._convert_value_bytes
+}
+
+
+def copy_if_mutable(value: Any) -> Any:
+    """Returns a deep copy of a value only if it can be changed in place
+
+    :param value:
+    :return:
+    """
+    return value if type(value) in _IMMUTABLE_TYPES else deepcopy(value)
+
+
+class CallPlan(object):
+    """Precomputed information used to call an external method of a SCORE class
+
+    Resolving the annotations of a method with typing.get_type_hints() is expensive,
+    so it is done only once per SCORE class and method.
+    """
+    __slots__ = ("func_name", "converters")
+
+    def __init__(self, func_name: str, converters: Tuple[Tuple[str, Callable[[Any], Any]], ...]):
+        """Constructor
+
+        :param func_name:
+        :param converters: (parameter name, function converting a parameter to its annotated type)
+        """
+        self.func_name = func_name
+        self.converters = converters
+
+    @staticmethod
+    def from_method(func_name: str, func: callable) -> 'CallPlan':
+        converters = []
+
+        annotations: dict = TypeConverter.make_annotations_from_method(func)
+        for key, annotation in annotations.items():
+            if key == 'self' or key == 'cls':
+                continue
+
+            converter = _CONVERTERS.get(get_main_type_from_annotations_type(annotation))
+            if converter is not None:
+                converters.append((key, converter))
+
+        return CallPlan(func_name, tuple(converters))
+
+    def convert_params(self, kw_params: dict) -> dict:
+        """Convert the params of icx_call or icx_sendTransaction to the annotated types
+
+        :param kw_params: params which are not changed
+        :return: converted params
+        """
+        params = {key: copy_if_mutable(value) for key, value in kw_params.items()}
+
+        for key, converter in self.converters:
+            value = params.get(key)
+            if value is not None:
+                params[key] = converter(value)
+
+        return params
+
+
+def get_call_plan(icon_score: 'IconScoreBase', func_name: str) -> 'CallPlan':
+    """Returns the call plan of a method cached in the class of a given SCORE
+
+    A SCORE class is loaded for each deployment and kept by IconScoreInfo,
+    so the cached plans are dropped together with the class on update.
+
+    :param icon_score: SCORE instance
+    :param func_name: name of an external method which has already been validated
+    :return:
+    """
+    score_class = type(icon_score)
+
+    # Look up the class itself to prevent a subclass from using the plans of its base class
+    plans: Dict[str, 'CallPlan'] = score_class.__dict__.get(CONST_CLASS_CALL_PLANS)
+    if plans is None:
+        plans = {}
+        setattr(score_class, CONST_CLASS_CALL_PLANS, plans)
+
+    plan: 'CallPlan' = plans.get(func_name)
+    if plan is None:
+        plan = CallPlan.from_method(func_name, getattr(icon_score, func_name))
+        plans[func_name] = plan
+
+    return plan
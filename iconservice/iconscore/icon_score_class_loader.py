@@ -89,8 +89,12 @@ class IconScoreClassLoader(object):
         package_json: dict = IconScoreClassLoader._load_package_json(score_deploy_path)
         main_module, main_score = IconScoreClassLoader._get_package_info(package_json)
 
-        # In order for the new module to be noticed by the import system
-        importlib.invalidate_caches()
-        module = importlib.import_module(f".{main_module}", package_name)
+        try:
+            module = importlib.import_module(f".{main_module}", package_name)
+        except ModuleNotFoundError:
+            # In order for the new module to be noticed by the import system
+            # Invalidating caches on every loading makes the import system rescan the score root path
+            importlib.invalidate_caches()
+            module = importlib.import_module(f".{main_module}", package_name)
 
         return getattr(module, main_score)
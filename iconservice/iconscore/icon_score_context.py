@@ -17,7 +17,7 @@
 import threading
 import warnings
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Optional, List, Set, Dict
 
 from iconcommons.logger import Logger
 
@@ -37,9 +37,13 @@ if TYPE_CHECKING:
     from .icon_score_base import IconScoreBase
     from .icon_score_event_log import EventLog
     from .icon_score_step import IconScoreStepCounter, IconScoreStepCounterFactory
+    from .score_warm_up import ScoreWarmUp
     from ..base.address import Address
+    from ..database.db import KeyValueDatabase, DatabaseSnapshot
     from ..prep.data import PRep, PRepContainer, Term
+    from ..precommit_data_manager import PrecommitData
     from ..utils import ContextEngine, ContextStorage
+    from ..utils.profiler import BlockProfile
 
 _thread_local_data = threading.local()
 
@@ -121,6 +125,8 @@ class IconScoreContext(object):
     precommitdata_log_flag = False
     step_trace_flag: bool = False
     log_level: str = None
+    score_instance_pool: bool = False
+    score_warm_up: Optional['ScoreWarmUp'] = None
 
     """Contains the useful information to process user's JSON-RPC request
     """
@@ -161,6 +167,15 @@ class IconScoreContext(object):
 
         self.regulator: Optional['Regulator'] = None
 
+        # Keys read from block_batch or StateDB (only recorded on speculative execution)
+        self.read_set: Optional[Set[bytes]] = None
+
+        # Snapshots of StateDB which a query reads from (only used on QUERY and ESTIMATION)
+        self.snapshots: Optional[Dict['KeyValueDatabase', 'DatabaseSnapshot']] = None
+
+        # Time spent in each phase of the block being invoked or committed (None: profiling is disabled)
+        self.profile: Optional['BlockProfile'] = None
+
     @classmethod
     def set_decentralize_trigger(cls, decentralize_trigger: float):
         decentralize_trigger: float = decentralize_trigger
@@ -281,6 +296,17 @@ class IconScoreContext(object):
 
         Logger.info(tag=self.TAG, msg=f"_update_main_prep_endpoint_in_term: {dirty_prep}")
 
+    def release_snapshots(self):
+        """Release the snapshots acquired while processing a query
+        """
+        if not self.snapshots:
+            return
+
+        for key_value_db, snapshot in self.snapshots.items():
+            key_value_db.release_snapshot(snapshot)
+
+        self.snapshots.clear()
+
     def clear_batch(self):
         if self.tx_batch:
             self.tx_batch.clear()
@@ -325,7 +351,17 @@ class IconScoreContextFactory(object):
     def __init__(self, step_counter_factory: 'IconScoreStepCounterFactory'):
         self.step_counter_factory = step_counter_factory
 
-    def create(self, context_type: 'IconScoreContextType', block: 'Block'):
+    def create(self,
+               context_type: 'IconScoreContextType',
+               block: 'Block',
+               parent: Optional['PrecommitData'] = None):
+        """Create a new context
+
+        :param context_type:
+        :param block:
+        :param parent: precommit data of the uncommitted block which the block is invoked on top of
+        :return:
+        """
         context: 'IconScoreContext' = IconScoreContext(context_type)
         context.block = block
 
@@ -333,10 +369,40 @@ class IconScoreContextFactory(object):
             return context
 
         self._set_step_counter(context)
-        self._set_context_attributes_for_processing_tx(context)
+        self._set_context_attributes_for_processing_tx(context, parent)
+
+        if context_type in (IconScoreContextType.QUERY, IconScoreContextType.ESTIMATION):
+            # Every read on a query goes through the same snapshot of the last committed state
+            context.snapshots = {}
 
         return context
 
+    def create_speculative(self, context: 'IconScoreContext') -> 'IconScoreContext':
+        """Create a context to execute a transaction speculatively
+        against the block states of a given invoke context
+
+        State changes are kept in its own tx_batch and the keys it reads are recorded in read_set
+
+        :param context: invoke context
+        :return:
+        """
+        speculative_context: 'IconScoreContext' = IconScoreContext(IconScoreContextType.INVOKE)
+        speculative_context.block = context.block
+        speculative_context.revision = context.revision
+        self._set_step_counter(speculative_context)
+
+        speculative_context.block_batch = context.block_batch
+        speculative_context.tx_batch = TransactionBatch()
+        speculative_context.new_icon_score_mapper = context.new_icon_score_mapper
+        speculative_context.read_set = set()
+
+        # Readonly
+        speculative_context._preps = context.preps
+        speculative_context._tx_dirty_preps = OrderedDict()
+        speculative_context._term = context.term
+
+        return speculative_context
+
     @staticmethod
     def _is_step_trace_on(context: 'IconScoreContext') -> bool:
         return context.step_trace_flag and context.type == IconScoreContextType.INVOKE
@@ -349,14 +415,19 @@ class IconScoreContextFactory(object):
             context.step_counter = self.step_counter_factory.create(context.type, step_trace_flag)
 
     @staticmethod
-    def _set_context_attributes_for_processing_tx(context: 'IconScoreContext'):
+    def _set_context_attributes_for_processing_tx(context: 'IconScoreContext',
+                                                  parent: Optional['PrecommitData']):
         if context.type in (IconScoreContextType.INVOKE, IconScoreContextType.ESTIMATION):
             context.block_batch = BlockBatch(Block.from_block(context.block))
             context.tx_batch = TransactionBatch()
             context.new_icon_score_mapper = IconScoreMapper()
 
             # For PRep management
-            context._preps = context.engine.prep.preps.copy(mutable=True)
+            if parent is None:
+                context._preps = context.engine.prep.preps.copy(mutable=True)
+            else:
+                context.block_batch.parent = parent.block_batch
+                context._preps = parent.preps.copy(mutable=True)
             context._tx_dirty_preps = OrderedDict()
             if context.engine.prep.term:
                 context._term = context.engine.prep.term.copy()
@@ -19,6 +19,8 @@ from typing import TYPE_CHECKING, Optional, Tuple
 
 from .icon_score_class_loader import IconScoreClassLoader
 from .icon_score_mapper_object import IconScoreInfo
+from .score_bytecode_cache import ScoreBytecodeCache
+from .score_instance_auditor import ScoreInstanceAuditor
 from .score_package_validator import ScorePackageValidator
 from .utils import get_package_name_by_address_and_tx_hash, get_score_deploy_path
 from ..base.address import Address, ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
@@ -31,6 +33,7 @@ if TYPE_CHECKING:
     from .icon_score_context import IconScoreContext
     from .icon_score_base import IconScoreBase
     from .icon_score_mapper import IconScoreMapper
+    from .score_warm_up import ScoreWarmUp
     from ..deploy.storage import IconScoreDeployTXParams, IconScoreDeployInfo
 
 
@@ -89,9 +92,15 @@ class IconScoreContextUtil(object):
         if score_info is None:
             return None
 
+        score_warm_up: Optional['ScoreWarmUp'] = context.score_warm_up
+        if score_warm_up is not None:
+            score_warm_up.count(address, score_info.tx_hash)
+
         # Create a SCORE instance every time
         # to prevent consensus failure by using wrong member variables in SCORE
-        return score_info.get_score(context.revision)
+        # unless the SCORE has no member variables except container DBs and constants
+        reusable: bool = context.score_instance_pool and ScoreInstanceAuditor.is_reusable(score_info.score_class)
+        return score_info.get_score(context.revision, reusable)
 
     @staticmethod
     def get_score_info(context: 'IconScoreContext', address: 'Address') -> Optional['IconScoreInfo']:
@@ -155,7 +164,14 @@ class IconScoreContextUtil(object):
         score_package_name: str = get_package_name_by_address_and_tx_hash(address, tx_hash)
         import_whitelist: dict = IconScoreContextUtil._get_import_whitelist(context)
 
+        # Skip the SCORE which has already been validated and compiled with the same contents
+        content_hash: bytes = ScoreBytecodeCache.make_content_hash(score_deploy_path)
+        whitelist_hash: bytes = ScoreBytecodeCache.make_whitelist_hash(import_whitelist)
+        if ScoreBytecodeCache.is_valid(score_deploy_path, content_hash, whitelist_hash):
+            return
+
         ScorePackageValidator.execute(import_whitelist, score_deploy_path, score_package_name)
+        ScoreBytecodeCache.write(score_deploy_path, content_hash, whitelist_hash)
 
     @staticmethod
     def _get_import_whitelist(context: 'IconScoreContext') -> dict:
@@ -16,16 +16,15 @@
 """IconScoreEngine module
 """
 
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
+from .icon_score_call_plan import copy_if_mutable, get_call_plan
 from .icon_score_constant import STR_FALLBACK, ATTR_SCORE_GET_API, ATTR_SCORE_CALL, \
     ATTR_SCORE_VALIDATATE_EXTERNAL_METHOD
 from .icon_score_context import IconScoreContext
 from .icon_score_context_util import IconScoreContextUtil
 from ..base.address import Address, ZERO_SCORE_ADDRESS
 from ..base.exception import ScoreNotFoundException, InvalidParamsException
-from ..base.type_converter import TypeConverter
 
 if TYPE_CHECKING:
     from ..iconscore.icon_score_base import IconScoreBase
@@ -114,19 +113,14 @@ class IconScoreEngine(object):
         ret = score_func(func_name=func_name, kw_params=converted_params)
 
         # No problem even though ret is None
-        return deepcopy(ret)
+        return copy_if_mutable(ret)
 
     @staticmethod
     def _convert_score_params_by_annotations(icon_score: 'IconScoreBase', func_name: str, kw_params: dict) -> dict:
-        tmp_params = deepcopy(kw_params)
-
         validate_external_method = getattr(icon_score, ATTR_SCORE_VALIDATATE_EXTERNAL_METHOD)
         validate_external_method(func_name)
 
-        score_func = getattr(icon_score, func_name)
-        annotation_params = TypeConverter.make_annotations_from_method(score_func)
-        TypeConverter.convert_data_params(annotation_params, tmp_params)
-        return tmp_params
+        return get_call_plan(icon_score, func_name).convert_params(kw_params)
 
     @staticmethod
     def _fallback(context: 'IconScoreContext',
@@ -26,6 +26,9 @@ if TYPE_CHECKING:
     from .icon_score_constant import BaseType
     from .icon_score_context import IconScoreContext
 
+# Single bytes which prefix the bloom data of an indexed item with its index
+_INDEX_BYTES = tuple(i.to_bytes(1, DATA_BYTE_ORDER) for i in range(256))
+
 
 class EventLog(object):
     """ A DataClass of a event log.
@@ -148,7 +151,7 @@ class EventLogEmitter(object):
 
     @staticmethod
     def get_ordered_bytes(index: int, data: 'BaseType') -> bytes:
-        bloom_data = index.to_bytes(1, DATA_BYTE_ORDER)
+        bloom_data: bytes = _INDEX_BYTES[index]
         if data is not None:
             bloom_data += EventLogEmitter.__get_bytes_from_base_type(data)
         return bloom_data
@@ -43,6 +43,13 @@ class IconScoreMapper(object):
         else:
             self._lock = None
 
+    def __len__(self) -> int:
+        if self._lock is None:
+            return len(self._score_mapper)
+
+        with self._lock:
+            return len(self._score_mapper)
+
     def __contains__(self, address: 'Address'):
         if self._lock is None:
             return address in self._score_mapper
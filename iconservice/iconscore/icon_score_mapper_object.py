@@ -14,7 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING
+from threading import local
+from typing import TYPE_CHECKING, Optional
 
 from ..base.address import Address, GOVERNANCE_SCORE_ADDRESS
 from ..base.exception import InvalidParamsException
@@ -42,6 +43,8 @@ class IconScoreInfo(object):
         self._score_class = score_class
         self._score_db = score_db
         self._score = None
+        # SCORE instance reused by each thread
+        self._local = local()
 
     @property
     def tx_hash(self) -> bytes:
@@ -59,12 +62,14 @@ class IconScoreInfo(object):
     def address(self) -> 'Address':
         return self._score_db.address
 
-    def get_score(self, revision: int) -> 'IconScoreBase':
+    def get_score(self, revision: int, reusable: bool = False) -> 'IconScoreBase':
         """Provide a score instance according to the revision.
         1. revision <= 2: Returns a cached score instance
-        2. revision > 2: Returns a newly created score instance
+        2. revision > 2 and reusable: Returns a score instance cached per thread
+        3. revision > 2: Returns a newly created score instance
 
         :param revision:
+        :param reusable: whether the SCORE keeps no state in its member variables
         :return:
         """
         if revision <= Revision.TWO.value or self.address == GOVERNANCE_SCORE_ADDRESS:
@@ -73,6 +78,15 @@ class IconScoreInfo(object):
 
             return self._score
 
+        if reusable:
+            # Not shared between threads, e.g. query workers, to keep the context of icx in each instance safe
+            score: Optional['IconScoreBase'] = getattr(self._local, "score", None)
+            if score is None:
+                score = self.create_score()
+                self._local.score = score
+
+            return score
+
         return self.create_score()
 
     def create_score(self) -> 'IconScoreBase':
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..base.address import Address
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a value to a hashable one regardless of the order of dict keys
+
+    :param value: params of icx_call
+    :return:
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+
+    return value
+
+
+def _estimate_size(value: Any) -> int:
+    """Returns the approximate number of bytes which a value occupies in memory
+
+    :param value:
+    :return:
+    """
+    size: int = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _estimate_size(k) + _estimate_size(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            size += _estimate_size(v)
+
+    return size
+
+
+class IconScoreQueryCache(object):
+    """Caches the results of readonly external calls on the last committed block
+
+    A readonly external method returns the same result for the same request
+    until the state is changed by the next block.
+    The whole cache is dropped whenever a block is committed or rolled back.
+    It is shared by query workers.
+    """
+
+    def __init__(self, max_size: int, excludes: Iterable['Address'] = ()):
+        """Constructor
+
+        :param max_size: the maximum bytes of cached results and their keys
+        :param excludes: SCOREs whose results are not cached
+        """
+        assert max_size > 0
+
+        self._max_size = max_size
+        self._excludes = frozenset(excludes)
+        self._lock = Lock()
+        # key -> (result, size)
+        self._items = OrderedDict()
+        self._size = 0
+        # Increased whenever the cache is cleared
+        # to prevent a result of the previous block being cached after clear()
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def hit_rate(self) -> float:
+        total: int = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def is_cacheable(self, address: 'Address') -> bool:
+        return address not in self._excludes
+
+    @staticmethod
+    def make_key(block_hash: Optional[bytes], params: dict) -> tuple:
+        """Make a cache key for an icx_call request
+
+        :param block_hash: hash of the last committed block
+        :param params: params of icx_call which have already been converted to proper types
+        :return:
+        """
+        data: dict = params.get('data') or {}
+        return (block_hash,
+                params.get('to'),
+                params.get('from'),
+                params.get('stepLimit'),
+                data.get('method'),
+                _freeze(data.get('params')))
+
+    def get(self, key: tuple) -> Tuple[bool, Any]:
+        """Returns a cached result for a given key
+
+        :param key:
+        :return: (hit, result)
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return False, None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+
+        # The response is converted in place by the caller
+        return True, deepcopy(item[0])
+
+    def put_if_unchanged(self, key: tuple, result: Any, generation: int):
+        """Cache a result only if the cache has not been cleared since the query started
+
+        :param key:
+        :param result:
+        :param generation: generation taken before executing the query
+        """
+        size: int = _estimate_size(key) + _estimate_size(result)
+        if size > self._max_size:
+            return
+
+        result = deepcopy(result)
+
+        with self._lock:
+            if generation != self._generation or key in self._items:
+                return
+
+            self._items[key] = (result, size)
+            self._size += size
+
+            while self._size > self._max_size:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._items.clear()
+            self._size = 0
+
+    def __str__(self):
+        return f"IconScoreQueryCache(max_size={self._max_size}, size={self._size}, items={len(self._items)}, " \
+               f"hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.3f})"
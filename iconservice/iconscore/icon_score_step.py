@@ -14,25 +14,76 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import re
+from collections import OrderedDict
 from enum import Enum, auto
 from threading import Lock
 from typing import TYPE_CHECKING, Any, List, Tuple, Optional
 
 from ..base.exception import ExceptionCode, IconServiceBaseException, InvalidRequestException
-from ..icon_constant import MAX_EXTERNAL_CALL_COUNT, Revision
+from ..icon_constant import MAX_EXTERNAL_CALL_COUNT, Revision, INPUT_DATA_SIZE_CACHE_SIZE
 from ..utils import to_camel_case, is_lowercase_hex_string, byte_length_of_int
 
 if TYPE_CHECKING:
     from iconservice.iconscore.icon_score_context import IconScoreContextType
 
 
-def get_input_data_size(revision: int, input_data: Any) -> int:
+# Characters which are escaped in a JSON string
+_JSON_ESCAPE = re.compile(r'[\x00-\x1f\\"]')
+_JSON_ESCAPED_CHARS = tuple(chr(i) for i in range(0x20)) + ('"', '\\')
+# The number of bytes added by escaping each character (others are escaped to \u00XX)
+_JSON_ESCAPE_EXTRA_SIZES = {'"': 1, '\\': 1, '\b': 1, '\f': 1, '\n': 1, '\r': 1, '\t': 1}
+_JSON_UNICODE_ESCAPE_EXTRA_SIZE = 5
+# Strings longer than this are checked for escaped characters with substring search instead of regex
+_JSON_LONG_STR_SIZE = 256
+
+
+class _InputDataSizeCache(object):
+    """Keeps the input data sizes of recent transactions by tx hash
+
+    The size of a transaction is computed on validation and reused on invoke.
+    A size is reused only for the input data equal to the one it was computed from,
+    so a tx hash given with other input data never gets the size of another transaction.
+    It is shared by the validation thread and the invoke thread.
+    """
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._lock = Lock()
+        self._items = OrderedDict()
+
+    def get(self, tx_hash: bytes, input_data: Any) -> int:
+        with self._lock:
+            item: Optional[Tuple[Any, int]] = self._items.get(tx_hash)
+            if item is not None:
+                self._items.move_to_end(tx_hash)
+
+        # Comparing input data is much cheaper than walking it again
+        if item is not None and (item[0] is input_data or item[0] == input_data):
+            return item[1]
+
+        size: int = get_json_size(input_data)
+
+        with self._lock:
+            self._items[tx_hash] = (input_data, size)
+            self._items.move_to_end(tx_hash)
+            if len(self._items) > self._capacity:
+                self._items.popitem(last=False)
+
+        return size
+
+
+_input_data_sizes = _InputDataSizeCache(INPUT_DATA_SIZE_CACHE_SIZE)
+
+
+def get_input_data_size(revision: int, input_data: Any, tx_hash: Optional[bytes] = None) -> int:
     """
     Returns size of input data of a transaction
 
     :param revision: current revision
     :param input_data: input data of transaction
+    :param tx_hash: hash of the transaction to reuse its size computed on validation
+        (None: not reused, which is required on estimation and query)
     :return: size of input data
     """
     if revision < Revision.THREE.value:
@@ -41,8 +92,87 @@ def get_input_data_size(revision: int, input_data: Any) -> int:
     if revision >= Revision.FOUR.value and input_data is None:
         return 0
 
-    data = json.dumps(input_data, ensure_ascii=False, separators=(',', ':'))
-    return len(data.encode())
+    if tx_hash is None:
+        return get_json_size(input_data)
+
+    return _input_data_sizes.get(tx_hash, input_data)
+
+
+def _get_json_float_size(value: float) -> int:
+    if value != value:
+        # NaN
+        return 3
+    if value in (float('inf'), float('-inf')):
+        # Infinity, -Infinity
+        return 8 if value > 0 else 9
+
+    return len(float.__repr__(value))
+
+
+def _get_json_str_size(value: str) -> int:
+    size: int = len(value.encode()) + 2
+
+    # Most strings, including long hex strings like deploy content, have nothing to escape
+    if len(value) < _JSON_LONG_STR_SIZE:
+        if value.isalnum() or _JSON_ESCAPE.search(value) is None:
+            return size
+    elif not any(c in value for c in _JSON_ESCAPED_CHARS):
+        return size
+
+    for m in _JSON_ESCAPE.finditer(value):
+        size += _JSON_ESCAPE_EXTRA_SIZES.get(m.group(), _JSON_UNICODE_ESCAPE_EXTRA_SIZE)
+
+    return size
+
+
+def _get_json_key_size(key: Any) -> int:
+    if isinstance(key, str):
+        return _get_json_str_size(key)
+    if isinstance(key, float):
+        return _get_json_float_size(key) + 2
+    if key is True or key is None:
+        return 6
+    if key is False:
+        return 7
+    if isinstance(key, int):
+        return len(int.__repr__(key)) + 2
+
+    raise TypeError(f'keys must be str, int, float, bool or None, not {key.__class__.__name__}')
+
+
+def get_json_size(data: Any) -> int:
+    """
+    Returns the number of bytes of data encoded in compact JSON without building it
+
+    The result is the same as len(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode())
+
+    :param data: input data of transaction
+    :return: size of data in JSON
+    """
+    if isinstance(data, str):
+        return _get_json_str_size(data)
+    if isinstance(data, dict):
+        # Braces, colons and commas
+        size: int = 2 + max(len(data) * 2 - 1, 0)
+        for k, v in data.items():
+            size += _get_json_key_size(k) + get_json_size(v)
+        return size
+    if isinstance(data, (list, tuple)):
+        # Brackets and commas
+        size: int = 2 + max(len(data) - 1, 0)
+        for v in data:
+            size += get_json_size(v)
+        return size
+    if data is None or data is True:
+        return 4
+    if data is False:
+        return 5
+    if isinstance(data, int):
+        return len(int.__repr__(data))
+    if isinstance(data, float):
+        return _get_json_float_size(data)
+
+    raise TypeError(f'Object of type {data.__class__.__name__} is not JSON serializable')
 
 
 def get_deploy_content_size(revision: int, content: str) -> int:
@@ -125,6 +255,30 @@ class StepType(AutoValueEnum):
     API_CALL = auto()
 
 
+# Index of each StepType in a step cost table
+_STEP_TYPE_INDEXES = {step_type: index for index, step_type in enumerate(StepType)}
+_GET_INDEX: int = _STEP_TYPE_INDEXES[StepType.GET]
+_SET_INDEX: int = _STEP_TYPE_INDEXES[StepType.SET]
+_REPLACE_INDEX: int = _STEP_TYPE_INDEXES[StepType.REPLACE]
+_DELETE_INDEX: int = _STEP_TYPE_INDEXES[StepType.DELETE]
+_DEFAULT_INDEX: int = _STEP_TYPE_INDEXES[StepType.DEFAULT]
+
+
+def compile_step_costs(step_costs: dict) -> List[int]:
+    """Returns a list of step costs indexed by the position of StepType
+
+    :param step_costs: StepType -> cost
+    :return: step cost table
+    """
+    table: List[int] = [0] * len(_STEP_TYPE_INDEXES)
+    for step_type, cost in step_costs.items():
+        index: Optional[int] = _STEP_TYPE_INDEXES.get(step_type)
+        if index is not None:
+            table[index] = cost
+
+    return table
+
+
 class IconScoreStepCounterFactory(object):
     """Creates a step counter for the transaction
     """
@@ -323,6 +477,7 @@ class IconScoreStepCounter(object):
         """
         self._step_price = step_price
         self._step_costs: dict = step_costs
+        self._step_cost_table: List[int] = compile_step_costs(step_costs)
         self._max_step_limit: int = max_step_limit
         self._step_limit: int = 0
         self._step_used: int = 0
@@ -361,7 +516,7 @@ class IconScoreStepCounter(object):
         :return: used steps in the transaction
         """
         return max(self._step_used,
-                   self._step_costs.get(StepType.DEFAULT, 0))
+                   self._step_cost_table[_DEFAULT_INDEX])
 
     @property
     def max_step_used(self) -> int:
@@ -379,19 +534,48 @@ class IconScoreStepCounter(object):
         """ Increases steps for given step cost
         """
 
-        if step_type == StepType.CONTRACT_CALL:
+        if step_type is StepType.CONTRACT_CALL:
             self._external_call_count += 1
             if self._external_call_count > MAX_EXTERNAL_CALL_COUNT:
                 raise InvalidRequestException('Too many external calls')
 
-        step: int = self._step_costs.get(step_type, 0) * count
+        step: int = self._step_cost_table[_STEP_TYPE_INDEXES[step_type]] * count
 
         return self.consume_step(step_type, step)
 
+    def charge_get(self, length: int) -> int:
+        """Same as apply_step(StepType.GET, length) for reading a value from db
+
+        :param length: length of the value read
+        """
+        return self.consume_step(StepType.GET, self._step_cost_table[_GET_INDEX] * length)
+
+    def charge_set(self, length: int) -> int:
+        """Same as apply_step(StepType.SET, length) for storing a new value to db
+
+        :param length: length of the value stored
+        """
+        return self.consume_step(StepType.SET, self._step_cost_table[_SET_INDEX] * length)
+
+    def charge_replace(self, length: int) -> int:
+        """Same as apply_step(StepType.REPLACE, length) for modifying a value in db
+
+        :param length: length of the new value
+        """
+        return self.consume_step(StepType.REPLACE, self._step_cost_table[_REPLACE_INDEX] * length)
+
+    def charge_delete(self, length: int) -> int:
+        """Same as apply_step(StepType.DELETE, length) for deleting a value from db
+
+        :param length: length of the value deleted
+        """
+        return self.consume_step(StepType.DELETE, self._step_cost_table[_DELETE_INDEX] * length)
+
     def consume_step(self, step_type: StepType, step: int) -> int:
         step_used: int = self._step_used + step
 
-        self._max_step_used = max(self._max_step_used, step_used)
+        if step_used > self._max_step_used:
+            self._max_step_used = step_used
 
         if step_used > self._step_limit:
             step_used = self._step_used
@@ -402,14 +586,11 @@ class IconScoreStepCounter(object):
         self._step_used = step_used
 
         # Save the step info to StepTracer to trace step cost
-        self._trace_step(step_type, step)
+        if self._step_tracer is not None:
+            self._step_tracer.add(step_type, step, step_used)
 
         return step_used
 
-    def _trace_step(self, step_type: StepType, step: int):
-        if self._step_tracer is not None:
-            self._step_tracer.add(step_type, step, self._step_used)
-
     def reset(self, step_limit: int):
         """
 
@@ -436,6 +617,7 @@ class IconScoreStepCounter(object):
         :param step_costs: step costs dict
         """
         self._step_costs = step_costs
+        self._step_cost_table = compile_step_costs(step_costs)
 
     def set_max_step_limit(self, max_step_limit: int):
         """Sets the max step limit for current context
@@ -445,4 +627,4 @@ class IconScoreStepCounter(object):
         self._max_step_limit = max_step_limit
 
     def get_step_cost(self, step_type: StepType) -> int:
-        return self._step_costs.get(step_type, 0)
+        return self._step_cost_table[_STEP_TYPE_INDEXES[step_type]]
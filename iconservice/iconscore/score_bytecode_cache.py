@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import compileall
+import hashlib
+import json
+import os
+import py_compile
+import sys
+from typing import Optional
+
+from iconcommons.logger import Logger
+
+from ..icon_constant import ICON_DEPLOY_LOG_TAG
+
+# Suffix of a file next to a SCORE deploy path which records the validated contents of the SCORE
+RECORD_FILE_SUFFIX = '.bytecode'
+
+# Valid .pyc files are tied to the hash of their sources instead of timestamps (Python 3.7+)
+_INVALIDATION_MODE = \
+    py_compile.PycInvalidationMode.CHECKED_HASH if hasattr(py_compile, 'PycInvalidationMode') else None
+
+
+class ScoreBytecodeCache(object):
+    """Precompiled bytecode of a SCORE which has passed ScorePackageValidator
+
+    The bytecode is written to __pycache__ in a SCORE deploy path
+    and a record file containing the hash of the SCORE sources and the import whitelist
+    is written next to the deploy path: <score_root>/<address>/0x<tx_hash>.bytecode
+
+    As long as the record matches the sources of a deploy path,
+    the SCORE does not need to be validated and compiled again, e.g. on invoking the same block twice.
+    """
+
+    @staticmethod
+    def get_record_path(score_deploy_path: str) -> str:
+        return f'{score_deploy_path.rstrip(os.sep)}{RECORD_FILE_SUFFIX}'
+
+    @staticmethod
+    def make_content_hash(score_deploy_path: str) -> bytes:
+        """Returns the hash of the relative paths and the contents of the files in a SCORE package
+
+        __pycache__ is excluded
+
+        :param score_deploy_path:
+        :return:
+        """
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(score_deploy_path):
+            dirnames[:] = [dirname for dirname in dirnames if dirname != '__pycache__']
+            for filename in filenames:
+                paths.append(os.path.join(dirpath, filename))
+
+        h = hashlib.sha3_256()
+        for path in sorted(paths):
+            h.update(os.path.relpath(path, score_deploy_path).encode())
+            h.update(b'\x00')
+            with open(path, 'rb') as f:
+                h.update(hashlib.sha3_256(f.read()).digest())
+
+        return h.digest()
+
+    @staticmethod
+    def make_whitelist_hash(import_whitelist: dict) -> bytes:
+        data: bytes = json.dumps(import_whitelist, sort_keys=True, default=sorted).encode()
+        return hashlib.sha3_256(data).digest()
+
+    @staticmethod
+    def _make_record(content_hash: bytes, whitelist_hash: bytes) -> dict:
+        return {
+            'contentHash': content_hash.hex(),
+            'whitelistHash': whitelist_hash.hex(),
+            # .pyc files differ among python versions
+            'cacheTag': sys.implementation.cache_tag
+        }
+
+    @staticmethod
+    def _read_record(score_deploy_path: str) -> Optional[dict]:
+        try:
+            with open(ScoreBytecodeCache.get_record_path(score_deploy_path), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def is_valid(score_deploy_path: str, content_hash: bytes, whitelist_hash: bytes) -> bool:
+        """Checks whether the SCORE has already been validated and compiled with the same sources and whitelist
+
+        :param score_deploy_path:
+        :param content_hash: returned by make_content_hash()
+        :param whitelist_hash: returned by make_whitelist_hash()
+        :return:
+        """
+        record: Optional[dict] = ScoreBytecodeCache._read_record(score_deploy_path)
+        return record == ScoreBytecodeCache._make_record(content_hash, whitelist_hash)
+
+    @staticmethod
+    def write(score_deploy_path: str, content_hash: bytes, whitelist_hash: bytes) -> None:
+        """Compiles all modules in a SCORE package and records the hash of its contents
+
+        It should be called only after the SCORE package passed validation.
+        A failure is not fatal because it only makes the next loading slower.
+
+        :param score_deploy_path:
+        :param content_hash: returned by make_content_hash()
+        :param whitelist_hash: returned by make_whitelist_hash()
+        """
+        record_path: str = ScoreBytecodeCache.get_record_path(score_deploy_path)
+
+        try:
+            kwargs = {} if _INVALIDATION_MODE is None else {'invalidation_mode': _INVALIDATION_MODE}
+            if not compileall.compile_dir(score_deploy_path, quiet=2, **kwargs):
+                return
+
+            # Write to a temporary file first not to leave a broken record
+            tmp_path: str = f'{record_path}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(ScoreBytecodeCache._make_record(content_hash, whitelist_hash), f)
+            os.replace(tmp_path, record_path)
+        except Exception as e:
+            Logger.warning(f'Failed to write a bytecode cache: {score_deploy_path} {e}', ICON_DEPLOY_LOG_TAG)
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ast
+import inspect
+import textwrap
+from typing import Optional, Union
+
+from iconcommons.logger import Logger
+
+from .icon_score_constant import CONST_CLASS_REUSABLE
+from ..icon_constant import ICON_SERVICE_LOG_TAG
+
+BASE_PACKAGE = 'iconservice'
+
+# Classes whose instance state is managed by iconservice itself
+# Referred to by name to avoid the circular import with icon_score_base
+KNOWN_BASE_CLASSES = frozenset((
+    'iconservice.iconscore.icon_score_base.IconScoreBase',
+    'iconservice.iconscore.icon_score_base.IconScoreObject',
+    'iconservice.iconscore.icon_score_context.ContextGetter',
+    'abc.ABC',
+    'builtins.object'
+))
+
+CONTAINER_DB_NAMES = frozenset(('VarDB', 'DictDB', 'ArrayDB'))
+
+# Functions which can access the attributes of an object indirectly
+BLACKLIST_FUNCTIONS = frozenset(('getattr', 'setattr', 'delattr', 'vars', 'exec', 'eval'))
+
+# Attributes which can change the attributes of an object or leak the object bound to a method
+BLACKLIST_ATTRIBUTES = frozenset(('__setattr__', '__delattr__', '__dict__', '__self__'))
+
+# Nodes which make a new scope where self would be captured
+NESTED_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+
+
+class ScoreInstanceAuditor(object):
+    """Checks if the instance of a SCORE class can be reused across transactions
+
+    A SCORE instance is reusable only if all of its member variables are container DBs,
+    constants or module-level names assigned in __init__() and no other method assigns a member variable.
+    Out of __init__(), self can only be used to load its attributes or call its methods,
+    so it is never aliased, passed, returned or captured in a closure.
+    Such an instance keeps no state between calls except what is stored in its DBs,
+    so reusing it gives the same result as creating a new one for every call.
+    """
+
+    @classmethod
+    def is_reusable(cls, score_class: type) -> bool:
+        """Returns the result of auditing a SCORE class cached in the class itself
+
+        :param score_class:
+        :return:
+        """
+        reusable: Optional[bool] = score_class.__dict__.get(CONST_CLASS_REUSABLE)
+        if reusable is None:
+            reusable = cls._audit(score_class)
+            setattr(score_class, CONST_CLASS_REUSABLE, reusable)
+
+        return reusable
+
+    @classmethod
+    def _audit(cls, score_class: type) -> bool:
+        try:
+            for klass in score_class.__mro__:
+                if f"{klass.__module__}.{klass.__qualname__}" in KNOWN_BASE_CLASSES:
+                    continue
+                if klass.__module__.split('.')[0] == BASE_PACKAGE or not cls._audit_class(klass):
+                    return False
+        except BaseException as e:
+            Logger.info(tag=ICON_SERVICE_LOG_TAG, msg=f"Failed to audit {score_class.__name__}: {e}")
+            return False
+
+        return True
+
+    @classmethod
+    def _audit_class(cls, klass: type) -> bool:
+        source: str = textwrap.dedent(inspect.getsource(klass))
+        class_def: Optional[ast.ClassDef] = None
+
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.ClassDef) and node.name == klass.__name__:
+                class_def = node
+                break
+
+        if class_def is None:
+            return False
+
+        for node in class_def.body:
+            if isinstance(node, ast.FunctionDef) and node.name == '__init__':
+                if not cls._audit_init(node):
+                    return False
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if not cls._audit_method(node):
+                    return False
+            elif any(isinstance(child, NESTED_SCOPES) for child in ast.walk(node)) or not cls._audit_node(node):
+                return False
+
+        return True
+
+    @classmethod
+    def _audit_init(cls, func: ast.FunctionDef) -> bool:
+        """Only calls to the constructor of the base class
+        and assignments of container DBs or constants to member variables are allowed
+
+        :param func: __init__()
+        :return:
+        """
+        if not func.args.args:
+            return False
+        self_name: str = func.args.args[0].arg
+
+        for stmt in func.body:
+            if isinstance(stmt, ast.Pass):
+                continue
+
+            if isinstance(stmt, ast.Expr):
+                if cls._is_constant(stmt.value) or cls._is_base_init_call(stmt.value, self_name):
+                    continue
+                return False
+
+            if isinstance(stmt, ast.Assign):
+                targets = stmt.targets
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                targets = [stmt.target]
+            else:
+                return False
+
+            if not all(cls._is_member(target, self_name) for target in targets):
+                return False
+            if not (cls._is_simple(stmt.value, self_name) or cls._is_container_db(stmt.value, self_name)):
+                return False
+
+        return True
+
+    @classmethod
+    def _audit_method(cls, func: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> bool:
+        """Any assignment to a member variable and any use of self which can lead to it are not allowed
+
+        :param func: a method except __init__()
+        :return:
+        """
+        if not cls._audit_node(func):
+            return False
+
+        is_static: bool = any(isinstance(decorator, ast.Name) and decorator.id == 'staticmethod'
+                              for decorator in func.decorator_list)
+        if is_static or not func.args.args:
+            return True
+
+        self_name: str = func.args.args[0].arg
+        return all(cls._audit_self(stmt, self_name, False) for stmt in func.body)
+
+    @classmethod
+    def _audit_node(cls, node: ast.AST) -> bool:
+        """Any access to the attributes of an object by name or through its internals is not allowed
+
+        :param node: a statement in class body
+        :return:
+        """
+        for child in ast.walk(node):
+            if isinstance(child, ast.Attribute):
+                if child.attr in BLACKLIST_ATTRIBUTES or child.attr in BLACKLIST_FUNCTIONS:
+                    return False
+            elif isinstance(child, ast.Name):
+                if child.id in BLACKLIST_FUNCTIONS:
+                    return False
+
+        return True
+
+    @classmethod
+    def _audit_self(cls, node: ast.AST, self_name: str, nested: bool) -> bool:
+        """self is allowed only as the base of an attribute load in the scope of the method itself
+
+        Method calls are included as they load the method first.
+        No attribute of an expression derived from self can be assigned or deleted.
+
+        :param node: a node in a method
+        :param self_name: name of the first parameter of the method
+        :param nested: whether the node is in a nested scope of the method
+        :return:
+        """
+        if isinstance(node, ast.Name):
+            return node.id != self_name
+
+        if isinstance(node, ast.Attribute):
+            if isinstance(node.ctx, (ast.Store, ast.Del)) and \
+                    any(isinstance(child, ast.Name) and child.id == self_name for child in ast.walk(node.value)):
+                return False
+            if isinstance(node.value, ast.Name) and node.value.id == self_name:
+                return not nested
+
+        nested = nested or isinstance(node, NESTED_SCOPES)
+        return all(cls._audit_self(child, self_name, nested) for child in ast.iter_child_nodes(node))
+
+    @staticmethod
+    def _is_member(node: ast.AST, self_name: str) -> bool:
+        return isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == self_name
+
+    @staticmethod
+    def _is_constant(node: ast.AST) -> bool:
+        return isinstance(node, (ast.Num, ast.Str, ast.Bytes, ast.NameConstant))
+
+    @classmethod
+    def _is_simple(cls, node: ast.AST, self_name: str) -> bool:
+        """Check if an expression always has the same value regardless of the context
+
+        e.g. a constant, a module-level name or a parameter of __init__() except self
+        """
+        if cls._is_constant(node):
+            return True
+        if isinstance(node, ast.Name):
+            return node.id != self_name
+
+        return isinstance(node, ast.Attribute) and cls._is_simple(node.value, self_name)
+
+    @classmethod
+    def _is_container_db(cls, node: ast.AST, self_name: str) -> bool:
+        if not isinstance(node, ast.Call):
+            return False
+
+        func = node.func
+        name: Optional[str] = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+        if name not in CONTAINER_DB_NAMES:
+            return False
+
+        return all(cls._is_simple(arg, self_name) for arg in node.args) and \
+            all(keyword.arg is not None and cls._is_simple(keyword.value, self_name) for keyword in node.keywords)
+
+    @classmethod
+    def _is_base_init_call(cls, node: ast.AST, self_name: str) -> bool:
+        """Check if a node is super().__init__(...) or Base.__init__(self, ...)
+        """
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == '__init__'):
+            return False
+
+        if node.keywords:
+            return False
+
+        owner = node.func.value
+        if isinstance(owner, ast.Call):
+            # super().__init__(...) or super(Class, self).__init__(...)
+            args = node.args
+            if not (isinstance(owner.func, ast.Name) and owner.func.id == 'super'):
+                return False
+        else:
+            # Base.__init__(self, ...)
+            if not (len(node.args) > 0 and isinstance(node.args[0], ast.Name) and node.args[0].id == self_name):
+                return False
+            if not cls._is_simple(owner, self_name):
+                return False
+            args = node.args[1:]
+
+        return all(cls._is_simple(arg, self_name) for arg in args)
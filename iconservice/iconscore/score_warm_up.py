@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from collections import Counter
+from threading import Thread
+from typing import Dict, List, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from .icon_score_class_loader import IconScoreClassLoader
+from ..base.address import Address
+from ..icon_constant import ICON_SERVICE_LOG_TAG
+
+# File in a score root path which contains the most called SCOREs on the last run
+WARM_UP_FILE = '.warm_up.json'
+
+
+class ScoreWarmUp(object):
+    """Imports the most called SCOREs of the last run in background after a node starts up
+
+    The first call to a SCORE after startup is slow because its modules are imported on demand.
+    Call counts are collected while running and the most called SCOREs are saved on close.
+    Counting is not synchronized among query workers because an approximate count is enough.
+    """
+
+    def __init__(self, score_root_path: str, max_scores: int):
+        """Constructor
+
+        :param score_root_path:
+        :param max_scores: the maximum number of SCOREs to import on startup
+        """
+        assert max_scores > 0
+
+        self._score_root_path = score_root_path
+        self._max_scores = max_scores
+        self._counts = Counter()
+        # address -> tx_hash of the called SCORE
+        self._tx_hashes: Dict['Address', bytes] = {}
+        self._thread: Optional['Thread'] = None
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self._score_root_path, WARM_UP_FILE)
+
+    def count(self, address: 'Address', tx_hash: bytes):
+        self._counts[address] += 1
+        self._tx_hashes[address] = tx_hash
+
+    def load(self) -> List[Tuple['Address', bytes]]:
+        """Returns the SCOREs saved on the last run
+
+        :return: [(address, tx_hash)] in descending order of call counts
+        """
+        try:
+            with open(self.path, 'r') as f:
+                items: list = json.load(f)
+
+            return [(Address.from_string(address), bytes.fromhex(tx_hash[2:]))
+                    for address, tx_hash in items[:self._max_scores]]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            Logger.warning(tag=ICON_SERVICE_LOG_TAG, msg=f"Invalid warm-up file: {self.path} {e}")
+            return []
+
+    def save(self):
+        """Save the most called SCOREs to the file in the score root path
+
+        The file of the last run is kept if no SCORE has been called
+        """
+        try:
+            items = [(str(address), f'0x{self._tx_hashes[address].hex()}')
+                     for address, _ in self._counts.most_common(self._max_scores)]
+            if len(items) == 0:
+                return
+
+            tmp_path: str = f'{self.path}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(items, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            Logger.warning(tag=ICON_SERVICE_LOG_TAG, msg=f"Failed to save a warm-up file: {self.path} {e}")
+
+    def start(self):
+        """Import the SCOREs saved on the last run in a daemon thread
+        """
+        scores: List[Tuple['Address', bytes]] = self.load()
+        if len(scores) == 0:
+            return
+
+        self._thread = Thread(target=self._run, args=(scores,), name="ScoreWarmUp", daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self, scores: List[Tuple['Address', bytes]]):
+        loaded: int = 0
+
+        for address, tx_hash in scores:
+            try:
+                # A module imported here is found in sys.modules when the SCORE is called
+                IconScoreClassLoader.run(address, tx_hash, self._score_root_path)
+                loaded += 1
+            except Exception as e:
+                # The SCORE might have been updated or removed
+                Logger.debug(tag=ICON_SERVICE_LOG_TAG, msg=f"Failed to warm up a SCORE: {address} {e}")
+
+        Logger.info(tag=ICON_SERVICE_LOG_TAG, msg=f"Warmed up {loaded}/{len(scores)} SCOREs")
@@ -16,7 +16,7 @@
 
 import json
 from enum import IntEnum, IntFlag
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Optional, Union, List, Iterable
 
 from iconcommons import Logger
 
@@ -259,29 +259,59 @@ class Storage(StorageBase):
             If the account indicated by address is not present,
             create a new account.
         """
+        return self.get_accounts(context, (address,), intent)[0]
 
-        coin_part: Optional['CoinPart'] = None
-        stake_part: Optional['StakePart'] = None
-        delegation_part: Optional['DelegationPart'] = None
+    def get_accounts(self,
+                     context: 'IconScoreContext',
+                     addresses: Iterable['Address'],
+                     intent: 'Intent' = Intent.TRANSFER) -> List['Account']:
+        """Returns the accounts indicated by addresses.
+        All the parts of the accounts are read from db at once
 
+        :param context:
+        :param addresses: account addresses
+        :param intent:
+        :return: accounts in the same order as addresses
+        """
         part_flags: 'AccountPartFlag' = AccountPartFlag(intent)
+        part_classes: list = [
+            part_class
+            for flag, part_class in ((AccountPartFlag.COIN, CoinPart),
+                                     (AccountPartFlag.STAKE, StakePart),
+                                     (AccountPartFlag.DELEGATION, DelegationPart))
+            if flag in part_flags
+        ]
+
+        addresses: list = list(addresses)
+        keys: List[bytes] = [
+            part_class.make_key(address)
+            for address in addresses for part_class in part_classes
+        ]
+        if len(keys) == 1:
+            values: List[Optional[bytes]] = [self._db.get(context, keys[0])]
+        else:
+            values: List[Optional[bytes]] = self._db.get_many(context, keys)
 
-        if AccountPartFlag.COIN in part_flags:
-            coin_part: 'CoinPart' = self._get_part(context, CoinPart, address)
+        accounts = []
+        for i, address in enumerate(addresses):
+            parts = {}
+            for j, part_class in enumerate(part_classes):
+                value: Optional[bytes] = values[i * len(part_classes) + j]
+                parts[part_class] = part_class.from_bytes(value) if value else part_class()
 
-            if CoinPartFlag.HAS_UNSTAKE in coin_part.flags:
-                part_flags |= AccountPartFlag.STAKE
+            coin_part: Optional['CoinPart'] = parts.get(CoinPart)
+            stake_part: Optional['StakePart'] = parts.get(StakePart)
+            delegation_part: Optional['DelegationPart'] = parts.get(DelegationPart)
 
-        if AccountPartFlag.STAKE in part_flags:
-            stake_part: 'StakePart' = self._get_part(context, StakePart, address)
+            if stake_part is None and coin_part is not None and CoinPartFlag.HAS_UNSTAKE in coin_part.flags:
+                stake_part: 'StakePart' = self._get_part(context, StakePart, address)
 
-        if AccountPartFlag.DELEGATION in part_flags:
-            delegation_part: 'DelegationPart' = self._get_part(context, DelegationPart, address)
+            accounts.append(Account(address, context.block.height,
+                                    coin_part=coin_part,
+                                    stake_part=stake_part,
+                                    delegation_part=delegation_part))
 
-        return Account(address, context.block.height,
-                       coin_part=coin_part,
-                       stake_part=stake_part,
-                       delegation_part=delegation_part)
+        return accounts
 
     def get_treasury_account(self, context: 'IconScoreContext') -> 'Account':
         """Returns the instance of treasury account
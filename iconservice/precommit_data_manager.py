@@ -16,7 +16,7 @@
 
 from enum import IntFlag
 from threading import Lock
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Optional, List, Dict
 
 from .base.block import Block, EMPTY_BLOCK
 from .base.exception import InvalidParamsException
@@ -26,6 +26,7 @@ from .icon_constant import Revision
 from .iconscore.icon_score_mapper import IconScoreMapper
 from .iiss.reward_calc.msg_data import TxData
 from .utils import bytes_to_hex, sha3_256
+from .utils.bloom import BloomFilter
 
 if TYPE_CHECKING:
     from .base.address import Address
@@ -116,6 +117,9 @@ class PrecommitData(object):
         self.revision: int = revision
         self.rc_db_revision: int = rc_db_revision
         self.block_batch = block_batch
+        # The hash of the block in invoke(), which is a key of this data in PrecommitDataManager
+        # block_batch.block.hash can be replaced with a new one on commit (leader node)
+        self.instant_block_hash: Optional[bytes] = None if self.block is None else self.block.hash
         self.block_result = block_result
         self.rc_block_batch = rc_block_batch
         # Snapshot of preps
@@ -137,6 +141,8 @@ class PrecommitData(object):
         # To prevent redundant precommit data logging
         self.already_exists = False
 
+        self._logs_bloom: Optional['BloomFilter'] = None
+
     def __str__(self):
         lines = [
             f"revision: {self.revision}",
@@ -165,6 +171,22 @@ class PrecommitData(object):
     def block(self) -> Optional['Block']:
         return None if self.block_batch is None else self.block_batch.block
 
+    @property
+    def logs_bloom(self) -> 'BloomFilter':
+        """Bloom filter of all event logs in the block
+
+        It is the union of the logs_bloom of each tx_result in block_result
+        """
+        if self._logs_bloom is None:
+            value: int = 0
+            for tx_result in self.block_result:
+                if tx_result.logs_bloom is not None:
+                    value |= int(tx_result.logs_bloom)
+
+            self._logs_bloom = BloomFilter(value)
+
+        return self._logs_bloom
+
     def _make_state_root_hash(self) -> bytes:
         if self.revision < Revision.DECENTRALIZATION.value or self.rc_state_root_hash is None:
             return self.is_state_root_hash
@@ -177,11 +199,16 @@ class PrecommitData(object):
 class PrecommitDataManager(object):
     """Manages multiple precommit block data
 
+    Precommit data make a tree whose root is the last committed block.
+    A block can be invoked on top of an uncommitted precommit block (pipelined invoke)
+    if the precommit block has nothing to be applied to IconServiceEngine on commit.
     """
 
     def __init__(self):
         self._lock = Lock()
-        self._precommit_data_mapper = {}
+        self._precommit_data_mapper: Dict[bytes, 'PrecommitData'] = {}
+        # parent block hash -> instant block hashes of its child precommit blocks
+        self._children_mapper: Dict[bytes, List[bytes]] = {}
         self._last_block: Optional['Block'] = None
 
     @property
@@ -202,21 +229,67 @@ class PrecommitDataManager(object):
     def push(self, precommit_data: 'PrecommitData'):
         block: 'Block' = precommit_data.block_batch.block
         self._precommit_data_mapper[block.hash] = precommit_data
+        self._children_mapper.setdefault(block.prev_hash, []).append(block.hash)
 
     def get(self, block_hash: 'bytes') -> Optional['PrecommitData']:
         precommit_data = self._precommit_data_mapper.get(block_hash)
         return precommit_data
 
-    def commit(self, block: 'Block'):
+    def commit(self, precommit_data: 'PrecommitData'):
+        """Make the committed block the new root of precommit data tree
+
+        Precommit data which are not descendants of the committed block are thrown away
+
+        :param precommit_data: precommit data of the committed block
+        """
+        block: 'Block' = precommit_data.block
+
         with self._lock:
             self._last_block = block
 
-        # Clear remaining precommit data which have the same block height
-        self._precommit_data_mapper.clear()
+        # Children invoked on top of the instant hash of a block committed with another final hash
+        # can never be committed, so only the children referring to the final hash remain
+        children: List[bytes] = list(self._children_mapper.get(block.hash, []))
+
+        for block_hash in children:
+            # The states of the committed block are in StateDB now
+            self._precommit_data_mapper[block_hash].block_batch.parent = None
+
+        # Clear remaining precommit data which are not descendants of the committed block
+        precommit_data_mapper: Dict[bytes, 'PrecommitData'] = {}
+        children_mapper: Dict[bytes, List[bytes]] = {block.hash: children}
+
+        block_hashes: List[bytes] = list(children)
+        while block_hashes:
+            block_hash: bytes = block_hashes.pop()
+            precommit_data_mapper[block_hash] = self._precommit_data_mapper[block_hash]
+
+            grandchildren: Optional[List[bytes]] = self._children_mapper.get(block_hash)
+            if grandchildren:
+                children_mapper[block_hash] = grandchildren
+                block_hashes.extend(grandchildren)
+
+        self._precommit_data_mapper = precommit_data_mapper
+        self._children_mapper = children_mapper
 
     def remove_precommit_state(self, instant_block_hash: bytes):
-        if instant_block_hash in self._precommit_data_mapper:
-            del self._precommit_data_mapper[instant_block_hash]
+        """Throw away a precommit block and all the blocks invoked on top of it
+
+        :param instant_block_hash:
+        """
+        precommit_data: Optional['PrecommitData'] = self._precommit_data_mapper.get(instant_block_hash)
+        if precommit_data is None:
+            return
+
+        siblings: Optional[List[bytes]] = self._children_mapper.get(precommit_data.block.prev_hash)
+        if siblings and instant_block_hash in siblings:
+            siblings.remove(instant_block_hash)
+
+        block_hashes = [instant_block_hash]
+        while block_hashes:
+            block_hash: bytes = block_hashes.pop()
+            self._precommit_data_mapper.pop(block_hash, None)
+            block_hashes.extend(self._children_mapper.pop(block_hash, []))
 
     def empty(self) -> bool:
         return len(self._precommit_data_mapper) == 0
@@ -227,29 +300,57 @@ class PrecommitDataManager(object):
         :return:
         """
         self._precommit_data_mapper.clear()
+        self._children_mapper.clear()
 
-    def validate_block_to_invoke(self, block: 'Block'):
+    def validate_block_to_invoke(self, block: 'Block') -> Optional['PrecommitData']:
         """Check if the block to invoke is valid before invoking it
 
         :param block: block to invoke
+        :return: precommit data of the uncommitted parent block
+            None if the block is invoked on top of the last committed block
         """
         if not self._is_last_block_valid():
-            return
+            return None
 
         if block.prev_hash == self._last_block.hash and \
                 block.height == self._last_block.height + 1:
-            return
+            return None
+
+        parent: Optional['PrecommitData'] = self._precommit_data_mapper.get(block.prev_hash)
+        if parent is not None and \
+                parent.block.height + 1 == block.height and \
+                self.is_chainable(parent):
+            return parent
 
         raise InvalidParamsException(
             f'Failed to invoke a block: '
             f'last_block({self._last_block}) '
             f'block_to_invoke({block})')
 
-    def validate_precommit_block(self, instant_block_hash: bytes):
+    @staticmethod
+    def is_chainable(precommit_data: 'PrecommitData') -> bool:
+        """Check if the next block can be invoked on top of a given precommit block before it is committed
+
+        All the states of the block should be in its block_batch.
+        Any change which is applied to IconServiceEngine only on commit
+        (P-Rep term, step properties, revision, IISS calculation, newly deployed SCOREs)
+        makes the next block wait for the commit.
+
+        :param precommit_data:
+        :return:
+        """
+        return precommit_data.revision >= Revision.THREE.value and \
+            precommit_data.precommit_flag == PrecommitFlag.NONE and \
+            precommit_data.term is None and \
+            not precommit_data.score_mapper
+
+    def validate_precommit_block(self, instant_block_hash: bytes, allow_uncommitted_parent: bool = False):
         """Check block validation
         before write_precommit_state() or remove_precommit_state()
 
         :param instant_block_hash: hash data which is used for retrieving block instance from the pre-commit data mapper
+        :param allow_uncommitted_parent: True to accept a block invoked on top of an uncommitted precommit block
+            which can be removed but not committed before its parent
         """
         assert isinstance(instant_block_hash, bytes)
 
@@ -263,10 +364,18 @@ class PrecommitDataManager(object):
 
         precommit_block = precommit_data.block
 
-        if self._last_block.hash != precommit_block.prev_hash or \
-                self._last_block.height + 1 != precommit_block.height:
-            raise InvalidParamsException(
-                f'Invalid precommit block: last_block({self._last_block}) precommit_block({precommit_block})')
+        if self._last_block.hash == precommit_block.prev_hash and \
+                self._last_block.height + 1 == precommit_block.height:
+            return
+
+        if allow_uncommitted_parent and \
+                instant_block_hash in self._children_mapper.get(precommit_block.prev_hash, ()):
+            parent: Optional['PrecommitData'] = self._precommit_data_mapper.get(precommit_block.prev_hash)
+            if parent is not None and parent.block.height + 1 == precommit_block.height:
+                return
+
+        raise InvalidParamsException(
+            f'Invalid precommit block: last_block({self._last_block}) precommit_block({precommit_block})')
 
     def _is_last_block_valid(self) -> bool:
         return self._last_block.height >= 0
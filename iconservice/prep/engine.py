@@ -123,9 +123,11 @@ class Engine(EngineBase, IISSEngineListener):
         icx_storage: 'IcxStorage' = context.storage.icx
         preps = PRepContainer()
 
-        for prep in context.storage.prep.get_prep_iterator():
-            account: 'Account' = icx_storage.get_account(context, prep.address, Intent.ALL)
+        prep_list: List['PRep'] = list(context.storage.prep.get_prep_iterator())
+        accounts: List['Account'] = \
+            icx_storage.get_accounts(context, (prep.address for prep in prep_list), Intent.ALL)
 
+        for prep, account in zip(prep_list, accounts):
             prep.stake = account.stake
             prep.delegated = account.delegated_amount
 
@@ -17,12 +17,16 @@ __all__ = "BackupCleaner"
 
 import os
 import re
+from typing import TYPE_CHECKING, Optional
 
 from iconcommons.logger import Logger
 
 from . import get_backup_filename
 from ..icon_constant import BACKUP_LOG_TAG, BACKUP_FILES
 
+if TYPE_CHECKING:
+    from .backup_db import BackupDatabase
+
 _TAG = BACKUP_LOG_TAG
 
 
@@ -31,14 +35,16 @@ class BackupCleaner(object):
 
     """
 
-    def __init__(self, backup_root_path: str, backup_files: int):
+    def __init__(self, backup_root_path: str, backup_files: int, backup_db: Optional['BackupDatabase'] = None):
         """
 
         :param backup_root_path: the directory where backup files are placed
         :param backup_files: the maximum backup files to keep
+        :param backup_db: backups are removed from it instead of files if it is given
         """
         self._backup_root_path = backup_root_path
         self._backup_files = backup_files if backup_files > 0 else BACKUP_FILES
+        self._backup_db = backup_db
         self._regex_object = re.compile("^[\d]{10}.bak$")
 
     def run_on_init(self, current_block_height: int) -> int:
@@ -52,8 +58,19 @@ class BackupCleaner(object):
         ret = 0
         start_block_height = max(0, current_block_height - self._backup_files)
 
+        if self._backup_db is not None:
+            ret = self._backup_db.remove(0, start_block_height - 1) + self._backup_db.remove(current_block_height)
+            Logger.debug(tag=_TAG, msg=f"run_on_init() end: ret={ret}")
+            return ret
+
         with os.scandir(self._backup_root_path) as it:
             for entry in it:
+                # A backup file which had not been completely written: ex) 0000012345.bak.tmp
+                if entry.is_file() and entry.name.endswith(".tmp") and self._is_backup_filename_valid(entry.name[:-4]):
+                    if self._remove_file(entry.path):
+                        ret += 1
+                    continue
+
                 # backup filename: ex) 0000012345.bak
                 if entry.is_file() and self._is_backup_filename_valid(entry.name):
                     block_height: int = self._get_block_height_from_filename(entry.name)
@@ -116,6 +133,11 @@ class BackupCleaner(object):
             Logger.warning(tag=_TAG, msg=f"Invalid range: start={start_block_height} end={end_block_height}")
             return -1
 
+        if self._backup_db is not None:
+            ret = self._backup_db.remove(start_block_height, end_block_height)
+            Logger.debug(tag=_TAG, msg=f"run() end: ret={ret}")
+            return ret
+
         ret = 0
 
         # Remove block backup files ranging from start_block_height to end_block_height inclusive
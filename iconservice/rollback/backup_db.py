@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = "BackupDatabase"
+
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from ..database.db import KeyValueDatabase
+from ..database.wal import WALDBType
+from ..icon_constant import BACKUP_LOG_TAG
+from ..utils.msgpack_for_db import MsgPackForDB
+
+if TYPE_CHECKING:
+    from ..base.block import Block
+
+_TAG = BACKUP_LOG_TAG
+
+# Key layout
+#   block: 0x00 | height(8)                    -> [revision, state, instant_block_hash, block]
+#   entry: 0x01 | db_type(1) | height(8) | key -> 0x00 (None) or 0x01 | value
+# The entries of a db are kept in the order of heights to be read with a range scan
+_BLOCK_PREFIX = b'\x00'
+_ENTRY_PREFIX = b'\x01'
+_HEIGHT_SIZE = 8
+_ENTRY_KEY_OFFSET = len(_ENTRY_PREFIX) + 1 + _HEIGHT_SIZE
+
+_NONE_VALUE = b'\x00'
+_VALUE_PREFIX = b'\x01'
+
+
+def _pack_height(height: int) -> bytes:
+    return height.to_bytes(_HEIGHT_SIZE, 'big')
+
+
+def _make_entry_prefix(db_type: int) -> bytes:
+    return _ENTRY_PREFIX + db_type.to_bytes(1, 'big')
+
+
+class BackupDatabase(object):
+    """Keeps the previous states of blocks for rollback in a LevelDB instead of a file per block
+
+    The backup of a block is keyed by its height.
+    So the backups of many blocks are read with a range scan
+    and old ones are removed with a range delete without scanning a directory.
+    """
+
+    def __init__(self, db: 'KeyValueDatabase'):
+        self._db = db
+
+    @staticmethod
+    def from_path(path: str) -> 'BackupDatabase':
+        return BackupDatabase(KeyValueDatabase.from_path(path))
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def write(self,
+              revision: int,
+              block: 'Block',
+              instant_block_hash: bytes,
+              state: int,
+              logs: Iterable[Tuple[int, Iterable[Tuple[bytes, Optional[bytes]]]]]):
+        """Write the backup of a block at once replacing the old one at the same height if any
+
+        :param revision:
+        :param block: the block to rollback to
+        :param instant_block_hash:
+        :param state: WALBackupState
+        :param logs: [(db_type, [(key, previous value)])]
+        """
+        height: bytes = _pack_height(block.height)
+        items = {}
+
+        # Remove the backup written at the same height before a rollback not to leave stale previous states
+        next_height: bytes = _pack_height(block.height + 1)
+        for db_type in WALDBType:
+            prefix: bytes = _make_entry_prefix(db_type.value)
+            for key, _ in self._db.iterator(start=prefix + height, stop=prefix + next_height):
+                items[key] = None
+
+        for db_type, it in logs:
+            prefix: bytes = _make_entry_prefix(db_type) + height
+            for key, value in it:
+                items[prefix + key] = _NONE_VALUE if value is None else _VALUE_PREFIX + value
+
+        items[_BLOCK_PREFIX + height] = \
+            MsgPackForDB.dumps([revision, state, instant_block_hash, block.to_bytes(revision)])
+        self._db.write_batch(items.items())
+
+    def exists(self, current_block_height: int, rollback_block_height: int) -> bool:
+        """Check if backups for rollback exist
+
+        :param current_block_height: current state before rollback
+        :param rollback_block_height: final state after rollback
+        :return: True(exist) False(not exist)
+        """
+        if current_block_height < 1 or \
+                rollback_block_height < 0 or \
+                rollback_block_height > current_block_height:
+            return False
+
+        count: int = sum(1 for _ in self._db.iterator(start=_BLOCK_PREFIX + _pack_height(rollback_block_height),
+                                                      stop=_BLOCK_PREFIX + _pack_height(current_block_height)))
+        return count == current_block_height - rollback_block_height
+
+    def get_iterator(self,
+                     db_type: int,
+                     start_block_height: int,
+                     end_block_height: int) -> Iterator[Tuple[bytes, Optional[bytes]]]:
+        """Returns the previous states of a db in the backups of blocks in the order of block height
+
+        :param db_type: WALDBType
+        :param start_block_height:
+        :param end_block_height: inclusive
+        :return: iterator of (key, previous value)
+        """
+        prefix: bytes = _make_entry_prefix(db_type)
+
+        for key, value in self._db.iterator(start=prefix + _pack_height(start_block_height),
+                                            stop=prefix + _pack_height(end_block_height + 1)):
+            yield key[_ENTRY_KEY_OFFSET:], None if value == _NONE_VALUE else value[len(_VALUE_PREFIX):]
+
+    def remove(self, start_block_height: int, end_block_height: Optional[int] = None) -> int:
+        """Remove the backups of blocks ranging from start_block_height to end_block_height inclusive
+
+        :param start_block_height:
+        :param end_block_height: None: to the last backup
+        :return: the number of removed backups
+        """
+        start_block_height = max(0, start_block_height)
+        if end_block_height is not None and end_block_height < start_block_height:
+            return 0
+
+        items = {}
+        ret = 0
+
+        for prefix in [_BLOCK_PREFIX] + [_make_entry_prefix(db_type.value) for db_type in WALDBType]:
+            start: bytes = prefix + _pack_height(start_block_height)
+            stop: bytes = prefix + _pack_height(end_block_height + 1) if end_block_height is not None \
+                else prefix + b'\xff' * _HEIGHT_SIZE
+
+            for key, _ in self._db.iterator(start=start, stop=stop):
+                items[key] = None
+                if prefix == _BLOCK_PREFIX:
+                    ret += 1
+
+        if items:
+            self._db.write_batch(items.items())
+
+        Logger.info(tag=_TAG, msg=f"Remove backups: start={start_block_height} end={end_block_height} count={ret}")
+        return ret
@@ -14,20 +14,25 @@
 # limitations under the License.
 
 import os
+from concurrent.futures import Future
+from concurrent.futures.thread import ThreadPoolExecutor
 from enum import Flag
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, List, Tuple
 
 from iconcommons import Logger
 
 from iconservice.database.db import KeyValueDatabase
-from iconservice.database.wal import WriteAheadLogWriter
+from iconservice.database.wal import WriteAheadLogWriter, WALDBType
 from iconservice.icon_constant import ROLLBACK_LOG_TAG
 from iconservice.rollback import get_backup_filename
 
 if TYPE_CHECKING:
+    from iconservice.database.db import DatabaseSnapshot
     from iconservice.database.wal import IissWAL
     from iconservice.base.block import Block
     from iconservice.database.batch import BlockBatch
+    from iconservice.rollback.backup_cleaner import BackupCleaner
+    from iconservice.rollback.backup_db import BackupDatabase
 
 TAG = ROLLBACK_LOG_TAG
 
@@ -39,9 +44,14 @@ class WALBackupState(Flag):
 class BackupManager(object):
     """Backup and rollback for the previous block state
 
+    Backup files can be written in background not to delay commit.
+    Then the previous states of a block are read from a snapshot of state_db taken before commit
+    and only one backup file is written at a time.
+    A backup file appears under its name only after it is completely written.
+    Backups are written to BackupDatabase instead of files if it is given.
     """
 
-    def __init__(self, backup_root_path: str, rc_data_path: str):
+    def __init__(self, backup_root_path: str, rc_data_path: str, backup_db: Optional['BackupDatabase'] = None):
         Logger.debug(tag=TAG,
                      msg=f"__init__() start: "
                          f"backup_root_path={backup_root_path}, "
@@ -49,10 +59,45 @@ class BackupManager(object):
 
         self._rc_data_path = rc_data_path
         self._backup_root_path = backup_root_path
+        self._backup_db = backup_db
+
+        # Writes backup files in background after start()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # The backup file being written in background
+        self._future: Optional[Future] = None
 
         Logger.info(tag=TAG, msg=f"backup_root_path={self._backup_root_path}")
         Logger.debug(tag=TAG, msg="__init__() end")
 
+    def start(self):
+        """Write backup files in background from now on
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix="BackupManager")
+
+    def wait(self):
+        """Wait until the backup file being written in background is done
+
+        Call it before using backup files.
+        An exception raised while writing the backup file is raised again here
+        """
+        future: Optional[Future] = self._future
+        if future is not None:
+            self._future = None
+            future.result()
+
+    def close(self):
+        if self._executor is None:
+            return
+
+        try:
+            self.wait()
+        except BaseException as e:
+            Logger.error(tag=TAG, msg=f"Failed to backup: {e}")
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+
     def _get_backup_file_path(self, block_height: int) -> str:
         """
 
@@ -72,9 +117,14 @@ class BackupManager(object):
             block_batch: 'BlockBatch',
             iiss_wal: 'IissWAL',
             is_calc_period_start_block: bool,
-            instant_block_hash: bytes):
+            instant_block_hash: bytes,
+            backup_cleaner: Optional['BackupCleaner'] = None):
         """Backup the previous block state
 
+        It should be called before the block is written to icx_db and rc_db.
+        In background, it returns after waiting for the backup of the previous block
+        and reading the previous states of rc_db which might be replaced on commit.
+
         :param icx_db:
         :param rc_db:
         :param revision:
@@ -83,44 +133,75 @@ class BackupManager(object):
         :param iiss_wal:
         :param is_calc_period_start_block:
         :param instant_block_hash:
+        :param backup_cleaner: removes the oldest backup file after the backup is done
         :return:
         """
         Logger.debug(tag=TAG, msg="backup() start")
 
+        self.wait()
+
         path: str = self._get_backup_file_path(prev_block.height)
         Logger.info(tag=TAG, msg=f"backup_file_path={path}")
 
-        writer = WriteAheadLogWriter(
-            revision, max_log_count=2, block=prev_block, instant_block_hash=instant_block_hash)
-        writer.open(path)
-
-        if is_calc_period_start_block:
-            writer.write_state(WALBackupState.CALC_PERIOD_END_BLOCK.value)
-
-        self._backup_rc_db(writer, rc_db, iiss_wal)
-        self._backup_state_db(writer, icx_db, block_batch)
-
-        writer.close()
+        rc_items: List[Tuple[bytes, Optional[bytes]]] = self._get_rc_db_items(rc_db, iiss_wal)
+        keys: List[bytes] = [] if block_batch is None else list(block_batch)
+
+        if self._executor is None:
+            self._write(path, revision, prev_block, instant_block_hash, is_calc_period_start_block,
+                        rc_items, icx_db, keys, None, backup_cleaner)
+        else:
+            snapshot: 'DatabaseSnapshot' = icx_db.acquire_snapshot()
+            try:
+                self._future = self._executor.submit(
+                    self._write, path, revision, prev_block, instant_block_hash, is_calc_period_start_block,
+                    rc_items, icx_db, keys, snapshot, backup_cleaner)
+            except BaseException:
+                icx_db.release_snapshot(snapshot)
+                raise
 
         Logger.debug(tag=TAG, msg="backup() end")
 
-    @classmethod
-    def _backup_rc_db(cls, writer: 'WriteAheadLogWriter', db: 'KeyValueDatabase', iiss_wal: 'IissWAL'):
-        def get_rc_db_generator():
-            for key, _ in iiss_wal:
-                value: Optional[bytes] = db.get(key)
-                yield key, value
-
-        writer.write_walogable(get_rc_db_generator())
+    def _write(self,
+               path: str,
+               revision: int,
+               prev_block: 'Block',
+               instant_block_hash: bytes,
+               is_calc_period_start_block: bool,
+               rc_items: List[Tuple[bytes, Optional[bytes]]],
+               icx_db: 'KeyValueDatabase',
+               keys: List[bytes],
+               snapshot: Optional['DatabaseSnapshot'],
+               backup_cleaner: Optional['BackupCleaner']):
+        try:
+            values: List[Optional[bytes]] = icx_db.get_many(keys, snapshot)
+        finally:
+            if snapshot is not None:
+                icx_db.release_snapshot(snapshot)
+
+        state: int = WALBackupState.CALC_PERIOD_END_BLOCK.value if is_calc_period_start_block else 0
+
+        if self._backup_db is not None:
+            self._backup_db.write(revision, prev_block, instant_block_hash, state,
+                                  [(WALDBType.RC.value, rc_items), (WALDBType.STATE.value, zip(keys, values))])
+        else:
+            tmp_path: str = f"{path}.tmp"
+            writer = WriteAheadLogWriter(
+                revision, max_log_count=2, block=prev_block, instant_block_hash=instant_block_hash)
+            writer.open(tmp_path)
+
+            if state:
+                writer.write_state(state)
+
+            writer.write_walogable(rc_items)
+            writer.write_walogable(zip(keys, values))
+
+            writer.close()
+            os.replace(tmp_path, path)
+
+        if backup_cleaner is not None:
+            # Clean up the oldest backup file
+            backup_cleaner.run_on_commit(prev_block.height + 1)
 
     @classmethod
-    def _backup_state_db(cls, writer: 'WriteAheadLogWriter', db: 'KeyValueDatabase', block_batch: 'BlockBatch'):
-        if block_batch is None:
-            block_batch = {}
-
-        def get_state_db_generator():
-            for key in block_batch:
-                value: Optional[bytes] = db.get(key)
-                yield key, value
-
-        writer.write_walogable(get_state_db_generator())
+    def _get_rc_db_items(cls, db: 'KeyValueDatabase', iiss_wal: 'IissWAL') -> List[Tuple[bytes, Optional[bytes]]]:
+        return [(key, db.get(key)) for key, _ in iiss_wal]
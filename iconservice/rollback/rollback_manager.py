@@ -15,7 +15,7 @@
 
 import os
 import shutil
-from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+from typing import TYPE_CHECKING, Optional
 
 from iconcommons.logger import Logger
 
@@ -29,10 +29,14 @@ from ..iiss.reward_calc.msg_data import make_block_produce_info_key
 
 if TYPE_CHECKING:
     from iconservice.database.db import KeyValueDatabase
+    from .backup_db import BackupDatabase
 
 
 TAG = ROLLBACK_LOG_TAG
 
+# Progress is logged whenever this number of backup files is merged
+_PROGRESS_INTERVAL = 100
+
 
 class RollbackManager(object):
     """Rollback the current state to the one block previous one with a backup file
@@ -41,10 +45,22 @@ class RollbackManager(object):
     Related databases: state_db, iiss_db
     """
 
-    def __init__(self, backup_root_path: str, rc_data_path: str, state_db: 'KeyValueDatabase'):
+    def __init__(self,
+                 backup_root_path: str,
+                 rc_data_path: str,
+                 state_db: 'KeyValueDatabase',
+                 backup_db: Optional['BackupDatabase'] = None):
+        """
+
+        :param backup_root_path:
+        :param rc_data_path:
+        :param state_db:
+        :param backup_db: backups are read from it instead of files if it is given
+        """
         self._backup_root_path = backup_root_path
         self._rc_data_path = rc_data_path
         self._state_db = state_db
+        self._backup_db = backup_db
 
     def run(self, last_block_height: int, rollback_block_height: int, term_start_block_height: int):
         """Rollback to the previous block state
@@ -63,11 +79,48 @@ class RollbackManager(object):
         term_change_exists = \
             self._term_change_exists(last_block_height, rollback_block_height, term_start_block_height)
         calc_end_block_height = term_start_block_height - 1
-        reader = WriteAheadLogReader()
         state_db_batch = {}
         iiss_db_batch = {}
 
-        for block_height in range(last_block_height - 1, rollback_block_height - 1, -1):
+        if self._backup_db is None:
+            self._read_backup_files(last_block_height, rollback_block_height,
+                                    term_change_exists, calc_end_block_height,
+                                    state_db_batch, iiss_db_batch)
+        else:
+            self._read_backup_db(last_block_height, rollback_block_height,
+                                 term_change_exists, calc_end_block_height,
+                                 state_db_batch, iiss_db_batch)
+
+        # If a term change is detected during rollback, handle the exceptions below
+        if term_change_exists:
+            self._remove_block_produce_info(iiss_db_batch, calc_end_block_height)
+            self._rename_iiss_db_to_current_db(calc_end_block_height)
+
+        # Commit write_batch to db
+        self._commit_batch(state_db_batch, self._state_db)
+        iiss_db = RewardCalcStorage.create_current_db(self._rc_data_path)
+        self._commit_batch(iiss_db_batch, iiss_db)
+        iiss_db.close()
+
+        Logger.info(tag=TAG, msg="run() end")
+
+    def _read_backup_files(self,
+                           last_block_height: int,
+                           rollback_block_height: int,
+                           term_change_exists: bool,
+                           calc_end_block_height: int,
+                           state_db_batch: dict,
+                           iiss_db_batch: dict):
+        """Merge the backup files of blocks into batches
+
+        Files are merged from the newest one so that the previous state of a key in the oldest backup,
+        which is the state to rollback to, overwrites the ones in newer backups
+        """
+        block_heights = range(last_block_height - 1, rollback_block_height - 1, -1)
+        count: int = len(block_heights)
+        reader = WriteAheadLogReader()
+
+        for i, block_height in enumerate(block_heights):
             # Make backup file with a given block_height
             path: str = self._get_backup_file_path(block_height)
             if not os.path.isfile(path):
@@ -76,26 +129,40 @@ class RollbackManager(object):
             reader.open(path)
 
             # Merge backup data into state_db_batch
-            self._write_batch(reader.get_iterator(WALDBType.STATE.value), state_db_batch)
+            state_db_batch.update(reader.get_iterator(WALDBType.STATE.value))
 
             # Merge backup data into iiss_db_batch
             if not (term_change_exists and block_height > calc_end_block_height):
-                self._write_batch(reader.get_iterator(WALDBType.RC.value), iiss_db_batch)
+                iiss_db_batch.update(reader.get_iterator(WALDBType.RC.value))
 
             reader.close()
 
-        # If a term change is detected during rollback, handle the exceptions below
-        if term_change_exists:
-            self._remove_block_produce_info(iiss_db_batch, calc_end_block_height)
-            self._rename_iiss_db_to_current_db(calc_end_block_height)
-
-        # Commit write_batch to db
-        self._commit_batch(state_db_batch, self._state_db)
-        iiss_db = RewardCalcStorage.create_current_db(self._rc_data_path)
-        self._commit_batch(iiss_db_batch, iiss_db)
-        iiss_db.close()
-
-        Logger.info(tag=TAG, msg="run() end")
+            if (i + 1) % _PROGRESS_INTERVAL == 0 or i + 1 == count:
+                Logger.info(tag=TAG, msg=f"Merge backup files: {i + 1}/{count}")
+
+    def _read_backup_db(self,
+                        last_block_height: int,
+                        rollback_block_height: int,
+                        term_change_exists: bool,
+                        calc_end_block_height: int,
+                        state_db_batch: dict,
+                        iiss_db_batch: dict):
+        if not self._backup_db.exists(last_block_height, rollback_block_height):
+            raise InternalServiceErrorException(
+                f"Backup not found: last_block_height={last_block_height} "
+                f"rollback_block_height={rollback_block_height}")
+
+        # Backups of all blocks are read at once from the oldest one
+        # whose previous state of a key is the state to rollback to
+        for key, value in self._backup_db.get_iterator(
+                WALDBType.STATE.value, rollback_block_height, last_block_height - 1):
+            state_db_batch.setdefault(key, value)
+
+        rc_end_block_height: int = \
+            min(last_block_height - 1, calc_end_block_height) if term_change_exists else last_block_height - 1
+        for key, value in self._backup_db.get_iterator(
+                WALDBType.RC.value, rollback_block_height, rc_end_block_height):
+            iiss_db_batch.setdefault(key, value)
 
     @staticmethod
     def _validate_block_heights(last_block_height: int, rollback_block_height: int, term_start_block_height: int):
@@ -116,11 +183,6 @@ class RollbackManager(object):
     def _term_change_exists(last_block_height: int, rollback_block_height: int, term_start_block_height: int) -> bool:
         return rollback_block_height < term_start_block_height <= last_block_height
 
-    @staticmethod
-    def _write_batch(it: Iterable[Tuple[bytes, Optional[bytes]]], batch: dict):
-        for key, value in it:
-            batch[key] = value
-
     @staticmethod
     def _commit_batch(batch: dict, db: 'KeyValueDatabase'):
         db.write_batch(batch.items())
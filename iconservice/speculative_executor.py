@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Set
+
+from iconcommons.logger import Logger
+
+from .icon_constant import ICON_SERVICE_LOG_TAG
+
+if TYPE_CHECKING:
+    from .base.address import Address
+    from .iconscore.icon_score_context import IconScoreContext
+    from .iconscore.icon_score_result import TransactionResult
+
+# The number of transactions executed against the same snapshot per worker
+_WINDOW_SIZE_PER_WORKER = 8
+
+
+class SpeculativeResult(object):
+    """The result of a transaction executed against a snapshot of block states
+
+    It is valid only if no key in read_set has been changed
+    by the transactions committed after the snapshot was taken
+    """
+
+    def __init__(self, context: 'IconScoreContext', tx_result: 'TransactionResult'):
+        """
+
+        :param context: context which the transaction has been executed with
+        :param tx_result:
+        """
+        self.context = context
+        self.tx_result = tx_result
+
+    @property
+    def read_set(self) -> Set[bytes]:
+        return self.context.read_set
+
+    def is_valid(self, written_keys: Set[bytes], commutative_keys: Set[bytes] = frozenset()) -> bool:
+        """Check if the result is still valid
+
+        :param written_keys: keys written by the transactions committed after the snapshot was taken
+        :param commutative_keys: keys whose changes can be applied in any order (e.g. fee treasury)
+        :return:
+        """
+        return self.read_set.intersection(written_keys).issubset(commutative_keys)
+
+
+class SpeculativeExecutor(object):
+    """Executes a window of independent transactions in a block concurrently
+    against the same snapshot of block states (optimistic concurrency control)
+
+    Only EOA to EOA coin transfers are executed speculatively,
+    because they have no side effects outside of their own tx_batch.
+    IconServiceEngine validates the results and commits them in block order,
+    re-executing a transaction whose read set conflicts with the keys
+    written by the preceding transactions.
+    """
+
+    def __init__(self, max_workers: int):
+        assert max_workers > 0
+
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="SpeculativeExecutor")
+
+    @property
+    def window_size(self) -> int:
+        return self._max_workers * _WINDOW_SIZE_PER_WORKER
+
+    @staticmethod
+    def is_speculative(tx_request: dict) -> bool:
+        """Check if a transaction can be executed speculatively
+
+        :param tx_request:
+        :return:
+        """
+        if tx_request.get('method') != 'icx_sendTransaction':
+            return False
+
+        params: dict = tx_request['params']
+        to: Optional['Address'] = params.get('to')
+        if to is None or to.is_contract:
+            return False
+
+        return params.get('dataType') in (None, 'message')
+
+    def run(self,
+            invoke_func: Callable[[dict, int], 'SpeculativeResult'],
+            tx_requests: list,
+            start: int) -> Dict[int, 'SpeculativeResult']:
+        """Execute consecutive speculative transactions from tx_requests[start]
+
+        :param invoke_func: function which executes a tx_request at a given index with a new context
+        :param tx_requests: transactions in a block
+        :param start: index of the first transaction to execute
+        :return: index -> SpeculativeResult
+        """
+        end: int = min(start + self.window_size, len(tx_requests))
+
+        futures = {}
+        for index in range(start, end):
+            if not self.is_speculative(tx_requests[index]):
+                break
+            futures[index] = self._executor.submit(invoke_func, tx_requests[index], index)
+
+        results = {}
+        for index, future in futures.items():
+            try:
+                results[index] = future.result()
+            except BaseException as e:
+                # The transaction will be executed again in serial
+                Logger.warning(tag=ICON_SERVICE_LOG_TAG, msg=f"Speculative execution failed: index={index} {e}")
+
+        return results
+
+    def close(self):
+        self._executor.shutdown()
+
@@ -9,6 +9,10 @@ from __future__ import absolute_import
 import numbers
 import operator
 import hashlib
+from typing import Iterable
+
+# The number of bytes of 2048 bloom bits
+BLOOM_BYTES = 256
 
 
 def get_chunks_for_bloom(value_hash):
@@ -29,6 +33,35 @@ def get_bloom_bits(value):
         yield bloom_bits
 
 
+def get_bloom_value(values: Iterable[bytes]) -> int:
+    """Returns the bloom value of all values at once
+
+    It is the same as int(BloomFilter.from_iterable(values))
+    but sets bits on a bytearray instead of OR-ing a 2048-bit integer for every value.
+
+    :param values:
+    :return:
+    """
+    bits = bytearray(BLOOM_BYTES)
+    sha3_256 = hashlib.sha3_256
+
+    for value in values:
+        if not isinstance(value, bytes):
+            raise TypeError("Value must be of type `bytes`")
+
+        value_hash = sha3_256(value).digest()
+
+        # Bit N of a bloom value is bit (N & 7) of bits[N >> 3] in little endian
+        index = ((value_hash[0] << 8) | value_hash[1]) & 2047
+        bits[index >> 3] |= 1 << (index & 7)
+        index = ((value_hash[2] << 8) | value_hash[3]) & 2047
+        bits[index >> 3] |= 1 << (index & 7)
+        index = ((value_hash[4] << 8) | value_hash[5]) & 2047
+        bits[index >> 3] |= 1 << (index & 7)
+
+    return int.from_bytes(bits, 'little')
+
+
 class BloomFilter(numbers.Number):
     value = None
 
@@ -45,8 +78,7 @@ class BloomFilter(numbers.Number):
             self.value |= bloom_bits
 
     def extend(self, iterable):
-        for value in iterable:
-            self.add(value)
+        self.value |= get_bloom_value(iterable)
 
     @classmethod
     def from_iterable(cls, iterable):
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+from collections import OrderedDict, deque
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from ..icon_constant import ICON_SERVICE_LOG_TAG
+
+if TYPE_CHECKING:
+    from ..base.block import Block
+
+
+class Phase:
+    """Phases of processing a block
+
+    A phase can be nested in another one, e.g. FEE is a part of CALL
+    """
+    # invoke
+    TYPE_CONVERSION = "typeConversion"
+    BEFORE_TX_PROCESS = "beforeTransactionProcess"
+    CALL = "call"
+    FEE = "fee"
+    AFTER_TX_PROCESS = "afterTransactionProcess"
+    DIGEST = "digest"
+    INVOKE = "invoke"
+
+    # commit
+    WAL = "wal"
+    BACKUP = "backup"
+    RC_COMMIT = "rcCommit"
+    STATE_WRITE = "stateWrite"
+    IPC = "ipc"
+    COMMIT = "commit"
+
+
+class Stopwatch(object):
+    """Measures wall time and CPU time of the current thread
+    """
+
+    def __init__(self):
+        self._wall_start: float = time.perf_counter()
+        self._cpu_start: float = time.thread_time()
+
+    def elapsed(self) -> Tuple[float, float]:
+        """
+        :return: (wall time, cpu time) in seconds
+        """
+        return time.perf_counter() - self._wall_start, time.thread_time() - self._cpu_start
+
+
+class BlockProfile(object):
+    """Time spent in each phase of invoking and committing a block
+    """
+
+    def __init__(self, height: int, block_hash: bytes):
+        self.height = height
+        self.hash = block_hash
+        # phase -> [wall time, cpu time, count]
+        self.phases: Dict[str, list] = OrderedDict()
+        self.tx_count = 0
+        self.state_keys = 0
+        self.rc_keys = 0
+        # Measures the whole invoke
+        self.stopwatch = Stopwatch()
+
+    def add(self, phase: str, wall_s: float, cpu_s: float):
+        item: Optional[list] = self.phases.get(phase)
+        if item is None:
+            self.phases[phase] = [wall_s, cpu_s, 1]
+        else:
+            item[0] += wall_s
+            item[1] += cpu_s
+            item[2] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "blockHeight": self.height,
+            "blockHash": self.hash.hex(),
+            "txCount": self.tx_count,
+            "stateKeys": self.state_keys,
+            "rcKeys": self.rc_keys,
+            "phases": {
+                phase: {"wallMs": wall_s * 1000, "cpuMs": cpu_s * 1000, "count": count}
+                for phase, (wall_s, cpu_s, count) in self.phases.items()
+            }
+        }
+
+
+class _Measure(object):
+    __slots__ = ("_profile", "_phase", "_stopwatch")
+
+    def __init__(self, profile: 'BlockProfile', phase: str):
+        self._profile = profile
+        self._phase = phase
+        self._stopwatch: Optional['Stopwatch'] = None
+
+    def __enter__(self):
+        self._stopwatch = Stopwatch()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profile.add(self._phase, *self._stopwatch.elapsed())
+
+
+class _NullMeasure(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NULL_MEASURE = _NullMeasure()
+
+
+def measure(profile: Optional['BlockProfile'], phase: str):
+    """Returns a context manager which adds the time spent in it to a given phase
+
+    :param profile: profile of the block being processed (None: profiling is disabled)
+    :param phase:
+    """
+    return _NULL_MEASURE if profile is None else _Measure(profile, phase)
+
+
+class BlockProfiler(object):
+    """Keeps the profiles of the last N committed blocks
+
+    A profile is created on invoke and kept as pending until the block is committed
+    """
+
+    def __init__(self, max_blocks: int, dump_path: Optional[str] = None):
+        """Constructor
+
+        :param max_blocks: the number of committed blocks to keep profiles of
+        :param dump_path: path of a file to append the profile of every committed block to in JSON lines
+        """
+        assert max_blocks > 0
+
+        self._max_blocks = max_blocks
+        self._dump_path = dump_path
+        self._lock = Lock()
+        # block hash -> BlockProfile of an invoked block
+        self._pending: Dict[bytes, 'BlockProfile'] = OrderedDict()
+        self._profiles = deque(maxlen=max_blocks)
+
+    def start(self, block: 'Block') -> 'BlockProfile':
+        profile = BlockProfile(block.height, block.hash)
+
+        with self._lock:
+            pending = self._pending
+            pending[block.hash] = profile
+
+            # Drop the profiles of the blocks which have never been committed
+            while len(pending) > self._max_blocks:
+                pending.popitem(last=False)
+
+        return profile
+
+    def get(self, block_hash: bytes) -> Optional['BlockProfile']:
+        with self._lock:
+            return self._pending.get(block_hash)
+
+    def add(self, block_hash: bytes, phase: str, wall_s: float, cpu_s: float):
+        """Add the time spent in a phase out of IconServiceEngine, e.g. type conversion
+
+        :param block_hash:
+        :param phase:
+        :param wall_s:
+        :param cpu_s:
+        """
+        profile: Optional['BlockProfile'] = self.get(block_hash)
+        if profile is not None:
+            profile.add(phase, wall_s, cpu_s)
+
+    def discard(self, block_hash: bytes):
+        with self._lock:
+            self._pending.pop(block_hash, None)
+
+    def finish(self, block_hash: bytes):
+        """Move the profile of a committed block to the ring buffer
+
+        :param block_hash: instant block hash used on invoke
+        """
+        with self._lock:
+            profile: Optional['BlockProfile'] = self._pending.pop(block_hash, None)
+            if profile is None:
+                return
+
+            self._profiles.append(profile)
+
+        if self._dump_path:
+            self._dump(profile)
+
+    def _dump(self, profile: 'BlockProfile'):
+        try:
+            with open(self._dump_path, "a") as f:
+                f.write(json.dumps(profile.to_dict()))
+                f.write("\n")
+        except BaseException as e:
+            Logger.warning(tag=ICON_SERVICE_LOG_TAG, msg=f"Failed to dump a block profile: {e}")
+
+    def to_list(self) -> List[dict]:
+        with self._lock:
+            profiles = list(self._profiles)
+
+        return [profile.to_dict() for profile in profiles]
@@ -965,3 +965,66 @@ class TestTypeConverter(unittest.TestCase):
             TypeConverter.convert(request, ParamType.BLOCK)
 
         self.assertEqual("TypeConvert Exception int value :1, type: <class 'int'>", e.exception.message)
+
+    def test_convert_same_as_convert_by_template(self):
+        tx_params = {
+            ConstantKeys.OLD_TX_HASH: bytes.hex(create_block_hash()),
+            ConstantKeys.FROM: str(create_address()),
+            ConstantKeys.TO: "hx1234",
+            ConstantKeys.VALUE: "de0b6b3a7640000",
+            ConstantKeys.FEE: "0x2386f26fc10000",
+            ConstantKeys.TIMESTAMP: "0x5",
+            ConstantKeys.SIGNATURE: "",
+            ConstantKeys.DATA_TYPE: "deploy",
+            ConstantKeys.DATA: {
+                ConstantKeys.CONTENT_TYPE: "application/zip",
+                ConstantKeys.CONTENT: self.content,
+                ConstantKeys.PARAMS: {"list": [1, {"a": "0x1"}]},
+                "unknown": {"key": ["value"]}
+            },
+            "unknown": [{"key": "value"}]
+        }
+        requests = [
+            (ParamType.INVOKE_TRANSACTION, {ConstantKeys.METHOD: "icx_sendTransaction", ConstantKeys.PARAMS: tx_params}),
+            (ParamType.TRANSACTION_PARAMS_DATA, {**tx_params, ConstantKeys.DATA_TYPE: "unknown"}),
+            (ParamType.TRANSACTION_PARAMS_DATA, {**tx_params, ConstantKeys.DATA_TYPE: "message",
+                                                 ConstantKeys.DATA: "0x1234"}),
+            (ParamType.TRANSACTION_PARAMS_DATA, {**tx_params, ConstantKeys.VALUE: 0, ConstantKeys.DATA: []}),
+            (ParamType.BLOCK, {ConstantKeys.BLOCK_HEIGHT: [], ConstantKeys.BLOCK_HASH: {}, ConstantKeys.PREV_BLOCK_HASH: ""}),
+            (ParamType.INVOKE, {ConstantKeys.TRANSACTIONS: [[ConstantKeys.METHOD]],
+                                ConstantKeys.PREV_BLOCK_GENERATOR: "",
+                                ConstantKeys.PREV_BLOCK_VOTES: [[str(create_address()), "0x1", "extra"], "0x1"]}),
+            (ParamType.QUERY, {ConstantKeys.METHOD: ConstantKeys.ICX_CALL, ConstantKeys.PARAMS: {}}),
+            (ParamType.ISE_GET_STATUS, {ConstantKeys.FILTER: ["lastBlock"]}),
+            (ParamType.IISS_SET_DELEGATION, {ConstantKeys.DELEGATIONS: []}),
+            (ParamType.BLOCK, "block"),
+            (ParamType.BLOCK, []),
+        ]
+
+        for param_type, request in requests:
+            expected = TypeConverter.convert_by_template(request, param_type)
+            converted = TypeConverter.convert(request, param_type)
+            self.assertEqual(expected, converted)
+            # The converted params do not share mutable objects with the request
+            if isinstance(request, dict) and request:
+                self.assertIsNot(request, converted)
+
+        converted = TypeConverter.convert({ConstantKeys.PARAMS: tx_params}, ParamType.INVOKE_TRANSACTION)
+        self.assertIsNot(tx_params[ConstantKeys.DATA][ConstantKeys.PARAMS],
+                         converted[ConstantKeys.PARAMS][ConstantKeys.DATA][ConstantKeys.PARAMS])
+
+        wrong_requests = [
+            (ParamType.BLOCK, {ConstantKeys.BLOCK_HEIGHT: None}),
+            (ParamType.BLOCK, {"unknown": None}),
+            (ParamType.BLOCK, {ConstantKeys.BLOCK_HEIGHT: 1}),
+            (ParamType.TRANSACTION_PARAMS_DATA, {**tx_params, ConstantKeys.DATA_TYPE: "call",
+                                                 ConstantKeys.DATA: {ConstantKeys.METHOD: 1}}),
+            (ParamType.ISE_GET_STATUS, {ConstantKeys.FILTER: [1]}),
+        ]
+
+        for param_type, request in wrong_requests:
+            with self.assertRaises(InvalidParamsException) as expected:
+                TypeConverter.convert_by_template(request, param_type)
+            with self.assertRaises(InvalidParamsException) as e:
+                TypeConverter.convert(request, param_type)
+            self.assertEqual(expected.exception.message, e.exception.message)
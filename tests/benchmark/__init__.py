@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for performance-critical paths
+
+Each benchmark checks that an optimized path returns the same result as the legacy one
+and prints how long each of them takes.
+Set BENCHMARK_SCALE environment variable to run them with larger data (default: 1)
+"""
+
+import os
+import time
+import tracemalloc
+from typing import Callable, List
+
+BENCHMARK_SCALE: int = max(1, int(os.environ.get("BENCHMARK_SCALE", "1")))
+
+
+def measure(func: Callable, repeat: int = 3) -> float:
+    """Returns the best elapsed time of func() in seconds
+
+    :param func: function to measure
+    :param repeat: the number of times to run func
+    """
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def measure_peak_memory(func: Callable) -> int:
+    """Returns the peak size of memory in bytes allocated while running func()
+
+    :param func: function to measure
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def print_result(name: str, legacy_s: float, new_s: float):
+    speedup = legacy_s / new_s if new_s > 0 else float("inf")
+    print(f"\n[{name}] legacy={legacy_s * 1000:.3f}ms new={new_s * 1000:.3f}ms speedup={speedup:.2f}x")
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Returns the p-th percentile of values with the nearest-rank method
+
+    :param values: measured values
+    :param p: percentile in (0, 100]
+    """
+    ordered: List[float] = sorted(values)
+    index: int = max(0, -(-len(ordered) * p // 100) - 1)
+    return ordered[int(index)]
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import unittest
+from collections import OrderedDict
+
+from iconservice.base.block import Block
+from iconservice.database.db import KeyValueDatabase
+from iconservice.database.wal import WriteAheadLogReader, WALDBType
+from iconservice.icon_constant import Revision
+from iconservice.rollback.backup_cleaner import BackupCleaner
+from iconservice.rollback.backup_db import BackupDatabase
+from iconservice.rollback.backup_manager import BackupManager, get_backup_filename
+from iconservice.rollback.rollback_manager import RollbackManager
+from tests import create_block_hash
+from tests.benchmark import BENCHMARK_SCALE, measure, print_result
+
+
+class TestBenchmarkBackup(unittest.TestCase):
+    BLOCKS = 200 * BENCHMARK_SCALE
+    KEYS_PER_BLOCK = 50
+
+    def setUp(self):
+        self.root_path = "./test_benchmark_backup"
+        shutil.rmtree(self.root_path, ignore_errors=True)
+
+        self.file_path = os.path.join(self.root_path, "file")
+        self.db_path = os.path.join(self.root_path, "db")
+        os.makedirs(self.file_path)
+        os.makedirs(self.db_path)
+
+        self.state_db = KeyValueDatabase.from_path(os.path.join(self.root_path, "icon_dex"))
+        self.rc_db = KeyValueDatabase.from_path(os.path.join(self.root_path, "rc"))
+        self.backup_db = BackupDatabase.from_path(os.path.join(self.db_path, "backup_db"))
+
+        # Backups of blocks which transfer coins among the same accounts
+        keys = [os.urandom(32) for _ in range(self.KEYS_PER_BLOCK * 4)]
+        for manager in (BackupManager(self.file_path, self.root_path),
+                        BackupManager(self.db_path, self.root_path, self.backup_db)):
+            for block_height in range(self.BLOCKS):
+                block_batch = OrderedDict((keys[(block_height + i) % len(keys)], os.urandom(40))
+                                          for i in range(self.KEYS_PER_BLOCK))
+                manager.run(icx_db=self.state_db,
+                            rc_db=self.rc_db,
+                            revision=Revision.DECENTRALIZATION.value,
+                            prev_block=Block(block_height, create_block_hash(), 0, create_block_hash(), 0),
+                            block_batch=block_batch,
+                            iiss_wal=[],
+                            is_calc_period_start_block=False,
+                            instant_block_hash=create_block_hash())
+
+    def tearDown(self):
+        self.state_db.close()
+        self.rc_db.close()
+        self.backup_db.close()
+        shutil.rmtree(self.root_path, ignore_errors=True)
+
+    def test_read_backups_to_rollback(self):
+        def read(backup_root_path: str, backup_db) -> dict:
+            rollback_manager = RollbackManager(backup_root_path, self.root_path, self.state_db, backup_db)
+            state_db_batch = {}
+            read_backups = rollback_manager._read_backup_files if backup_db is None \
+                else rollback_manager._read_backup_db
+            read_backups(self.BLOCKS, 0, False, 0, state_db_batch, {})
+            return state_db_batch
+
+        self.assertEqual(read(self.file_path, None), read(self.db_path, self.backup_db))
+
+        print_result(f"read backups of {self.BLOCKS} blocks",
+                     measure(lambda: read(self.file_path, None)),
+                     measure(lambda: read(self.db_path, self.backup_db)))
+
+    def test_clean_up_on_init(self):
+        # Nothing to remove: all backups are checked
+        file_cleaner = BackupCleaner(self.file_path, self.BLOCKS)
+        db_cleaner = BackupCleaner(self.db_path, self.BLOCKS, self.backup_db)
+
+        print_result(f"clean up backups of {self.BLOCKS} blocks on init",
+                     measure(lambda: file_cleaner.run_on_init(self.BLOCKS)),
+                     measure(lambda: db_cleaner.run_on_init(self.BLOCKS)))
+
+
+def legacy_read_backup_files(backup_root_path: str, last_block_height: int, rollback_block_height: int) -> dict:
+    # Reads backup files one by one from the newest one overwriting the previous states of newer ones
+    reader = WriteAheadLogReader()
+    state_db_batch = {}
+
+    for block_height in range(last_block_height - 1, rollback_block_height - 1, -1):
+        path: str = os.path.join(backup_root_path, get_backup_filename(block_height))
+        if not os.path.isfile(path):
+            raise FileNotFoundError(path)
+
+        reader.open(path)
+        for key, value in reader.get_iterator(WALDBType.STATE.value):
+            state_db_batch[key] = value
+        reader.close()
+
+    return state_db_batch
+
+
+class TestBenchmarkRollback(unittest.TestCase):
+    BLOCKS = 2000 * BENCHMARK_SCALE
+    KEYS_PER_BLOCK = 100
+
+    def setUp(self):
+        self.root_path = "./test_benchmark_rollback"
+        shutil.rmtree(self.root_path, ignore_errors=True)
+        os.makedirs(self.root_path)
+
+        self.state_db = KeyValueDatabase.from_path(os.path.join(self.root_path, "icon_dex"))
+        self.rc_db = KeyValueDatabase.from_path(os.path.join(self.root_path, "rc"))
+
+        # Most of the accounts are changed on many blocks
+        keys = [os.urandom(32) for _ in range(self.KEYS_PER_BLOCK * 20)]
+        manager = BackupManager(self.root_path, self.root_path)
+        for block_height in range(self.BLOCKS):
+            block_batch = OrderedDict((keys[(block_height * 7 + i) % len(keys)], os.urandom(40))
+                                      for i in range(self.KEYS_PER_BLOCK))
+            manager.run(icx_db=self.state_db,
+                        rc_db=self.rc_db,
+                        revision=Revision.DECENTRALIZATION.value,
+                        prev_block=Block(block_height, create_block_hash(), 0, create_block_hash(), 0),
+                        block_batch=block_batch,
+                        iiss_wal=[],
+                        is_calc_period_start_block=False,
+                        instant_block_hash=create_block_hash())
+            self.state_db.write_batch(block_batch.items())
+
+    def tearDown(self):
+        self.state_db.close()
+        self.rc_db.close()
+        shutil.rmtree(self.root_path, ignore_errors=True)
+
+    def test_read_backup_files_to_rollback(self):
+        def read() -> dict:
+            rollback_manager = RollbackManager(self.root_path, self.root_path, self.state_db)
+            state_db_batch = {}
+            rollback_manager._read_backup_files(self.BLOCKS, 0, False, 0, state_db_batch, {})
+            return state_db_batch
+
+        self.assertEqual(legacy_read_backup_files(self.root_path, self.BLOCKS, 0), read())
+
+        print_result(f"merge backup files of {self.BLOCKS} blocks to rollback",
+                     measure(lambda: legacy_read_backup_files(self.root_path, self.BLOCKS, 0)),
+                     measure(read))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from typing import List
+
+from iconservice.base.address import AddressPrefix
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_event_log import EventLog, EventLogEmitter
+from iconservice.utils.bloom import BloomFilter
+from tests import create_address
+from tests.benchmark import BENCHMARK_SCALE, measure, print_result
+
+
+def legacy_logs_bloom(event_logs: List['EventLog']) -> 'BloomFilter':
+    logs_bloom = BloomFilter()
+
+    for event_log in event_logs:
+        logs_bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
+        for i, indexed_item in enumerate(event_log.indexed):
+            indexed_bytes = EventLogEmitter.get_ordered_bytes(i, indexed_item)
+            logs_bloom.add(indexed_bytes)
+
+    return logs_bloom
+
+
+class TestBenchmarkBloom(unittest.TestCase):
+    def test_logs_bloom(self):
+        score_address = create_address(AddressPrefix.CONTRACT)
+        event_logs = [
+            # Transfer(Address,Address,int,bytes) of IRC2 tokens
+            EventLog(score_address,
+                     ['Transfer(Address,Address,int,bytes)', create_address(), create_address(), i],
+                     [b'data'])
+            for i in range(10_000 * BENCHMARK_SCALE)
+        ]
+
+        expected: int = int(legacy_logs_bloom(event_logs))
+        self.assertEqual(expected, int(IconServiceEngine._generate_logs_bloom(event_logs)))
+
+        print_result(f"logs_bloom of {len(event_logs)} event logs",
+                     measure(lambda: legacy_logs_bloom(event_logs)),
+                     measure(lambda: IconServiceEngine._generate_logs_bloom(event_logs)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from typing import List
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.db import ContextDatabase, IconScoreDatabase
+from iconservice.iconscore.icon_container_db import DictDB, ContainerUtil
+from iconservice.iconscore.icon_score_context import IconScoreContext, IconScoreContextType, ContextContainer
+from tests import create_address
+from tests.benchmark import BENCHMARK_SCALE, measure
+from tests.mock_db import MockKeyValueDatabase
+
+ACCESS_COUNT = 10_000
+
+
+def legacy_key(score_address: 'Address', var_key: str, *keys) -> bytes:
+    """Builds the key of a DictDB element in StateDB in the same way as sub databases joined prefixes
+
+    :param score_address:
+    :param var_key: name of DictDB
+    :param keys: a key for each depth
+    """
+    prefix: bytes = b'|'.join((b'\x01', ContainerUtil.encode_key(var_key)))
+    for key in keys[:-1]:
+        prefix = b'|'.join((prefix, b'\x01', ContainerUtil.encode_key(key)))
+
+    return b'|'.join((score_address.to_bytes(), prefix, ContainerUtil.encode_key(keys[-1])))
+
+
+class TestBenchmarkContainerDB(unittest.TestCase):
+    def setUp(self):
+        self.address = create_address(AddressPrefix.CONTRACT)
+        self.context_db = ContextDatabase(MockKeyValueDatabase.create_db())
+        self.db = IconScoreDatabase(self.address, self.context_db)
+
+        context = IconScoreContext(IconScoreContextType.INVOKE)
+        context.current_address = self.address
+        context.block_batch = BlockBatch()
+        context.tx_batch = TransactionBatch()
+        self.context = context
+        ContextContainer._push_context(context)
+
+    def tearDown(self):
+        ContextContainer._clear_context()
+
+    def _run(self, depth: int):
+        dict_db = DictDB('balances', self.db, value_type=int, depth=depth)
+        keys: List[list] = [
+            [create_address() for _ in range(depth - 1)] + [create_address()]
+            for _ in range(100)
+        ]
+
+        def _get_item(item_keys: list):
+            item = dict_db
+            for key in item_keys[:-1]:
+                item = item[key]
+            return item, item_keys[-1]
+
+        # The final keys are the same as the ones built by joining prefixes
+        for i, item_keys in enumerate(keys):
+            item, key = _get_item(item_keys)
+            item[key] = i
+            tx_batch_value = self.context.tx_batch[legacy_key(self.address, 'balances', *item_keys)]
+            self.assertEqual(ContainerUtil.encode_value(i), tx_batch_value.value)
+
+        count: int = ACCESS_COUNT * BENCHMARK_SCALE
+
+        def _set():
+            for i in range(count):
+                item, key = _get_item(keys[i % 100])
+                item[key] = i
+
+        def _get():
+            for i in range(count):
+                item, key = _get_item(keys[i % 100])
+                _ = item[key]
+
+        set_s: float = measure(_set)
+        get_s: float = measure(_get)
+        print(f"\n[DictDB depth={depth} x {count}] set={set_s * 1000:.3f}ms get={get_s * 1000:.3f}ms")
+
+    def test_depth1(self):
+        self._run(1)
+
+    def test_depth2(self):
+        self._run(2)
+
+    def test_depth3(self):
+        self._run(3)
+
+
+if __name__ == '__main__':
+    unittest.main()
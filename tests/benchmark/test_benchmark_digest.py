@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+from iconservice.database.batch import Batch, BlockBatch, TransactionBatch, TransactionBatchValue
+from iconservice.utils import sha3_256
+from tests.benchmark import BENCHMARK_SCALE, measure, measure_peak_memory, print_result
+
+
+def legacy_digest(ordered_dict) -> bytes:
+    data = []
+
+    for key, tx_batch_value in ordered_dict.items():
+        if tx_batch_value.include_state_root_hash is True:
+            value: bytes = tx_batch_value.value
+        else:
+            continue
+        data.append(key)
+        if value is not None:
+            data.append(value)
+    value: bytes = b'|'.join(data)
+    return sha3_256(value)
+
+
+def make_block_batch(tx_count: int, keys_per_tx: int, overwrite: bool) -> 'BlockBatch':
+    block_batch = BlockBatch()
+
+    for i in range(tx_count):
+        tx_batch = TransactionBatch()
+        for j in range(keys_per_tx):
+            key: bytes = os.urandom(32)
+            if j % 7 == 0:
+                value = TransactionBatchValue(None, True)
+            elif j % 11 == 0:
+                value = TransactionBatchValue(os.urandom(8), False)
+            else:
+                value = TransactionBatchValue(os.urandom(64), True)
+            tx_batch[key] = value
+
+        if overwrite:
+            # Like the balance of fee treasury which is changed by every tx
+            tx_batch[b'treasury'] = TransactionBatchValue(i.to_bytes(8, 'big'), True)
+
+        block_batch.update(tx_batch)
+
+    return block_batch
+
+
+class TestBenchmarkDigest(unittest.TestCase):
+    def _run(self, name: str, overwrite: bool):
+        block_batch = make_block_batch(1000 * BENCHMARK_SCALE, 100, overwrite)
+
+        expected: bytes = legacy_digest(block_batch)
+        # Digest with the hasher kept warm during update()
+        self.assertEqual(expected, block_batch.digest())
+        # Digest by streaming the whole batch
+        self.assertEqual(expected, Batch.digest(block_batch))
+
+        legacy_s: float = measure(lambda: legacy_digest(block_batch))
+        print_result(f"{name}, streaming", legacy_s, measure(lambda: Batch.digest(block_batch)))
+        print_result(f"{name}, warm", legacy_s, measure(lambda: block_batch.digest()))
+
+        legacy_peak: int = measure_peak_memory(lambda: legacy_digest(block_batch))
+        new_peak: int = measure_peak_memory(lambda: Batch.digest(block_batch))
+        print(f"[{name}] peak memory: legacy={legacy_peak // 1024}KB streaming={new_peak // 1024}KB")
+        self.assertLess(new_peak, legacy_peak)
+
+    def test_digest_append_only(self):
+        self._run("digest(append only)", overwrite=False)
+
+    def test_digest_with_overwrite(self):
+        self._run("digest(overwrite)", overwrite=True)
+
+    def test_empty(self):
+        self.assertEqual(legacy_digest({}), BlockBatch().digest())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from iconservice.iconscore.icon_score_step import get_json_size
+from tests.benchmark import BENCHMARK_SCALE, measure, measure_peak_memory, print_result
+
+
+def legacy_input_data_size(input_data) -> int:
+    data = json.dumps(input_data, ensure_ascii=False, separators=(',', ':'))
+    return len(data.encode())
+
+
+class TestBenchmarkInputDataSize(unittest.TestCase):
+    def _run(self, name: str, input_data):
+        self.assertEqual(legacy_input_data_size(input_data), get_json_size(input_data))
+
+        print_result(name,
+                     measure(lambda: [legacy_input_data_size(input_data) for _ in range(100)]),
+                     measure(lambda: [get_json_size(input_data) for _ in range(100)]))
+        print(f"peak memory: legacy={measure_peak_memory(lambda: legacy_input_data_size(input_data))} "
+              f"new={measure_peak_memory(lambda: get_json_size(input_data))}")
+
+    def test_deploy(self):
+        input_data = {
+            "contentType": "application/zip",
+            "content": "0x" + "ab" * (256 * 1024 * BENCHMARK_SCALE),
+            "params": {"name": "token", "symbol": "TOK", "decimals": "0x12"}
+        }
+        self._run("input data size of a deploy", input_data)
+
+    def test_call(self):
+        input_data = {
+            "method": "transfer",
+            "params": {"_to": "hx" + "0" * 40, "_value": "0xde0b6b3a7640000", "_data": "0x" + "00" * 64}
+        }
+        self._run("input data size of a call", input_data)
+
+
+if __name__ == '__main__':
+    unittest.main()
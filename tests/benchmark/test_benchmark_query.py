@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import Any, List, Tuple
+
+from iconservice.base.address import GOVERNANCE_SCORE_ADDRESS
+from iconservice.icon_constant import ICX_IN_LOOP
+from tests.benchmark import BENCHMARK_SCALE, percentile
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+# The number of clients which send queries concurrently
+CLIENTS = 16
+QUERIES_PER_CLIENT = 50
+
+
+class TestBenchmarkQuery(TestIntegrateBase):
+    """Load generator for queries processed by a pool of query workers
+
+    Each client sends a query and waits for its response before sending the next one
+    """
+
+    def _make_requests(self) -> List[Tuple[str, dict]]:
+        requests = []
+
+        for account in self._accounts[:10]:
+            requests.append(("icx_getBalance", {"address": account.address}))
+            requests.append(("icx_call", {
+                "version": self._version,
+                "to": GOVERNANCE_SCORE_ADDRESS,
+                "dataType": "call",
+                "data": {"method": "getStepPrice", "params": {}}
+            }))
+        requests.append(("icx_getTotalSupply", {}))
+
+        return requests
+
+    def _run(self, workers: int, requests: List[Tuple[str, dict]]) -> Tuple[List[float], float, List[Any]]:
+        engine = self.icon_service_engine
+        query_count: int = QUERIES_PER_CLIENT * BENCHMARK_SCALE
+        latencies: List[float] = []
+        results: List[Any] = [None] * len(requests)
+
+        with ThreadPoolExecutor(workers) as query_pool:
+            def _client(client_id: int):
+                for i in range(query_count):
+                    index: int = (client_id + i) % len(requests)
+                    method, params = requests[index]
+
+                    start: float = time.perf_counter()
+                    results[index] = query_pool.submit(engine.query, method, params).result()
+                    latencies.append(time.perf_counter() - start)
+
+            start: float = time.perf_counter()
+            with ThreadPoolExecutor(CLIENTS) as clients:
+                for future in [clients.submit(_client, client_id) for client_id in range(CLIENTS)]:
+                    future.result()
+            elapsed: float = time.perf_counter() - start
+
+        return latencies, elapsed, results
+
+    def test_query_workers(self):
+        self.process_confirm_block_tx(
+            [self.create_transfer_icx_tx(self._admin, account, (i + 1) * ICX_IN_LOOP)
+             for i, account in enumerate(self._accounts[:10])])
+
+        requests = self._make_requests()
+        expected = [self._query(params, method) for method, params in requests]
+
+        for workers in (1, 2, 4, 8):
+            latencies, elapsed, results = self._run(workers, requests)
+            self.assertEqual(expected, results)
+
+            print(f"\n[query workers={workers}] "
+                  f"p50={percentile(latencies, 50) * 1000:.3f}ms "
+                  f"p99={percentile(latencies, 99) * 1000:.3f}ms "
+                  f"throughput={len(latencies) / elapsed:.0f}/s")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from copy import deepcopy
+
+from iconservice.base.address import AddressPrefix
+from iconservice.base.type_converter import TypeConverter
+from iconservice.base.type_converter_templates import ParamType
+from tests import create_address, create_block_hash
+from tests.benchmark import BENCHMARK_SCALE, measure, print_result
+
+TX_COUNT = 1000
+
+
+def make_tx(i: int) -> dict:
+    """Make an icx_sendTransaction request in the same format as the one sent by loopchain
+
+    :param i: index of a transaction in a block
+    """
+    params = {
+        "version": "0x3",
+        "from": str(create_address()),
+        "to": str(create_address()),
+        "value": hex(i * 10 ** 16),
+        "stepLimit": "0x1e8480",
+        "timestamp": hex(1_560_000_000_000_000 + i),
+        "nonce": hex(i),
+        "nid": "0x1",
+        "signature": "VAia7YZ2Ji6igKWzjR2YsGa2m53nKPrfK7uXYW78QLE+ATehAVZPC40szvAiA6NEU5gCYB4c4qaQzqDh2ugcHgA=",
+        "txHash": create_block_hash().hex()
+    }
+
+    kind: int = i % 4
+    if kind == 1:
+        # Token transfer
+        params["to"] = str(create_address(AddressPrefix.CONTRACT))
+        params["dataType"] = "call"
+        params["data"] = {
+            "method": "transfer",
+            "params": {"_to": str(create_address()), "_value": hex(i), "_data": os.urandom(8).hex()}
+        }
+    elif kind == 2:
+        params["dataType"] = "message"
+        params["data"] = "0x" + os.urandom(32).hex()
+    elif kind == 3:
+        # v2 transaction
+        del params["version"], params["stepLimit"], params["nid"]
+        params["fee"] = hex(10 ** 16)
+        params["value"] = hex(i)[2:]
+        params["tx_hash"] = params.pop("txHash")
+
+    return {"method": "icx_sendTransaction", "params": params}
+
+
+def make_invoke_request(tx_count: int) -> dict:
+    validators = [str(create_address()) for _ in range(22)]
+
+    return {
+        "block": {
+            "blockHeight": hex(100),
+            "blockHash": create_block_hash().hex(),
+            "timestamp": hex(1_560_000_000_000_000),
+            "prevBlockHash": create_block_hash().hex()
+        },
+        "isBlockEditable": "0x0",
+        "transactions": [make_tx(i) for i in range(tx_count)],
+        "prevBlockGenerator": validators[0],
+        "prevBlockValidators": validators[1:],
+        "prevBlockVotes": [[validator, hex(i % 3)] for i, validator in enumerate(validators)]
+    }
+
+
+class TestBenchmarkTypeConverter(unittest.TestCase):
+    def test_convert_invoke(self):
+        request: dict = make_invoke_request(TX_COUNT * BENCHMARK_SCALE)
+        original: dict = deepcopy(request)
+
+        expected = TypeConverter.convert_by_template(request, ParamType.INVOKE)
+        self.assertEqual(expected, TypeConverter.convert(request, ParamType.INVOKE))
+        # The request is not changed
+        self.assertEqual(original, request)
+
+        legacy_s: float = measure(lambda: TypeConverter.convert_by_template(request, ParamType.INVOKE))
+        new_s: float = measure(lambda: TypeConverter.convert(request, ParamType.INVOKE))
+        print_result(f"TypeConverter.convert(INVOKE, {len(request['transactions'])} txs)", legacy_s, new_s)
+
+    def test_convert_query(self):
+        request = {
+            "method": "icx_call",
+            "params": {
+                "version": "0x3",
+                "from": str(create_address()),
+                "to": str(create_address(AddressPrefix.CONTRACT)),
+                "dataType": "call",
+                "data": {"method": "balanceOf", "params": {"_owner": str(create_address())}}
+            }
+        }
+
+        expected = TypeConverter.convert_by_template(request, ParamType.QUERY)
+        self.assertEqual(expected, TypeConverter.convert(request, ParamType.QUERY))
+
+        def _run(convert):
+            for _ in range(1000 * BENCHMARK_SCALE):
+                convert(request, ParamType.QUERY)
+
+        legacy_s: float = measure(lambda: _run(TypeConverter.convert_by_template))
+        new_s: float = measure(lambda: _run(TypeConverter.convert))
+        print_result("TypeConverter.convert(QUERY) x 1000", legacy_s, new_s)
+
+
+if __name__ == '__main__':
+    unittest.main()
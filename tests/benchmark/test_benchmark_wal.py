@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import msgpack
+
+from iconservice.base.block import Block
+from iconservice.database.wal import WriteAheadLogReader, WriteAheadLogWriter
+from iconservice.icon_constant import Revision
+from tests import create_block_hash
+from tests.benchmark import BENCHMARK_SCALE, measure, measure_peak_memory, print_result
+
+
+def legacy_write_log(path: str, items: list) -> int:
+    # Packs and writes each entry
+    with open(path, "wb") as f:
+        size = 0
+        for key, value in items:
+            data: bytes = msgpack.packb([key, value])
+            size += f.write(data)
+
+    return size
+
+
+def legacy_read_log(path: str, size: int) -> list:
+    # Reads chunks of a log into bytes
+    with open(path, "rb") as f:
+        unpacker = msgpack.Unpacker(use_list=False, raw=True)
+        ret = []
+
+        while size > 0:
+            size_to_read = min(size, 16384)
+            data: bytes = f.read(size_to_read)
+            size -= size_to_read
+
+            unpacker.feed(data)
+            for key, value in unpacker:
+                ret.append((key, value))
+
+    return ret
+
+
+class TestBenchmarkWAL(unittest.TestCase):
+    def setUp(self):
+        self.legacy_path = "./legacy.wal"
+        self.path = "./test.wal"
+        self.block = Block(1, create_block_hash(), 0, create_block_hash(), 0)
+        # State changes of a block with many transfers
+        self.items = [(os.urandom(32), os.urandom(40)) for _ in range(50_000 * BENCHMARK_SCALE)]
+
+    def tearDown(self):
+        for path in (self.legacy_path, self.path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _write_log(self) -> int:
+        writer = WriteAheadLogWriter(Revision.LATEST.value, 1, self.block, create_block_hash())
+        writer.open(self.path)
+        size: int = writer.write_walogable(self.items)
+        writer.close()
+        return size
+
+    def _read_log(self) -> list:
+        reader = WriteAheadLogReader()
+        reader.open(self.path)
+        ret = list(reader.get_iterator(0))
+        reader.close()
+        return ret
+
+    def test_write(self):
+        self.assertEqual(legacy_write_log(self.legacy_path, self.items), self._write_log())
+
+        print_result("write a log of WAL",
+                     measure(lambda: legacy_write_log(self.legacy_path, self.items)),
+                     measure(self._write_log))
+        print(f"peak memory: legacy={measure_peak_memory(lambda: legacy_write_log(self.legacy_path, self.items))} "
+              f"new={measure_peak_memory(self._write_log)}")
+
+    def test_read(self):
+        size: int = legacy_write_log(self.legacy_path, self.items)
+        self._write_log()
+        self.assertEqual(legacy_read_log(self.legacy_path, size), self._read_log())
+
+        print_result("read a log of WAL",
+                     measure(lambda: legacy_read_log(self.legacy_path, size)),
+                     measure(self._read_log))
+
+
+if __name__ == '__main__':
+    unittest.main()
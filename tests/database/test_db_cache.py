@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+from iconservice.database.batch import TransactionBatchValue
+from iconservice.database.cache import LRUCache
+from iconservice.database.db import KeyValueDatabase
+from iconservice.database.wal import StateWAL
+from tests import rmtree
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_and_update(self):
+        cache = LRUCache(2)
+
+        self.assertEqual((False, None), cache.get(b'key0'))
+        self.assertEqual(1, cache.misses)
+
+        cache.update([(b'key0', b'value0'), (b'key1', None)])
+        self.assertEqual((True, b'value0'), cache.get(b'key0'))
+        # Negative lookup
+        self.assertEqual((True, None), cache.get(b'key1'))
+        self.assertEqual(2, cache.hits)
+
+        # b'key0' is the most recently used one, so b'key1' is evicted
+        cache.get(b'key0')
+        cache.update([(b'key2', b'value2')])
+        self.assertEqual(2, len(cache))
+        self.assertIn(b'key0', cache)
+        self.assertNotIn(b'key1', cache)
+        self.assertIn(b'key2', cache)
+
+    def test_put_if_unchanged(self):
+        cache = LRUCache(10)
+
+        generation: int = cache.generation
+        cache.update([(b'key0', b'new')])
+        # A value read before the update above must not overwrite the new one
+        cache.put_if_unchanged(b'key0', b'old', generation)
+        self.assertEqual((True, b'new'), cache.get(b'key0'))
+
+        cache.put_if_unchanged(b'key1', b'value1', cache.generation)
+        self.assertEqual((True, b'value1'), cache.get(b'key1'))
+
+    def test_empty_value_is_cached_as_given(self):
+        cache = LRUCache(10)
+        cache.update([(b'key0', b''), (b'key1', None)])
+        self.assertEqual((True, b''), cache.get(b'key0'))
+        self.assertEqual((True, None), cache.get(b'key1'))
+
+
+class TestKeyValueDatabaseWithCache(unittest.TestCase):
+    def setUp(self):
+        self.state_db_root_path = 'state_db'
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+
+        self.db = KeyValueDatabase.from_path(self.state_db_root_path, True, cache_size=100)
+
+    def tearDown(self):
+        self.db.close()
+        rmtree(self.state_db_root_path)
+
+    def test_read_through(self):
+        db = self.db
+        cache = db.cache
+
+        self.assertIsNone(db.get(b'key0'))
+        self.assertEqual(1, cache.misses)
+        self.assertIsNone(db.get(b'key0'))
+        self.assertEqual(1, cache.hits)
+
+        db.put(b'key0', b'value0')
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertEqual(2, cache.hits)
+
+        db.delete(b'key0')
+        self.assertIsNone(db.get(b'key0'))
+
+    def test_write_batch_refreshes_cache(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        db.put(b'key1', b'value1')
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertEqual(b'value1', db.get(b'key1'))
+
+        data = {
+            b'key0': TransactionBatchValue(b'value00', True),
+            b'key1': TransactionBatchValue(None, True),
+            b'key2': TransactionBatchValue(b'value2', True)
+        }
+        self.assertEqual(3, db.write_batch(StateWAL(data)))
+
+        hits: int = db.cache.hits
+        self.assertEqual(b'value00', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+        self.assertEqual(b'value2', db.get(b'key2'))
+        self.assertEqual(hits + 3, db.cache.hits)
+
+    def test_empty_value(self):
+        db = self.db
+
+        # put() writes an empty value while write_batch() deletes a key with it
+        db.put(b'key0', b'')
+        db.write_batch([(b'key1', b'')])
+
+        for key, value in ((b'key0', b''), (b'key1', None)):
+            self.assertEqual(value, db.get(key))
+            db.clear_cache()
+            self.assertEqual(value, db.get(key))
+
+    def test_get_many(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        db.put(b'key2', b'value2')
+        db.clear_cache()
+        self.assertEqual(b'value0', db.get(b'key0'))
+
+        keys = [b'key2', b'key0', b'key1', b'key2']
+        self.assertEqual([b'value2', b'value0', None, b'value2'], db.get_many(keys))
+
+        # Every key read from db is cached including the missing one
+        hits: int = db.cache.hits
+        self.assertEqual([b'value2', b'value0', None, b'value2'], db.get_many(keys))
+        self.assertEqual(hits + len(keys), db.cache.hits)
+
+    def test_snapshot(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+
+        snapshot = db.acquire_snapshot()
+        # The same snapshot is shared until db is changed
+        self.assertIs(snapshot, db.acquire_snapshot())
+        db.release_snapshot(snapshot)
+        self.assertEqual(b'value0', db.get(b'key0', snapshot))
+
+        data = {
+            b'key0': TransactionBatchValue(b'value00', True),
+            b'key1': TransactionBatchValue(b'value1', True)
+        }
+        db.write_batch(StateWAL(data))
+
+        # Cached values of the new state are not used with the old snapshot
+        self.assertEqual([b'value0', None], db.get_many([b'key0', b'key1'], snapshot))
+        self.assertEqual(b'value0', db.get(b'key0', snapshot))
+        self.assertEqual(b'value00', db.get(b'key0'))
+
+        new_snapshot = db.acquire_snapshot()
+        self.assertIsNot(snapshot, new_snapshot)
+        self.assertEqual([b'value00', b'value1'], db.get_many([b'key0', b'key1'], new_snapshot))
+        db.release_snapshot(new_snapshot)
+
+        self.assertEqual(1, snapshot.refcount)
+        db.release_snapshot(snapshot)
+        self.assertEqual(0, snapshot.refcount)
+
+    def test_clear_cache(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        self.assertEqual(1, len(db.cache))
+
+        db.clear_cache()
+        self.assertEqual(0, len(db.cache))
+        self.assertEqual(b'value0', db.get(b'key0'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -67,6 +67,19 @@ class TestKeyValueDatabase(unittest.TestCase):
         self.assertEqual(b'value1', db.get(b'key1'))
         self.assertEqual(b'value0', db.get(b'key0'))
 
+    def test_iterator_with_prefix(self):
+        db = self.db
+        db.write_batch([(b'a|1', b'1'), (b'a|0', b'0'), (b'b|0', b'2')])
+
+        with db.iterator(b'a|') as it:
+            self.assertEqual([(b'a|0', b'0'), (b'a|1', b'1')], list(it))
+
+        snapshot = db.acquire_snapshot()
+        db.put(b'a|2', b'3')
+        with db.iterator(b'a|', snapshot) as it:
+            self.assertEqual([(b'a|0', b'0'), (b'a|1', b'1')], list(it))
+        db.release_snapshot(snapshot)
+
 
 class TestContextDatabaseOnWriteMode(unittest.TestCase):
     def setUp(self):
@@ -106,6 +119,113 @@ class TestContextDatabaseOnWriteMode(unittest.TestCase):
         value = self.context_db.get(context, address.body)
         self.assertEqual(100, int.from_bytes(value, 'big'))
 
+    def test_get_from_parent_block_batch(self):
+        context = self.context
+        self.context_db.key_value_db.put(b'key0', b'db')
+        self.context_db.key_value_db.put(b'key1', b'db')
+
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'grandparent', True)
+        tx_batch[b'key2'] = TransactionBatchValue(b'grandparent', True)
+        grandparent = BlockBatch()
+        grandparent.update(tx_batch)
+
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'parent', True)
+        tx_batch[b'key3'] = TransactionBatchValue(None, True)
+        parent = BlockBatch()
+        parent.update(tx_batch)
+        parent.parent = grandparent
+
+        context.block_batch.parent = parent
+
+        self.assertEqual(b'parent', self.context_db.get(context, b'key0'))
+        self.assertEqual(b'db', self.context_db.get(context, b'key1'))
+        self.assertEqual(b'grandparent', self.context_db.get(context, b'key2'))
+        self.assertIsNone(self.context_db.get(context, b'key3'))
+
+        # The states of parent blocks are not written to db with the current block
+        self.context_db._put(context, b'key1', b'child', True)
+        self.assertEqual(b'child', self.context_db.get(context, b'key1'))
+        self.assertEqual(1, len(context.tx_batch))
+
+    def test_get_many(self):
+        context = self.context
+        self.context_db.key_value_db.put(b'key0', b'db')
+        self.context_db.key_value_db.put(b'key1', b'db')
+
+        tx_batch = TransactionBatch()
+        tx_batch[b'key1'] = TransactionBatchValue(b'parent', True)
+        tx_batch[b'key2'] = TransactionBatchValue(None, True)
+        parent = BlockBatch()
+        parent.update(tx_batch)
+        context.block_batch.parent = parent
+
+        self.context_db._put(context, b'key3', b'tx', True)
+
+        keys = [b'key3', b'key0', b'key1', b'key2', b'key4']
+        expected = [b'tx', b'db', b'parent', None, None]
+        self.assertEqual(expected, self.context_db.get_many(context, keys))
+        self.assertEqual([self.context_db.get(context, key) for key in keys], expected)
+
+    def test_iterator(self):
+        context = self.context
+        key_value_db = self.context_db.key_value_db
+        key_value_db.put(b'a|0', b'db')
+        key_value_db.put(b'a|1', b'db')
+        key_value_db.put(b'a|2', b'db')
+        key_value_db.put(b'b|0', b'db')
+
+        tx_batch = TransactionBatch()
+        tx_batch[b'a|1'] = TransactionBatchValue(b'parent', True)
+        tx_batch[b'a|2'] = TransactionBatchValue(None, True)
+        tx_batch[b'a|3'] = TransactionBatchValue(b'parent', True)
+        parent = BlockBatch()
+        parent.update(tx_batch)
+        context.block_batch.parent = parent
+
+        self.context_db._put(context, b'a|4', b'tx', True)
+
+        expected = [(b'a|0', b'db'), (b'a|1', b'parent'), (b'a|3', b'parent'), (b'a|4', b'tx')]
+        self.assertEqual(expected, self.context_db.iterator(context, b'a|'))
+
+        # tx_batch is not merged into items but read on get_from_items()
+        keys = [b'a|0', b'a|1', b'a|2', b'a|3', b'a|4', b'a|5']
+        items = self.context_db.get_items(context, keys)
+        self.assertEqual([b'db', b'parent', None, b'parent', None, None], [items[key] for key in keys])
+        self.context_db._put(context, b'a|0', b'tx', True)
+        for key in keys:
+            self.assertEqual(self.context_db.get(context, key), self.context_db.get_from_items(context, key, items))
+
+        # A key added to a block batch after the keys with a prefix are looked up
+        tx_batch = TransactionBatch()
+        tx_batch[b'a|5'] = TransactionBatchValue(b'parent', True)
+        tx_batch[b'a|1'] = TransactionBatchValue(None, True)
+        parent.update(tx_batch)
+        self.assertEqual([b'a|1', b'a|2', b'a|3', b'a|5'], parent.keys_with_prefix(b'a|'))
+        self.assertEqual(
+            [(b'a|0', b'tx'), (b'a|3', b'parent'), (b'a|4', b'tx'), (b'a|5', b'parent')],
+            self.context_db.iterator(context, b'a|'))
+
+    def test_query_reads_snapshot(self):
+        context_db = self.context_db
+        key_value_db = context_db.key_value_db
+        key_value_db.put(b'key0', b'value0')
+
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        context.snapshots = {}
+        self.assertEqual(b'value0', context_db.get(context, b'key0'))
+        snapshot = context.snapshots[key_value_db]
+
+        # Changes committed while processing the query are not visible to it
+        key_value_db.write_batch([(b'key0', b'value00'), (b'key1', b'value1')])
+        self.assertEqual(b'value0', context_db.get(context, b'key0'))
+        self.assertIsNone(context_db.get(context, b'key1'))
+
+        context.release_snapshots()
+        self.assertEqual(0, snapshot.refcount)
+        self.assertEqual(b'value00', context_db.get(IconScoreContext(IconScoreContextType.QUERY), b'key0'))
+
     def test_put(self):
         """WritableDatabase supports put()
         """
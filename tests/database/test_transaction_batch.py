@@ -150,3 +150,70 @@ class TestTransactionBatch(unittest.TestCase):
         block_batch = BlockBatch()
         block_batch.update(tx_batch)
         self.assertEqual((b'value0', True), block_batch[b'key0'])
+
+    def test_revert_call_restores_overwritten_values(self):
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = b'value0'
+        tx_batch[b'key1'] = b'value1'
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = b'value00'
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = b'value000'
+        tx_batch[b'key2'] = b'value2'
+        self.assertEqual(b'value000', tx_batch[b'key0'])
+
+        tx_batch.revert_call()
+        self.assertEqual(b'value00', tx_batch[b'key0'])
+        self.assertNotIn(b'key2', tx_batch)
+        tx_batch.leave_call()
+
+        tx_batch[b'key3'] = b'value3'
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+
+        self.assertEqual(1, tx_batch.call_count)
+        self.assertEqual(2, len(tx_batch))
+        self.assertEqual(b'value0', tx_batch[b'key0'])
+        self.assertEqual(b'value1', tx_batch[b'key1'])
+        self.assertNotIn(b'key3', tx_batch)
+
+    def test_revert_call_after_leave_call(self):
+        tx_batch = TransactionBatch()
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = b'value0'
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = b'value00'
+        tx_batch[b'key1'] = b'value1'
+        tx_batch.leave_call()
+        self.assertEqual(2, len(tx_batch))
+
+        # Changes merged from the inner call are reverted with the outer call
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+
+        self.assertEqual(0, len(tx_batch))
+        self.assertIsNone(tx_batch[b'key0'])
+        self.assertIsNone(tx_batch[b'key1'])
+
+    def test_key_order(self):
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = b'value0'
+
+        tx_batch.enter_call()
+        tx_batch[b'key1'] = b'value1'
+        tx_batch[b'key0'] = b'value00'
+        tx_batch.leave_call()
+
+        tx_batch.enter_call()
+        tx_batch[b'key2'] = b'value2'
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+
+        tx_batch[b'key3'] = b'value3'
+
+        self.assertEqual([b'key0', b'key1', b'key3'], list(tx_batch))
+        self.assertEqual(b'value00', tx_batch[b'key0'])
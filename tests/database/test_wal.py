@@ -15,14 +15,17 @@
 
 import os
 import random
+import struct
 import unittest
 
+import msgpack
 import pytest
 
 from iconservice.base.block import Block
 from iconservice.base.exception import IllegalFormatException
 from iconservice.database.wal import (
-    _MAGIC_KEY, _FILE_VERSION, _OFFSET_VERSION, _HEADER_SIZE,
+    _MAGIC_KEY, _FILE_VERSION, _OFFSET_VERSION, _HEADER_SIZE, _V1_FILE_VERSION, _V1_HEADER_STRUCT_FORMAT,
+    _READ_CHUNK_SIZE, _RECORD_HEADER_SIZE,
     WriteAheadLogReader, WriteAheadLogWriter, WALogable, WALState
 )
 from iconservice.icon_constant import Revision
@@ -168,3 +171,160 @@ class TestWriteAheadLog(unittest.TestCase):
         reader = WriteAheadLogReader()
         with pytest.raises(IllegalFormatException):
             reader.open(self.path)
+
+    def _write_wal(self, instant_block_hash: bytes) -> list:
+        """Write a WAL and returns the file sizes after each step
+        """
+        writer = WriteAheadLogWriter(Revision.IISS.value, 2, self.block, instant_block_hash)
+        writer.open(self.path)
+        writer.write_state(WALState.CALC_PERIOD_START_BLOCK.value, add=False)
+        sizes = [os.path.getsize(self.path)]
+
+        writer.write_walogable(WALogableData(self.log_data[0]))
+        writer.write_walogable(WALogableData(self.log_data[1]))
+        writer.flush()
+        sizes.append(os.path.getsize(self.path))
+
+        # A state is appended and passed to OS without rewriting the header
+        for state in (WALState.WRITE_RC_DB, WALState.WRITE_STATE_DB, WALState.SEND_COMMIT_BLOCK):
+            writer.write_state(state.value, add=True)
+            sizes.append(os.path.getsize(self.path))
+
+        writer.close()
+        return sizes
+
+    def test_append_only(self):
+        instant_block_hash = create_block_hash()
+        sizes = self._write_wal(instant_block_hash)
+        assert sizes == sorted(set(sizes))
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+        assert data[:_HEADER_SIZE] == struct.pack(">4sII32s", _MAGIC_KEY, _FILE_VERSION, Revision.IISS.value,
+                                                  instant_block_hash)
+
+    def test_truncated_wal(self):
+        # Records which are not completely written on a crash are ignored
+        self._write_wal(create_block_hash())
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        expected_states = [
+            WALState.CALC_PERIOD_START_BLOCK.value,
+            (WALState.CALC_PERIOD_START_BLOCK | WALState.WRITE_RC_DB).value,
+            (WALState.CALC_PERIOD_START_BLOCK | WALState.WRITE_RC_DB | WALState.WRITE_STATE_DB).value,
+            (WALState.CALC_PERIOD_START_BLOCK | WALState.WRITE_RC_DB | WALState.WRITE_STATE_DB |
+             WALState.SEND_COMMIT_BLOCK).value,
+        ]
+        prev_log_count = 0
+        prev_state = 0
+
+        for size in range(len(data) + 1):
+            with open(self.path, "wb") as f:
+                f.write(data[:size])
+
+            reader = WriteAheadLogReader()
+            try:
+                reader.open(self.path)
+            except IllegalFormatException:
+                # Header or block is incomplete
+                assert prev_log_count == 0 and prev_state == 0
+                reader.close()
+                continue
+
+            assert reader.block == self.block
+            assert prev_log_count <= reader.log_count <= 2
+            assert reader.state in [0] + expected_states
+            assert reader.state >= prev_state
+            if reader.log_count < 2:
+                assert reader.state in (0, WALState.CALC_PERIOD_START_BLOCK.value)
+
+            for i in range(reader.log_count):
+                assert dict(reader.get_iterator(i)) == self.log_data[i]
+
+            prev_log_count = reader.log_count
+            prev_state = reader.state
+            reader.close()
+
+        assert prev_log_count == 2
+        assert prev_state == expected_states[-1]
+
+    def test_corrupted_record(self):
+        self._write_wal(create_block_hash())
+        with open(self.path, "rb+") as f:
+            f.seek(-10, 2)
+            f.write(b"\xff")
+
+        reader = WriteAheadLogReader()
+        reader.open(self.path)
+        # The last state record is ignored
+        assert reader.log_count == 2
+        assert reader.state == (WALState.CALC_PERIOD_START_BLOCK | WALState.WRITE_RC_DB |
+                                WALState.WRITE_STATE_DB).value
+        reader.close()
+
+    def test_large_log(self):
+        # A log larger than a chunk is unpacked across chunks
+        log_data = {os.urandom(32): os.urandom(random.randint(0, 100)) for _ in range(_READ_CHUNK_SIZE // 64)}
+        log_data[b"none"] = None
+
+        writer = WriteAheadLogWriter(Revision.IISS.value, 2, self.block, create_block_hash())
+        writer.open(self.path)
+        size = writer.write_walogable(WALogableData(log_data))
+        writer.write_walogable(WALogableData(self.log_data[1]))
+        writer.close()
+
+        # Entries are packed in the same format as before
+        packed = b"".join(msgpack.packb([key, value]) for key, value in log_data.items())
+        assert size == len(packed) > _READ_CHUNK_SIZE
+        with open(self.path, "rb") as f:
+            data = f.read()
+        offset = data.index(packed)
+        assert data[offset - _RECORD_HEADER_SIZE:offset] == struct.pack(">BI", 1, size)
+
+        reader = WriteAheadLogReader()
+        reader.open(self.path)
+        assert dict(reader.get_iterator(0)) == log_data
+        assert dict(reader.get_iterator(1)) == self.log_data[1]
+
+        # The file can be closed while an iterator is not exhausted
+        it = reader.get_iterator(0)
+        next(it)
+        reader.close()
+
+    def test_read_version_1(self):
+        # Backup files made before are written in version 1
+        revision = Revision.IISS.value
+        instant_block_hash = create_block_hash()
+        state = (WALState.WRITE_RC_DB | WALState.WRITE_STATE_DB).value
+
+        block_data = self.block.to_bytes(revision)
+        logs = [b"".join(msgpack.packb([key, value]) for key, value in log_data.items())
+                for log_data in self.log_data]
+
+        offset = struct.calcsize(_V1_HEADER_STRUCT_FORMAT) + 4 * len(logs) + 4 + len(block_data)
+        offsets = []
+        for log in logs:
+            offsets.append(offset)
+            offset += 4 + len(log)
+
+        with open(self.path, "wb") as f:
+            f.write(struct.pack(_V1_HEADER_STRUCT_FORMAT,
+                                _MAGIC_KEY, _V1_FILE_VERSION, revision, state, instant_block_hash, len(logs)))
+            for offset in offsets:
+                f.write(offset.to_bytes(4, "big"))
+            f.write(len(block_data).to_bytes(4, "big") + block_data)
+            for log in logs:
+                f.write(len(log).to_bytes(4, "big") + log)
+
+        reader = WriteAheadLogReader()
+        reader.open(self.path)
+        assert reader.version == _V1_FILE_VERSION
+        assert reader.revision == revision
+        assert reader.state == state
+        assert reader.block == self.block
+        assert reader.instant_block_hash == instant_block_hash
+        assert reader.log_count == len(logs)
+        for i in range(len(logs)):
+            assert dict(reader.get_iterator(i)) == self.log_data[i]
+        reader.close()
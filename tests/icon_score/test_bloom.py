@@ -14,6 +14,8 @@
 from __future__ import unicode_literals
 import itertools
 
+import pytest
+
 from hypothesis import (
     strategies as st,
     given,
@@ -22,6 +24,7 @@ from hypothesis import (
 
 from iconservice.utils.bloom import (
     BloomFilter,
+    get_bloom_value,
 )
 
 
@@ -78,6 +81,27 @@ def test_bloom_filter_from_iterable_method(log_entries):
     check_bloom(bloom, log_entries)
 
 
+@given(log_entries)
+@settings(max_examples=2000)
+def test_get_bloom_value(log_entries):
+    bloomables = list(itertools.chain.from_iterable(
+        itertools.chain([address], topics)
+        for address, topics
+        in log_entries
+    ))
+
+    bloom = BloomFilter()
+    for bloomable in bloomables:
+        bloom.add(bloomable)
+
+    assert get_bloom_value(bloomables) == int(bloom)
+
+
+def test_get_bloom_value_with_invalid_type():
+    with pytest.raises(TypeError):
+        get_bloom_value([b'value', 'value'])
+
+
 def test_casting_to_integer():
     bloom = BloomFilter()
 
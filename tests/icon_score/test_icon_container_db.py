@@ -15,13 +15,16 @@
 # limitations under the License.
 
 import unittest
+from unittest.mock import patch
 
 from iconservice import Address
-from iconservice.database.db import ContextDatabase, IconScoreDatabase
+from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.db import ContextDatabase, IconScoreDatabase, DatabaseObserver
 from iconservice.iconscore.icon_score_context import IconScoreContextType, IconScoreContext
 from iconservice.base.address import AddressPrefix
-from iconservice.base.exception import InvalidParamsException
-from iconservice.iconscore.icon_container_db import ContainerUtil, DictDB, ArrayDB, VarDB
+from iconservice.base.exception import InvalidParamsException, InvalidContainerAccessException
+from iconservice.icon_constant import Revision
+from iconservice.iconscore.icon_container_db import ContainerUtil, DictDB, ArrayDB, VarDB, BULK_READ_CHUNK_SIZE
 from iconservice.iconscore.icon_score_context import ContextContainer
 from tests import create_address
 from tests.mock_db import MockKeyValueDatabase
@@ -339,6 +342,145 @@ class TestIconContainerDB(unittest.TestCase):
         with self.assertRaises(InvalidParamsException):
             prefix: bytes = ContainerUtil.create_db_prefix(VarDB, 'vardb')
 
+    def _set_get_observer(self) -> list:
+        read_keys = []
+        self.db.set_observer(DatabaseObserver(lambda context, key, value: read_keys.append(key),
+                                              lambda *args: None,
+                                              lambda *args: None))
+        return read_keys
+
+    def test_array_db_bulk_read(self):
+        self._context.revision = Revision.CONTAINER_DB_BULK_ACCESS.value
+        values = list(range(100))
+        testarray = ArrayDB('TEST', self.db, value_type=int)
+        for value in values:
+            testarray.put(value)
+        # Not an element of testarray
+        ArrayDB('TEST|0', self.db, value_type=int).put(1000)
+
+        read_keys = self._set_get_observer()
+        self.assertEqual(values, [value for value in testarray])
+        per_element_keys = [testarray._db._hash_key(ContainerUtil.encode_key(i)) for i in values]
+        # size and every element are charged as before
+        self.assertEqual(101, len(read_keys))
+        self.assertEqual(per_element_keys, read_keys[1:])
+
+        read_keys.clear()
+        self.assertIn(10, testarray)
+        self.assertEqual(12, len(read_keys))
+        self.assertNotIn(1000, testarray)
+
+        self.assertEqual(values[10:-10:3], testarray[10:-10:3])
+        self.assertEqual(values[::-1], testarray[::-1])
+        self.assertEqual([], testarray[200:])
+
+    def test_array_db_bulk_read_sees_changes_while_iterating(self):
+        context = IconScoreContext(IconScoreContextType.INVOKE)
+        context.current_address = self.db.address
+        context.block_batch = BlockBatch()
+        context.tx_batch = TransactionBatch()
+        ContextContainer._push_context(context)
+
+        testarray = ArrayDB('TEST', self.db, value_type=int)
+        for value in range(20):
+            testarray.put(value)
+
+        result = []
+        for index, value in enumerate(testarray):
+            result.append(value)
+            if index + 1 < len(testarray):
+                testarray[index + 1] = value * 10
+        self.assertEqual([0] * 20, result)
+
+    def test_array_db_bulk_read_only_in_range(self):
+        testarray = ArrayDB('TEST', self.db, value_type=int)
+        for value in range(1000):
+            testarray.put(value)
+
+        context = IconScoreContext(IconScoreContextType.INVOKE)
+        context.current_address = self.db.address
+        context.revision = Revision.CONTAINER_DB_BULK_ACCESS.value
+        context.block_batch = BlockBatch()
+        context.tx_batch = TransactionBatch()
+        ContextContainer._push_context(context)
+
+        key_value_db = self.db._context_db.key_value_db
+        read_keys = []
+
+        def get_many(keys, snapshot=None):
+            read_keys.extend(keys)
+            return [key_value_db.get(key) for key in keys]
+
+        with patch.object(key_value_db, "get_many", side_effect=get_many):
+            self.assertEqual(list(range(500, 532)), testarray[500:532])
+            self.assertEqual(32, len(read_keys))
+
+            # Elements are read in chunks until iteration stops
+            read_keys.clear()
+            self.assertIn(3, testarray)
+            self.assertEqual(BULK_READ_CHUNK_SIZE, len(read_keys))
+
+    def test_array_db_slice_before_revision(self):
+        testarray = ArrayDB('TEST', self.db, value_type=int)
+        testarray.put(1)
+
+        with self.assertRaises(InvalidParamsException):
+            testarray[0:1]
+
+    def test_dict_db_keys(self):
+        test_dict = DictDB('TEST', self.db, value_type=int)
+        test_dict[b'b'] = 2
+        test_dict[b'a'] = 1
+        test_dict[b'c'] = 3
+        del test_dict[b'c']
+
+        with self.assertRaises(InvalidContainerAccessException):
+            test_dict.keys()
+
+        self._context.revision = Revision.CONTAINER_DB_BULK_ACCESS.value
+        read_keys = self._set_get_observer()
+        self.assertEqual([b'a', b'b'], test_dict.keys())
+        self.assertEqual(2, len(read_keys))
+
+        addresses = []
+        while len(addresses) < 3:
+            address = create_address()
+            if b'|' not in address.to_bytes():
+                addresses.append(address)
+        addresses.sort(key=lambda address: address.to_bytes())
+        address_dict = DictDB('ADDR', self.db, value_type=int)
+        for address in addresses:
+            address_dict[address] = 1
+        self.assertEqual(addresses, address_dict.keys(Address))
+
+        nested_dict = DictDB('NESTED', self.db, value_type=int, depth=2)
+        nested_dict['x']['y'] = 1
+        self.assertEqual(['y'], nested_dict['x'].keys(str))
+        with self.assertRaises(InvalidContainerAccessException):
+            nested_dict.keys()
+
+    def test_dict_db_keys_with_colliding_container(self):
+        self._context.revision = Revision.CONTAINER_DB_BULK_ACCESS.value
+        test_dict = DictDB('TEST', self.db, value_type=int)
+        test_dict['a'] = 1
+        test_dict['b'] = 2
+
+        # The keys of a container whose name does not start with 'TEST|' are not in the range
+        DictDB('TESTx', self.db, value_type=int)['c'] = 3
+        DictDB('TES', self.db, value_type=int)['Tc'] = 3
+        self.assertEqual(['a', 'b'], test_dict.keys(str))
+
+        # test_dict['x|c'] and DictDB('TEST|x')['c'] are stored at the same key
+        DictDB('TEST|x', self.db, value_type=int)['c'] = 3
+        self.assertEqual(3, test_dict['x|c'])
+        with self.assertRaises(InvalidContainerAccessException):
+            test_dict.keys(str)
+
+        nested_dict = DictDB('TEST', self.db, value_type=int, depth=2)
+        del DictDB('TEST|x', self.db, value_type=int)['c']
+        nested_dict['y']['z'] = 4
+        with self.assertRaises(InvalidContainerAccessException):
+            test_dict.keys(str)
 
 """
 Dict DB infinity infinite case
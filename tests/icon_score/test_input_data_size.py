@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest.mock import patch
+
+import pytest
+from hypothesis import (
+    strategies as st,
+    given,
+    settings,
+)
+
+from iconservice.icon_constant import Revision
+from iconservice.iconscore import icon_score_step
+from iconservice.iconscore.icon_score_step import (
+    get_input_data_size,
+    get_json_size,
+)
+from tests import create_tx_hash
+
+keys = st.one_of(st.text(), st.integers(), st.floats(), st.booleans(), st.none())
+leaves = st.one_of(st.none(), st.booleans(), st.integers(), st.floats(), st.text())
+json_values = st.recursive(
+    leaves,
+    lambda children: st.one_of(st.lists(children, max_size=5), st.dictionaries(keys, children, max_size=5)),
+    max_leaves=20)
+
+
+def dumps_size(data) -> int:
+    return len(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode())
+
+
+@given(json_values)
+@settings(max_examples=500)
+def test_get_json_size(data):
+    assert dumps_size(data) == get_json_size(data)
+
+
+@pytest.mark.parametrize("data", [
+    "",
+    "\"\\\b\f\n\r\t\x00\x1f\x7f",
+    "한글 and emoji 🙂",
+    "0x" + "ab" * 1024 + "\"\\\n\x00",
+    {"method": "transfer", "params": {"_to": "hx" + "0" * 40, "_value": "0x1"}},
+    {"contentType": "application/zip", "content": "0x" + "ab" * 1024},
+    (1, -2, 1.5, 1e100, float("nan"), float("inf"), float("-inf"), True, False, None),
+    {1: [], 2.5: {}, "": 0, None: ()},
+    {True: "", False: None, 0.5: -1},
+])
+def test_get_json_size_examples(data):
+    assert dumps_size(data) == get_json_size(data)
+
+
+@pytest.mark.parametrize("data", [b"bytes", {"set": {1}}, {(1, 2): 1}])
+def test_get_json_size_invalid_type(data):
+    with pytest.raises(TypeError):
+        json.dumps(data)
+    with pytest.raises(TypeError):
+        get_json_size(data)
+
+
+def test_get_input_data_size_by_tx_hash():
+    data = {"method": "transfer", "params": {"_value": "0x1"}}
+    tx_hash: bytes = create_tx_hash()
+
+    size: int = get_input_data_size(Revision.LATEST.value, data, tx_hash)
+    assert dumps_size(data) == size
+
+    # The size computed on validation is reused on invoke
+    with patch.object(icon_score_step, "get_json_size") as mock:
+        assert size == get_input_data_size(Revision.THREE.value, data, tx_hash)
+        mock.assert_not_called()
+
+    # The size is not reused for other input data given with the same tx hash
+    other_data = {"method": "transfer", "params": {"_value": "0x" + "f" * 100}}
+    assert dumps_size(other_data) == get_input_data_size(Revision.LATEST.value, other_data, tx_hash)
+    assert size == get_input_data_size(Revision.LATEST.value, dict(data), tx_hash)
+
+    # Revisions which do not use JSON size are not affected
+    assert 0 == get_input_data_size(Revision.FOUR.value, None, tx_hash)
+    assert get_input_data_size(Revision.TWO.value, data) == get_input_data_size(Revision.TWO.value, data, tx_hash)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import unittest
+from unittest.mock import Mock, patch
+
+from iconservice.base.address import AddressPrefix
+from iconservice.iconscore.icon_score_context_util import IconScoreContextUtil
+from iconservice.iconscore.score_bytecode_cache import ScoreBytecodeCache
+from iconservice.iconscore.score_package_validator import ScorePackageValidator
+from iconservice.iconscore.utils import get_score_deploy_path
+from tests import create_address, create_tx_hash, rmtree
+
+TEST_ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+WHITELIST = {"iconservice": ['*']}
+
+
+class TestScoreBytecodeCache(unittest.TestCase):
+    _SCORE_ROOT_PATH = '.score'
+
+    def setUp(self):
+        self.address = create_address(AddressPrefix.CONTRACT)
+        self.tx_hash = create_tx_hash()
+        self.deploy_path = get_score_deploy_path(self._SCORE_ROOT_PATH, self.address, self.tx_hash)
+
+        shutil.copytree(os.path.join(TEST_ROOT_PATH, 'sample', 'sample_token'), self.deploy_path,
+                        ignore=shutil.ignore_patterns('__pycache__'))
+
+    def tearDown(self):
+        rmtree(self._SCORE_ROOT_PATH)
+
+    def test_content_hash(self):
+        content_hash: bytes = ScoreBytecodeCache.make_content_hash(self.deploy_path)
+        self.assertEqual(32, len(content_hash))
+
+        # __pycache__ is not a part of contents
+        os.makedirs(os.path.join(self.deploy_path, '__pycache__'))
+        with open(os.path.join(self.deploy_path, '__pycache__', 'sample_token.pyc'), 'wb') as f:
+            f.write(b'\x00')
+        self.assertEqual(content_hash, ScoreBytecodeCache.make_content_hash(self.deploy_path))
+
+        with open(os.path.join(self.deploy_path, 'sample_token.py'), 'a') as f:
+            f.write('\n')
+        self.assertNotEqual(content_hash, ScoreBytecodeCache.make_content_hash(self.deploy_path))
+
+    def test_write(self):
+        content_hash: bytes = ScoreBytecodeCache.make_content_hash(self.deploy_path)
+        whitelist_hash: bytes = ScoreBytecodeCache.make_whitelist_hash(WHITELIST)
+        self.assertFalse(ScoreBytecodeCache.is_valid(self.deploy_path, content_hash, whitelist_hash))
+
+        ScoreBytecodeCache.write(self.deploy_path, content_hash, whitelist_hash)
+        self.assertTrue(os.path.isfile(ScoreBytecodeCache.get_record_path(self.deploy_path)))
+        self.assertTrue(os.listdir(os.path.join(self.deploy_path, '__pycache__')))
+        self.assertTrue(ScoreBytecodeCache.is_valid(self.deploy_path, content_hash, whitelist_hash))
+
+        # A record is tied to both the contents and the import whitelist
+        other_whitelist_hash: bytes = ScoreBytecodeCache.make_whitelist_hash({"iconservice": ['*'], "json": ['*']})
+        self.assertFalse(ScoreBytecodeCache.is_valid(self.deploy_path, content_hash, other_whitelist_hash))
+        self.assertFalse(ScoreBytecodeCache.is_valid(self.deploy_path, create_tx_hash(), whitelist_hash))
+
+    @patch.object(ScorePackageValidator, 'execute')
+    @patch.object(IconScoreContextUtil, '_get_import_whitelist', return_value=WHITELIST)
+    @patch.object(IconScoreContextUtil, 'is_service_flag_on', return_value=True)
+    def test_validate_score_package(self, _is_service_flag_on, _get_import_whitelist, execute):
+        context = Mock()
+        context.score_root_path = self._SCORE_ROOT_PATH
+
+        IconScoreContextUtil.validate_score_package(context, self.address, self.tx_hash)
+        execute.assert_called_once()
+
+        # The SCORE which has already been validated is skipped
+        execute.reset_mock()
+        IconScoreContextUtil.validate_score_package(context, self.address, self.tx_hash)
+        execute.assert_not_called()
+
+        # The SCORE is validated again if its contents are changed
+        with open(os.path.join(self.deploy_path, 'sample_token.py'), 'a') as f:
+            f.write('\n')
+        IconScoreContextUtil.validate_score_package(context, self.address, self.tx_hash)
+        execute.assert_called_once()
+
+    @patch.object(ScorePackageValidator, 'execute', side_effect=Exception('Invalid import name'))
+    @patch.object(IconScoreContextUtil, '_get_import_whitelist', return_value=WHITELIST)
+    @patch.object(IconScoreContextUtil, 'is_service_flag_on', return_value=True)
+    def test_validate_score_package_failure(self, _is_service_flag_on, _get_import_whitelist, execute):
+        context = Mock()
+        context.score_root_path = self._SCORE_ROOT_PATH
+
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                IconScoreContextUtil.validate_score_package(context, self.address, self.tx_hash)
+
+        self.assertEqual(2, execute.call_count)
+        self.assertFalse(os.path.exists(ScoreBytecodeCache.get_record_path(self.deploy_path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from iconservice.database.db import IconScoreDatabase
+from iconservice.iconscore.icon_container_db import ArrayDB, DictDB, VarDB
+from iconservice.iconscore.icon_score_base import IconScoreBase, external
+from iconservice.iconscore.icon_score_constant import CONST_CLASS_REUSABLE
+from iconservice.iconscore.score_instance_auditor import ScoreInstanceAuditor
+
+MAX_VALUE = 100
+
+
+class TokenScore(IconScoreBase):
+    """Keeps its state only in container DBs"""
+
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._total_supply = VarDB('total_supply', db, value_type=int)
+        self._balances = DictDB('balances', db, value_type=int)
+        self._holders = ArrayDB('holders', db, value_type=str)
+        self._max_value: int = MAX_VALUE
+        self._symbol = "TOKEN"
+
+    def on_install(self) -> None:
+        super().on_install()
+        self._total_supply.set(MAX_VALUE)
+
+    def on_update(self) -> None:
+        super().on_update()
+
+    @external
+    def transfer(self, _to: str, _value: int) -> None:
+        self._balances[_to] += _value
+        self._holders.put(_to)
+
+    @external(readonly=True)
+    def balancesOf(self, _owners: str) -> list:
+        return [self._balances[owner] for owner in self._split(_owners)]
+
+    @staticmethod
+    def _split(text: str) -> list:
+        return text.split(',') if text else []
+
+
+class DerivedTokenScore(TokenScore):
+    def __init__(self, db: IconScoreDatabase) -> None:
+        TokenScore.__init__(self, db)
+        self._allowances = DictDB('allowances', db, value_type=int, depth=2)
+
+
+class MemberVariableScore(TokenScore):
+    def on_install(self) -> None:
+        super().on_install()
+        self._name = "on_install"
+
+
+class TupleAssignmentScore(TokenScore):
+    @external
+    def reset(self) -> None:
+        self._symbol, _ = "", None
+
+
+class SetattrScore(TokenScore):
+    @external
+    def reset(self) -> None:
+        setattr(self, '_symbol', "")
+
+
+class AliasScore(TokenScore):
+    @external
+    def reset(self) -> None:
+        me = self
+        me._symbol = ""
+
+
+class ObjectSetattrScore(TokenScore):
+    @external
+    def reset(self) -> None:
+        object.__setattr__(self, '_symbol', "")
+
+
+class SuperSetattrScore(TokenScore):
+    @external
+    def reset(self) -> None:
+        super().__setattr__('_symbol', "")
+
+
+class PassSelfScore(TokenScore):
+    @external
+    def reset(self) -> None:
+        _reset(self)
+
+
+class ReturnSelfScore(TokenScore):
+    def _get_self(self) -> 'ReturnSelfScore':
+        return self
+
+
+class ClosureScore(TokenScore):
+    def _get_symbol(self):
+        return lambda: self._symbol
+
+
+class MemberAttributeScore(TokenScore):
+    @external
+    def reset(self) -> None:
+        self._balances.__class__ = DictDB
+
+
+class GetattrScore(TokenScore):
+    @external(readonly=True)
+    def get(self, _name: str) -> int:
+        return getattr(self._balances, _name)
+
+
+def _reset(score: TokenScore) -> None:
+    score._symbol = ""
+
+
+class ComputedInitScore(TokenScore):
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._cache = {}
+
+
+class LogicInitScore(TokenScore):
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        if MAX_VALUE > 0:
+            self._symbol = "POSITIVE"
+
+
+class NotSelfScore(TokenScore):
+    def _reset(this) -> None:
+        this._symbol = ""
+
+
+class TestScoreInstanceAuditor(unittest.TestCase):
+    def test_reusable(self):
+        self.assertTrue(ScoreInstanceAuditor.is_reusable(TokenScore))
+        self.assertTrue(ScoreInstanceAuditor.is_reusable(DerivedTokenScore))
+
+        # The result is cached in each class
+        self.assertTrue(TokenScore.__dict__[CONST_CLASS_REUSABLE])
+        self.assertTrue(DerivedTokenScore.__dict__[CONST_CLASS_REUSABLE])
+
+    def test_not_reusable(self):
+        for score_class in (MemberVariableScore, TupleAssignmentScore, SetattrScore,
+                            AliasScore, ObjectSetattrScore, SuperSetattrScore, PassSelfScore, ReturnSelfScore,
+                            ClosureScore, MemberAttributeScore, GetattrScore,
+                            ComputedInitScore, LogicInitScore, NotSelfScore):
+            self.assertFalse(ScoreInstanceAuditor.is_reusable(score_class), score_class.__name__)
+            self.assertFalse(score_class.__dict__[CONST_CLASS_REUSABLE])
+
+    def test_no_source(self):
+        score_class = type("DynamicScore", (TokenScore,), {})
+        self.assertFalse(ScoreInstanceAuditor.is_reusable(score_class))
+
+
+if __name__ == '__main__':
+    unittest.main()
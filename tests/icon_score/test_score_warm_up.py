@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import unittest
+
+from iconservice.base.address import AddressPrefix
+from iconservice.iconscore.score_warm_up import ScoreWarmUp
+from iconservice.iconscore.utils import get_package_name_by_address_and_tx_hash
+from tests import create_address, create_tx_hash, rmtree
+
+TEST_ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+
+
+class TestScoreWarmUp(unittest.TestCase):
+    _SCORE_ROOT_PATH = '.score'
+
+    def setUp(self):
+        os.makedirs(self._SCORE_ROOT_PATH, exist_ok=True)
+        sys.path.append(self._SCORE_ROOT_PATH)
+
+    def tearDown(self):
+        rmtree(self._SCORE_ROOT_PATH)
+        sys.path.remove(self._SCORE_ROOT_PATH)
+
+    def _deploy(self, proj: str) -> tuple:
+        address = create_address(AddressPrefix.CONTRACT)
+        tx_hash: bytes = create_tx_hash()
+
+        score_path: str = os.path.join(self._SCORE_ROOT_PATH, address.to_bytes().hex())
+        os.makedirs(score_path, exist_ok=True)
+        os.symlink(os.path.join(TEST_ROOT_PATH, 'sample', proj),
+                   os.path.join(score_path, f'0x{tx_hash.hex()}'), target_is_directory=True)
+
+        return address, tx_hash
+
+    def test_save_and_load(self):
+        scores = [(create_address(AddressPrefix.CONTRACT), create_tx_hash()) for _ in range(3)]
+
+        warm_up = ScoreWarmUp(self._SCORE_ROOT_PATH, 2)
+        self.assertEqual([], warm_up.load())
+
+        # Nothing is saved if no SCORE has been called
+        warm_up.save()
+        self.assertFalse(os.path.exists(warm_up.path))
+
+        for i, (address, tx_hash) in enumerate(scores):
+            for _ in range(i + 1):
+                warm_up.count(address, tx_hash)
+        warm_up.save()
+
+        # The most called SCOREs are loaded on the next run
+        warm_up = ScoreWarmUp(self._SCORE_ROOT_PATH, 2)
+        self.assertEqual([scores[2], scores[1]], warm_up.load())
+
+        # The file of the last run is kept
+        warm_up.save()
+        self.assertEqual([scores[2], scores[1]], warm_up.load())
+
+    def test_load_invalid_file(self):
+        warm_up = ScoreWarmUp(self._SCORE_ROOT_PATH, 2)
+        with open(warm_up.path, 'w') as f:
+            f.write('invalid')
+
+        self.assertEqual([], warm_up.load())
+
+    def test_start(self):
+        address, tx_hash = self._deploy('test_score01')
+        removed_address = create_address(AddressPrefix.CONTRACT)
+
+        warm_up = ScoreWarmUp(self._SCORE_ROOT_PATH, 2)
+        removed_tx_hash: bytes = create_tx_hash()
+        warm_up.count(removed_address, removed_tx_hash)
+        warm_up.count(removed_address, removed_tx_hash)
+        warm_up.count(address, tx_hash)
+        warm_up.save()
+
+        package_name: str = get_package_name_by_address_and_tx_hash(address, tx_hash)
+        self.assertNotIn(package_name, sys.modules)
+
+        # A SCORE which cannot be loaded does not stop warming up
+        warm_up = ScoreWarmUp(self._SCORE_ROOT_PATH, 2)
+        warm_up.start()
+        warm_up.join()
+
+        self.assertIn(package_name, sys.modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
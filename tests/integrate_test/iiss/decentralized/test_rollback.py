@@ -482,6 +482,33 @@ class TestRollback(TestIISSBase):
             balance: int = self.get_balance(account.address)
             assert balance == 0
 
+    def test_rollback_after_recommit(self):
+        # Prevent icon_service_engine from sending RollbackRequest to rc
+        IconScoreContext.engine.iiss.rollback_reward_calculator = Mock()
+
+        prev_block: 'Block' = self.icon_service_engine._get_last_block()
+
+        # Commit 2 blocks which are rolled back later
+        init_balance = icx_to_loop(3000)
+        accounts: List['EOAAccount'] = self.create_eoa_accounts(2)
+        self.distribute_icx(accounts=accounts, init_balance=init_balance)
+        self.transfer_icx(from_=accounts[0], to_=accounts[1], value=icx_to_loop(10))
+
+        self._rollback(prev_block)
+
+        # Commit 2 other blocks at the same heights
+        self.make_empty_blocks(count=1)
+        rollback_block: 'Block' = self.icon_service_engine._get_last_block()
+        self.make_empty_blocks(count=1)
+        assert rollback_block.height == prev_block.height + 1
+
+        # The backups of the blocks rolled back should not be used
+        self._rollback(rollback_block)
+
+        for account in accounts:
+            balance: int = self.get_balance(account.address)
+            assert balance == 0
+
     def _rollback(self, block: 'Block'):
         super().rollback(block.height, block.hash)
         self._check_if_rollback_reward_calculator_is_called(block)
@@ -500,3 +527,17 @@ class TestRollback(TestIISSBase):
     def _check_if_rollback_reward_calculator_is_called(block: 'Block'):
         IconScoreContext.engine.iiss.rollback_reward_calculator.assert_called_with(
             block.height, block.hash)
+
+
+class TestRollbackWithBackupInBackground(TestRollback):
+    def _make_init_config(self) -> dict:
+        conf: dict = super()._make_init_config()
+        conf[ConfigKey.BACKUP_IN_BACKGROUND] = True
+        return conf
+
+
+class TestRollbackWithBackupInDb(TestRollbackWithBackupInBackground):
+    def _make_init_config(self) -> dict:
+        conf: dict = super()._make_init_config()
+        conf[ConfigKey.BACKUP_IN_DB] = True
+        return conf
@@ -14,20 +14,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import itertools
 import os
 import shutil
+import signal
+import traceback
+import unittest
 from enum import IntFlag, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from iconservice.database.db import KeyValueDatabase
 from iconservice.database.wal import WriteAheadLogWriter, StateWAL, IissWAL, WALState
 from iconservice.icon_constant import PREP_MAIN_PREPS, IISS_DB, IconScoreContextType
 from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.iiss.engine import Engine as IISSEngine
 from iconservice.iiss.reward_calc import RewardCalcStorage
 from iconservice.iiss.reward_calc.msg_data import PRepsData, TxData, \
     TxType, Header, GovernanceVariable
 from iconservice.precommit_data_manager import PrecommitData
+from iconservice.rollback.backup_manager import BackupManager
 from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
 from tests.integrate_test.test_integrate_base import EOAAccount
 
@@ -50,6 +57,60 @@ class RCDataCheckFlag(IntFlag):
     ALL_ON_START = ALL_ON_CALC | VERSION | HEADER | GOVERNANCE
 
 
+# Steps of commit between which the process is killed
+# A step called in another step is not counted
+COMMIT_STEPS = (
+    (WriteAheadLogWriter, "open"),
+    (WriteAheadLogWriter, "write_walogable"),
+    (WriteAheadLogWriter, "write_state"),
+    (WriteAheadLogWriter, "flush"),
+    (WriteAheadLogWriter, "close"),
+    (BackupManager, "run"),
+    (IconServiceEngine, "_process_iiss_commit"),
+    (IconServiceEngine, "_process_state_commit"),
+    (RewardCalcStorage, "rename_standby_db_to_iiss_db"),
+    (IISSEngine, "send_commit"),
+    (IISSEngine, "send_calculate"),
+    (os, "remove"),
+)
+
+
+def _kill_on_step(crash_step: int, fd: int):
+    """Patch the steps of commit to kill the process before the given step
+
+    The name of the step and whether WAL had been synced are written to fd before the process is killed
+    """
+    status = {"step": 0, "depth": 0, "synced": False}
+
+    def wrap(name: str, func: callable):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if status["depth"] == 0:
+                if status["step"] == crash_step:
+                    os.write(fd, f"{name},{int(status['synced'])}".encode())
+                    os.kill(os.getpid(), signal.SIGKILL)
+                status["step"] += 1
+
+            status["depth"] += 1
+            try:
+                ret = func(*args, **kwargs)
+            finally:
+                status["depth"] -= 1
+
+            if name == "WriteAheadLogWriter.flush":
+                status["synced"] = True
+            return ret
+
+        return wrapper
+
+    for owner, name in COMMIT_STEPS:
+        wrapper = wrap(f"{owner.__name__}.{name}", getattr(owner, name))
+        if isinstance(owner.__dict__[name], (staticmethod, classmethod)):
+            # A classmethod has already been bound to its class
+            wrapper = staticmethod(wrapper)
+        setattr(owner, name, wrapper)
+
+
 # In this test, do not check about the IPC
 class TestRecoverUsingWAL(TestIISSBase):
     def setUp(self):
@@ -337,3 +398,89 @@ class TestRecoverUsingWAL(TestIISSBase):
         self._close_and_reopen_iconservice()
 
         self._check_the_db_after_recover(last_block_before_close, is_start_block)
+
+    def _commit_in_child_process(self, tx_list: list, crash_step: int) -> Optional[Tuple[str, bool]]:
+        """Invoke and commit a block in a child process which is killed before the given step of commit
+
+        Databases are reopened by the child process as LevelDB locks are not inherited by fork.
+
+        :return: (the name of the step, whether WAL had been synced) or None if the commit is done
+        """
+        self.icon_service_engine.close()
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                os.close(read_fd)
+                self.icon_service_engine = IconServiceEngine()
+                self.icon_service_engine.open(self._config)
+                block, _ = self.make_and_req_block(tx_list)
+
+                _kill_on_step(crash_step, write_fd)
+                self.icon_service_engine.commit(block.height, block.hash, None)
+                code = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(code)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            message: str = f.read()
+        _, status = os.waitpid(pid, 0)
+
+        if os.WIFSIGNALED(status):
+            self.assertEqual(signal.SIGKILL, os.WTERMSIG(status))
+            name, synced = message.split(",")
+            return name, bool(int(synced))
+
+        self.assertEqual(0, os.WEXITSTATUS(status))
+        return None
+
+    def _test_kill_on_commit(self, is_calc_period_start_block: bool):
+        for crash_step in itertools.count():
+            if crash_step > 0:
+                self.tearDown()
+                self.setUp()
+
+            if is_calc_period_start_block:
+                self.make_blocks_to_end_calculation()
+            else:
+                self.make_blocks(self._get_last_block_from_icon_service() + 1)
+            last_block_before_close: int = self._get_last_block_from_icon_service()
+            stake_before_close: int = self.get_stake(self.staker)["stake"]
+
+            stake_tx = self.create_set_stake_tx(self.staker, self.stake_amount)
+            unregister_tx = self.create_unregister_prep_tx(self.prep_to_be_unregistered)
+            delegation_tx = self.create_set_delegation_tx(self.delegator,
+                                                          [(self.delegated_prep, self.delegate_amount)])
+            crash: Optional[Tuple[str, bool]] = \
+                self._commit_in_child_process([stake_tx, unregister_tx, delegation_tx], crash_step)
+
+            with self.subTest(crash_step=crash_step, crash=crash):
+                self.icon_service_engine = IconServiceEngine()
+                self.icon_service_engine.open(self._config)
+                self.icon_service_engine.hello()
+
+                if self._get_last_block_from_icon_service() == last_block_before_close:
+                    # The block is not committed only if the process is killed before WAL is synced
+                    self.assertIsNotNone(crash)
+                    self.assertFalse(crash[1])
+                    self.assertFalse(os.path.exists(self.log_path))
+                    self.assertEqual(stake_before_close, self.get_stake(self.staker)["stake"])
+                    self.assertEqual(0, self.get_prep(self.prep_to_be_unregistered)["status"])
+                else:
+                    self._check_the_db_after_recover(last_block_before_close, is_calc_period_start_block)
+
+            if crash is None:
+                break
+
+    @unittest.skipUnless(hasattr(os, "fork"), "fork is required to kill a process")
+    def test_kill_on_commit(self):
+        self._test_kill_on_commit(is_calc_period_start_block=False)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "fork is required to kill a process")
+    def test_kill_on_commit_on_the_start(self):
+        self._test_kill_on_commit(is_calc_period_start_block=True)
@@ -18,7 +18,7 @@ from math import ceil
 from typing import TYPE_CHECKING, Any, List
 
 from iconservice.base.address import ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
-from iconservice.icon_constant import ICX_IN_LOOP
+from iconservice.icon_constant import ICX_IN_LOOP, Revision
 from tests.integrate_test.test_integrate_base import TestIntegrateBase, DEFAULT_BIG_STEP_LIMIT
 
 if TYPE_CHECKING:
@@ -221,6 +221,36 @@ class TestIntegrateEstimateStep(TestIntegrateBase):
         estimate = self.icon_service_engine.estimate_step(request=converted_tx)
         self.assertEqual(tx_results[0].step_used, estimate)
 
+    def test_estimate_step_does_not_affect_invoke_with_same_tx_hash(self):
+        # Input data sizes are memoized by tx hash since revision 3
+        self.update_governance()
+        self.set_revision(Revision.THREE.value)
+
+        tx_results: List['TransactionResult'] = self.deploy_score(score_root="sample_deploy_scores",
+                                                                  score_name="install/sample_score",
+                                                                  from_=self._accounts[0],
+                                                                  deploy_params={"value": hex(ICX_IN_LOOP)})
+        score_addr1 = tx_results[0].score_address
+
+        tx = self.create_score_call_tx(from_=self._accounts[0],
+                                       to_=score_addr1,
+                                       func_name="set_value",
+                                       params={"value": hex(2 * ICX_IN_LOOP)},
+                                       pre_validation_enabled=False)
+        converted_tx = self._make_tx_for_estimating_step_from_origin_tx(tx)
+        estimate = self.icon_service_engine.estimate_step(request=converted_tx)
+
+        # Estimates larger input data with the tx hash of the transaction before it is invoked
+        converted_tx["params"]["txHash"] = tx["params"]["txHash"]
+        converted_tx["params"]["data"]["params"]["value"] = hex(2 ** 256)
+        self.assertLess(estimate, self.icon_service_engine.estimate_step(request=converted_tx))
+
+        prev_block, hash_list = self.make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        tx_results: List['TransactionResult'] = self.get_tx_results(hash_list)
+        self.assertEqual(tx_results[0].status, int(True))
+        self.assertEqual(estimate, tx_results[0].step_used)
+
     def test_estimate_step_when_install_score(self):
         tx = self.create_deploy_score_tx(score_root="get_api",
                                          score_name="get_api1",
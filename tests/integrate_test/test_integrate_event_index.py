@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TYPE_CHECKING, List
+from unittest.mock import patch
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.icon_constant import ConfigKey
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+EVENT = "NormalEventLog(str,str,str)"
+
+
+class TestIntegrateEventIndex(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.EVENT_INDEX: True}
+
+    def _call_event_log(self, score_address, value1: str, value2: str) -> 'TransactionResult':
+        return self.score_call(from_=self._accounts[0],
+                               to_=score_address,
+                               func_name="call_valid_event_log",
+                               params={"value1": value1, "value2": value2, "value3": "data"})[0]
+
+    def test_get_event_logs(self):
+        tx_results: List['TransactionResult'] = self.deploy_score(score_root="sample_event_log_scores",
+                                                                  score_name="sample_event_log_score",
+                                                                  from_=self._accounts[0],
+                                                                  to_=ZERO_SCORE_ADDRESS)
+        score_address = tx_results[0].score_address
+
+        tx_result1 = self._call_event_log(score_address, "a", "b")
+        tx_result2 = self._call_event_log(score_address, "c", "b")
+
+        response: dict = self._query({"scoreAddress": score_address, "event": EVENT}, "ise_getEventLogs")
+        event_logs: list = response["eventLogs"]
+        self.assertNotIn("nextBlockHeight", response)
+        self.assertEqual(2, len(event_logs))
+        self.assertEqual({"scoreAddress": score_address,
+                          "indexed": [EVENT, "a", "b"],
+                          "data": ["data"],
+                          "blockHeight": tx_result1.block_height,
+                          "txIndex": tx_result1.tx_index,
+                          "txHash": tx_result1.tx_hash}, event_logs[0])
+        self.assertEqual(tx_result2.tx_hash, event_logs[1]["txHash"])
+
+        # By indexed arguments
+        response = self._query({"scoreAddress": score_address, "event": EVENT, "indexed": ["c"]}, "ise_getEventLogs")
+        self.assertEqual([tx_result2.tx_hash], [event_log["txHash"] for event_log in response["eventLogs"]])
+
+        response = self._query({"event": EVENT, "indexed": [None, "b"]}, "ise_getEventLogs")
+        self.assertEqual(2, len(response["eventLogs"]))
+
+        # The rest of event logs are found from nextBlockHeight
+        response = self._query({"event": EVENT, "limit": 1}, "ise_getEventLogs")
+        self.assertEqual([tx_result1.tx_hash], [event_log["txHash"] for event_log in response["eventLogs"]])
+        self.assertEqual(tx_result2.block_height, response["nextBlockHeight"])
+
+        response = self._query({"event": EVENT, "fromBlock": response["nextBlockHeight"]}, "ise_getEventLogs")
+        self.assertEqual([tx_result2.tx_hash], [event_log["txHash"] for event_log in response["eventLogs"]])
+
+        # Reopened index keeps the event logs
+        self.icon_service_engine.close()
+        self.icon_service_engine.open(self._config)
+        response = self._query({"scoreAddress": score_address}, "ise_getEventLogs")
+        self.assertEqual(2, len(response["eventLogs"]))
+
+    def test_get_event_logs_limit_is_capped(self):
+        tx_results: List['TransactionResult'] = self.deploy_score(score_root="sample_event_log_scores",
+                                                                  score_name="sample_event_log_score",
+                                                                  from_=self._accounts[0],
+                                                                  to_=ZERO_SCORE_ADDRESS)
+        score_address = tx_results[0].score_address
+
+        tx_result1 = self._call_event_log(score_address, "a", "b")
+        tx_result2 = self._call_event_log(score_address, "c", "b")
+
+        with patch("iconservice.icon_service_engine.EVENT_LOGS_QUERY_LIMIT", 1):
+            response: dict = self._query({"event": EVENT, "limit": 100}, "ise_getEventLogs")
+        self.assertEqual([tx_result1.tx_hash], [event_log["txHash"] for event_log in response["eventLogs"]])
+        self.assertEqual(tx_result2.block_height, response["nextBlockHeight"])
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parallel transaction execution testcase
+"""
+
+import unittest
+from typing import List
+
+from iconservice.base.block import Block
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP, Revision
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateParallelTxExecution(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        return {
+            ConfigKey.SERVICE: {ConfigKey.SERVICE_FEE: True},
+            ConfigKey.PARALLEL_TX_EXECUTION: True,
+            ConfigKey.PARALLEL_TX_WORKERS: 2
+        }
+
+    def _invoke(self, tx_list: list, speculative: bool) -> tuple:
+        engine = self.icon_service_engine
+        block = Block(self._block_height + 1, create_block_hash(), create_timestamp(), self._prev_block_hash, 0)
+
+        executor = engine._speculative_executor
+        if not speculative:
+            engine._speculative_executor = None
+
+        try:
+            tx_results, state_root_hash, _, _ = engine.invoke(block=block, tx_requests=tx_list)
+        finally:
+            engine._speculative_executor = executor
+
+        results = []
+        for tx_result in tx_results:
+            result: dict = tx_result.to_dict()
+            del result['block_hash']
+            results.append(result)
+
+        return results, state_root_hash
+
+    def _test_invoke(self, expected_status: List[int]):
+        accounts = self._accounts
+        self.process_confirm_block_tx(
+            [self.create_transfer_icx_tx(self._admin, account, 100 * ICX_IN_LOOP) for account in accounts[:10]])
+
+        tx_list = [
+            # Independent transfers
+            self.create_transfer_icx_tx(accounts[0], accounts[20], ICX_IN_LOOP),
+            self.create_transfer_icx_tx(accounts[1], accounts[21], ICX_IN_LOOP),
+            self.create_message_tx(accounts[2], accounts[22], b'message'),
+            # Reads the balance of accounts[20] changed by the first one
+            self.create_transfer_icx_tx(accounts[20], accounts[23], ICX_IN_LOOP // 2, disable_pre_validate=True),
+            # The same sender as the first one
+            self.create_transfer_icx_tx(accounts[0], accounts[24], ICX_IN_LOOP),
+            # Out of balance
+            self.create_transfer_icx_tx(accounts[30], accounts[31], ICX_IN_LOOP, disable_pre_validate=True),
+            self.create_transfer_icx_tx(accounts[3], accounts[25], ICX_IN_LOOP),
+        ]
+
+        engine = self.icon_service_engine
+        commit_speculative_result = engine._commit_speculative_result
+        accepted: List[bool] = []
+
+        def _commit_speculative_result(*args):
+            tx_result = commit_speculative_result(*args)
+            accepted.append(tx_result is not None)
+            return tx_result
+
+        engine._commit_speculative_result = _commit_speculative_result
+
+        expected = self._invoke(tx_list, speculative=False)
+        self.assertEqual([], accepted)
+
+        self.assertEqual(expected, self._invoke(tx_list, speculative=True))
+        self.assertEqual([True, True, True, False, False, True, True], accepted)
+
+        tx_results: List[dict] = expected[0]
+        self.assertEqual(expected_status, [tx_result['status'] for tx_result in tx_results])
+
+    def test_invoke(self):
+        # The balance of a sender is checked against the last committed block before Revision.THREE
+        self._test_invoke([1, 1, 1, 0, 1, 0, 1])
+
+    def test_invoke_on_revision_three(self):
+        self.update_governance()
+        self.set_revision(Revision.THREE.value)
+        self._test_invoke([1, 1, 1, 1, 1, 0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Query result cache testcase
+"""
+
+import unittest
+
+from iconservice.base.address import GOVERNANCE_SCORE_ADDRESS
+from iconservice.icon_constant import ConfigKey, Revision
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateQueryCache(TestIntegrateBase):
+    def _get_revision(self) -> dict:
+        return self.query_score(from_=None, to_=GOVERNANCE_SCORE_ADDRESS, func_name="getRevision")
+
+    def test_query_cache(self):
+        query_cache = self.icon_service_engine._query_cache
+        self.update_governance()
+        self.set_revision(Revision.TWO.value)
+
+        revision: dict = self._get_revision()
+        self.assertEqual(Revision.TWO.value, revision["code"])
+        self.assertEqual(revision, self._get_revision())
+        self.assertEqual(1, query_cache.hits)
+
+        # The cache is cleared on commit
+        self.set_revision(Revision.THREE.value)
+        self.assertEqual(0, len(query_cache))
+        self.assertEqual(Revision.THREE.value, self._get_revision()["code"])
+        self.assertEqual(1, query_cache.hits)
+
+
+class TestIntegrateQueryCacheExcludes(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.QUERY_CACHE_EXCLUDES: [str(GOVERNANCE_SCORE_ADDRESS)]}
+
+    def test_excludes(self):
+        query_cache = self.icon_service_engine._query_cache
+        self.get_step_price()
+        self.get_step_price()
+        self.assertEqual(0, len(query_cache))
+        self.assertEqual(0, query_cache.hits + query_cache.misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SCORE instance pool testcase
+"""
+
+import unittest
+from typing import TYPE_CHECKING, List
+from unittest.mock import patch
+
+from iconservice.icon_constant import ConfigKey, Revision
+from iconservice.iconscore.icon_score_mapper_object import IconScoreInfo
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateScoreInstancePool(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        # Disable the query cache to call SCOREs for every query
+        return {ConfigKey.SCORE_INSTANCE_POOL: True, ConfigKey.QUERY_CACHE_SIZE: 0}
+
+    def setUp(self):
+        super().setUp()
+        self.update_governance()
+        self.set_revision(Revision.THREE.value)
+
+    def _deploy(self, score_name: str) -> 'Address':
+        tx_results: List['TransactionResult'] = self.deploy_score(score_root="sample_scores",
+                                                                  score_name=score_name,
+                                                                  from_=self._accounts[0])
+        return tx_results[0].score_address
+
+    def test_reuse_score_with_container_dbs_only(self):
+        score_address: 'Address' = self._deploy("sample_array_db")
+
+        with patch.object(IconScoreInfo, "create_score", autospec=True,
+                          side_effect=IconScoreInfo.create_score) as create_score:
+            for account in self._accounts[:3]:
+                self.score_call(from_=account, to_=score_address, func_name="set_values")
+            values = self.query_score(from_=self._accounts[0], to_=score_address, func_name="get_values")
+
+        self.assertEqual([str(account.address) for account in self._accounts[:3]], values)
+        # An instance is created once for the thread which invokes blocks and processes queries
+        self.assertEqual(1, create_score.call_count)
+
+    def test_create_score_with_member_variables(self):
+        score_address: 'Address' = self._deploy("sample_member_variable_score")
+
+        with patch.object(IconScoreInfo, "create_score", autospec=True,
+                          side_effect=IconScoreInfo.create_score) as create_score:
+            for _ in range(3):
+                name = self.query_score(from_=self._accounts[0], to_=score_address, func_name="getName")
+                # on_install() changes its member variable, so it is created for every call
+                self.assertEqual("__init__", name)
+
+        self.assertEqual(3, create_score.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
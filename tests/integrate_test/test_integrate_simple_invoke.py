@@ -61,6 +61,30 @@ class TestIntegrateSimpleInvoke(TestIntegrateBase):
         self.assertTrue(isinstance(last_block['timestamp'], int))
         self.assertTrue(last_block['timestamp'])
 
+    def test_ise_get_status_block_profiles(self):
+        self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+
+        response = self._query({'filter': ['blockProfiles']}, 'ise_getStatus')
+        self.assertIn('lastBlock', response)
+
+        profiles = response['blockProfiles']
+        # The genesis block and the one above
+        self.assertEqual(2, len(profiles))
+        profile = profiles[-1]
+        self.assertEqual(1, profile['blockHeight'])
+        self.assertEqual(1, profile['txCount'])
+        self.assertGreater(profile['stateKeys'], 0)
+
+        phases = profile['phases']
+        for phase in ('beforeTransactionProcess', 'call', 'fee', 'afterTransactionProcess', 'digest', 'invoke',
+                      'stateWrite', 'commit'):
+            self.assertIn(phase, phases)
+        self.assertEqual(1, phases['call']['count'])
+        self.assertGreaterEqual(phases['invoke']['wallMs'], phases['call']['wallMs'])
+
+        # blockProfiles is returned only on demand
+        self.assertNotIn('blockProfiles', self._query({}, 'ise_getStatus'))
+
     def test_invoke_success(self):
         value1 = 3 * ICX_IN_LOOP
         self.transfer_icx(from_=self._admin,
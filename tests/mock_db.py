@@ -56,9 +56,21 @@ class MockPlyvelDB(object):
     def get_sub_db(self, key: bytes):
         return MockPlyvelDB(self.make_db())
 
-    def iterator(self) -> iter:
+    def iterator(self,
+                 prefix: Optional[bytes] = None,
+                 start: Optional[bytes] = None,
+                 stop: Optional[bytes] = None) -> iter:
+        if prefix is not None:
+            return MockIterator(sorted((k, v) for k, v in self._db.items() if k.startswith(prefix)))
+        if start is not None or stop is not None:
+            return MockIterator(sorted((k, v) for k, v in self._db.items()
+                                       if (start is None or k >= start) and (stop is None or k < stop)))
+
         return iter(self._db)
 
+    def snapshot(self) -> 'MockSnapshot':
+        return MockSnapshot(dict(self._db))
+
     def prefixed_db(self, bytes_prefix) -> 'MockPlyvelDB':
         return MockPlyvelDB(MockPlyvelDB.make_db())
 
@@ -66,6 +78,40 @@ class MockPlyvelDB(object):
         return MockWriteBatch(self)
 
 
+class MockSnapshot(object):
+    def __init__(self, db: dict):
+        self._db = db
+
+    def get(self, bytes_key: bytes, default=None) -> Optional[bytes]:
+        return self._db.get(bytes_key, default)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class MockIterator(object):
+    def __init__(self, items: list):
+        self._it = iter(items)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._it)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
 class MockWriteBatch(object):
     """ WriteBatch(DB db, bytes prefix, bool transaction, sync) """
     def clear(self):
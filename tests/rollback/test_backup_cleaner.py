@@ -254,3 +254,22 @@ class TestBackupCleaner(unittest.TestCase):
         for filename in filenames:
             path = os.path.join(backup_root_path, filename)
             assert os.path.isfile(path)
+
+    def test_run_on_init_with_incomplete_files(self):
+        current_block_height = 101
+        backup_root_path: str = self.backup_root_path
+        backup_cleaner = BackupCleaner(backup_root_path, backup_files=10)
+
+        # A backup file being written in background when iconservice stopped
+        _create_dummy_backup_files(backup_root_path, 91, 99)
+        incomplete_path: str = f"{_get_backup_file_path(backup_root_path, 100)}.tmp"
+        _create_dummy_file(incomplete_path)
+        invalid_path: str = os.path.join(backup_root_path, "tmp.bak.tmp")
+        _create_dummy_file(invalid_path)
+
+        ret = backup_cleaner.run_on_init(current_block_height)
+        assert ret == 1
+
+        assert not os.path.exists(incomplete_path)
+        assert os.path.isfile(invalid_path)
+        _check_if_backup_files_exists(backup_root_path, 91, 99, expected=True)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import unittest
+from collections import OrderedDict
+
+from iconservice.base.block import Block
+from iconservice.base.exception import InternalServiceErrorException
+from iconservice.database.db import KeyValueDatabase
+from iconservice.database.wal import WALDBType
+from iconservice.icon_constant import Revision
+from iconservice.iiss.reward_calc.storage import Storage as RewardCalcStorage
+from iconservice.rollback.backup_cleaner import BackupCleaner
+from iconservice.rollback.backup_db import BackupDatabase
+from iconservice.rollback.backup_manager import BackupManager
+from iconservice.rollback.rollback_manager import RollbackManager
+from tests import create_block_hash
+
+
+def _create_block(block_height: int) -> 'Block':
+    return Block(block_height, create_block_hash(), 0, create_block_hash(), 0)
+
+
+def _get_items(db: 'KeyValueDatabase') -> dict:
+    return {key: value for key, value in db.iterator()}
+
+
+class TestBackupDatabase(unittest.TestCase):
+    def setUp(self) -> None:
+        state_db_root_path = "./test_backup_db"
+        shutil.rmtree(state_db_root_path, ignore_errors=True)
+
+        self.state_db_root_path = state_db_root_path
+        self.rc_data_path = os.path.join(state_db_root_path, "iiss")
+        self.backup_root_path = os.path.join(state_db_root_path, "backup")
+        os.makedirs(self.rc_data_path)
+        os.makedirs(self.backup_root_path)
+
+        self.state_db = KeyValueDatabase.from_path(os.path.join(state_db_root_path, "icon_dex"))
+        self.state_db.write_batch([(b"key0", b"value0"), (b"key1", b"value1")])
+        self.rc_db = RewardCalcStorage.create_current_db(self.rc_data_path)
+        self.rc_db.write_batch([(b"rc0", b"value0")])
+
+        self.backup_db = BackupDatabase.from_path(os.path.join(self.backup_root_path, "backup_db"))
+        self.backup_manager = BackupManager(self.backup_root_path, self.rc_data_path, self.backup_db)
+
+    def tearDown(self) -> None:
+        for db in (self.state_db, self.rc_db, self.backup_db):
+            if db is not None:
+                db.close()
+
+        shutil.rmtree(self.state_db_root_path, ignore_errors=True)
+
+    def _commit(self, block: 'Block', block_batch: OrderedDict, rc_batch: OrderedDict):
+        self.backup_manager.run(icx_db=self.state_db,
+                                rc_db=self.rc_db,
+                                revision=Revision.DECENTRALIZATION.value,
+                                prev_block=block,
+                                block_batch=block_batch,
+                                iiss_wal=rc_batch.items(),
+                                is_calc_period_start_block=False,
+                                instant_block_hash=create_block_hash())
+
+        self.state_db.write_batch(block_batch.items())
+        self.rc_db.write_batch(rc_batch.items())
+
+    def test_write_and_remove(self):
+        self._commit(_create_block(10), OrderedDict([(b"key0", b"new"), (b"key2", b"new")]),
+                     OrderedDict([(b"rc0", b"new")]))
+        self._commit(_create_block(11), OrderedDict([(b"key0", None)]), OrderedDict())
+
+        assert [(b"rc0", b"value0")] == list(self.backup_db.get_iterator(WALDBType.RC.value, 10, 11))
+        assert [
+            (b"key0", b"value0"),
+            (b"key2", None),
+            (b"key0", b"new"),
+        ] == list(self.backup_db.get_iterator(WALDBType.STATE.value, 10, 11))
+        assert [(b"key0", b"new")] == list(self.backup_db.get_iterator(WALDBType.STATE.value, 11, 20))
+        assert [] == list(self.backup_db.get_iterator(WALDBType.RC.value, 11, 20))
+
+        assert self.backup_db.exists(12, 10)
+        assert self.backup_db.exists(12, 11)
+        assert not self.backup_db.exists(12, 9)
+        assert not self.backup_db.exists(13, 10)
+
+        assert self.backup_db.remove(-1, -1) == 0
+        assert self.backup_db.remove(0, 10) == 1
+        assert not self.backup_db.exists(12, 10)
+        assert [] == list(self.backup_db.get_iterator(WALDBType.RC.value, 0, 20))
+        assert [(b"key0", b"new")] == list(self.backup_db.get_iterator(WALDBType.STATE.value, 0, 20))
+
+        assert self.backup_db.remove(11) == 1
+        assert [] == list(self.backup_db.get_iterator(WALDBType.STATE.value, 0, 20))
+
+    def test_write_on_the_same_height(self):
+        # The backup of a block rolled back is replaced with the one of another block at the same height
+        self._commit(_create_block(5), OrderedDict([(b"key0", b"new")]), OrderedDict([(b"rc0", b"new")]))
+        self.state_db.write_batch([(b"key0", b"value0")])
+        self.rc_db.write_batch([(b"rc0", b"value0")])
+        self._commit(_create_block(5), OrderedDict([(b"key1", b"new")]), OrderedDict())
+
+        assert [(b"key1", b"value1")] == list(self.backup_db.get_iterator(WALDBType.STATE.value, 5, 5))
+        assert [] == list(self.backup_db.get_iterator(WALDBType.RC.value, 5, 5))
+        assert self.backup_db.exists(6, 5)
+
+    def test_rollback_multi_blocks(self):
+        org_state_db_data: dict = _get_items(self.state_db)
+        org_rc_db_data: dict = _get_items(self.rc_db)
+
+        # A key is changed on several blocks
+        self._commit(_create_block(10), OrderedDict([(b"key0", b"new0"), (b"key2", b"new2")]),
+                     OrderedDict([(b"rc1", b"new1")]))
+        self._commit(_create_block(11), OrderedDict([(b"key0", b"newer0"), (b"key1", None)]),
+                     OrderedDict([(b"rc0", b"new0"), (b"rc1", b"newer1")]))
+        self._commit(_create_block(12), OrderedDict([(b"key2", None), (b"key3", b"new3")]),
+                     OrderedDict())
+
+        self.rc_db.close()
+        self.rc_db = None
+
+        rollback_manager = RollbackManager(self.backup_root_path, self.rc_data_path, self.state_db, self.backup_db)
+        with self.assertRaises(InternalServiceErrorException):
+            rollback_manager.run(last_block_height=13, rollback_block_height=9, term_start_block_height=0)
+
+        rollback_manager.run(last_block_height=13, rollback_block_height=10, term_start_block_height=0)
+
+        self.rc_db = RewardCalcStorage.create_current_db(self.rc_data_path)
+        assert org_state_db_data == _get_items(self.state_db)
+        assert org_rc_db_data == _get_items(self.rc_db)
+
+    def test_backup_cleaner(self):
+        for block_height in range(0, 20):
+            self._commit(_create_block(block_height), OrderedDict([(b"key0", b"new")]), OrderedDict())
+
+        backup_cleaner = BackupCleaner(self.backup_root_path, backup_files=10, backup_db=self.backup_db)
+
+        # Remove backups except for the latest ones: 8 ~ 17
+        assert backup_cleaner.run_on_init(current_block_height=18) == 10
+        assert self.backup_db.exists(18, 8)
+        assert not self.backup_db.exists(18, 7)
+        assert not self.backup_db.exists(19, 18)
+
+        assert backup_cleaner.run_on_commit(current_block_height=19) == 1
+        assert not self.backup_db.exists(18, 8)
+        assert self.backup_db.exists(18, 9)
+
+        assert backup_cleaner.run(start_block_height=9, end_block_height=16) == 8
+        assert self.backup_db.exists(18, 17)
+        assert not self.backup_db.exists(18, 16)
+        assert [(b"key0", b"new")] == list(self.backup_db.get_iterator(WALDBType.STATE.value, 0, 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
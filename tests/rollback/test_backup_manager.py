@@ -16,10 +16,13 @@
 import hashlib
 import os
 import shutil
+import threading
 import unittest
 from collections import OrderedDict
+from unittest.mock import Mock, patch
 
 from iconservice.base.block import Block
+from iconservice.base.exception import InternalServiceErrorException
 from iconservice.database.db import KeyValueDatabase
 from iconservice.database.wal import WriteAheadLogReader, WALDBType
 from iconservice.icon_constant import Revision
@@ -147,6 +150,106 @@ class TestBackupManager(unittest.TestCase):
         self._check_if_rollback_is_done(self.rc_db, self.org_rc_db_data)
         self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
 
+    def test_run_in_background(self):
+        backup_manager = self.backup_manager
+        backup_manager.start()
+
+        last_block = Block(
+            block_height=100,
+            block_hash=hashlib.sha3_256(b"block_hash").digest(),
+            timestamp=0,
+            prev_hash=hashlib.sha3_256(b"prev_hash").digest(),
+            cumulative_fee=0
+        )
+        block_batch = OrderedDict()
+        block_batch[b"key0"] = b"new value0"
+        block_batch[b"key1"] = None
+        block_batch[b"key3"] = b"value3"
+
+        rc_batch = OrderedDict()
+        rc_batch[b"key0"] = b"hello"
+
+        backup_cleaner = Mock()
+        path: str = os.path.join(self.backup_root_path, get_backup_filename(last_block.height))
+
+        event = threading.Event()
+        write = BackupManager._write
+
+        def delayed_write(*args):
+            # Write the backup file after the block is committed
+            event.wait()
+            write(backup_manager, *args)
+
+        with patch.object(BackupManager, "_write", side_effect=delayed_write):
+            backup_manager.run(icx_db=self.state_db,
+                               rc_db=self.rc_db,
+                               revision=Revision.DECENTRALIZATION.value,
+                               prev_block=last_block,
+                               block_batch=block_batch,
+                               iiss_wal=rc_batch.items(),
+                               is_calc_period_start_block=False,
+                               instant_block_hash=hashlib.sha3_256(b"instant_block_hash").digest(),
+                               backup_cleaner=backup_cleaner)
+
+            self._commit_state_db(self.state_db, block_batch)
+            self._commit_rc_db(self.rc_db, rc_batch)
+            assert not os.path.exists(path)
+
+            event.set()
+            backup_manager.wait()
+
+        # The previous states are read from a snapshot taken before commit
+        assert os.path.isfile(path)
+        assert not os.path.exists(f"{path}.tmp")
+        backup_cleaner.run_on_commit.assert_called_once_with(last_block.height + 1)
+
+        self._rollback(last_block)
+        self._check_if_rollback_is_done(self.rc_db, self.org_rc_db_data)
+        self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
+
+        backup_manager.close()
+
+    def test_rollback_multi_blocks(self):
+        # A key is changed on several blocks
+        batches = [
+            (OrderedDict([(b"key0", b"new0"), (b"key3", b"new3")]), OrderedDict([(b"rc1", b"new1")])),
+            (OrderedDict([(b"key0", b"newer0"), (b"key1", None)]), OrderedDict([(b"rc0", b"new0")])),
+            (OrderedDict([(b"key3", None), (b"key4", b"new4")]), OrderedDict([(b"rc1", b"newer1")])),
+        ]
+
+        for i, (block_batch, rc_batch) in enumerate(batches):
+            block = Block(
+                block_height=100 + i,
+                block_hash=hashlib.sha3_256(f"block_hash{i}".encode()).digest(),
+                timestamp=0,
+                prev_hash=hashlib.sha3_256(f"prev_hash{i}".encode()).digest(),
+                cumulative_fee=0
+            )
+            self.backup_manager.run(icx_db=self.state_db,
+                                    rc_db=self.rc_db,
+                                    revision=Revision.DECENTRALIZATION.value,
+                                    prev_block=block,
+                                    block_batch=block_batch,
+                                    iiss_wal=rc_batch.items(),
+                                    is_calc_period_start_block=False,
+                                    instant_block_hash=hashlib.sha3_256(f"instant{i}".encode()).digest())
+
+            self._commit_state_db(self.state_db, block_batch)
+            self._commit_rc_db(self.rc_db, rc_batch)
+
+        self.rc_db.close()
+        self.rc_db = None
+
+        with self.assertRaises(InternalServiceErrorException):
+            self.rollback_manager.run(last_block_height=103, rollback_block_height=99, term_start_block_height=0)
+
+        # The oldest previous state of a key remains
+        self.rollback_manager.run(last_block_height=103, rollback_block_height=100, term_start_block_height=0)
+
+        self.rc_db = _create_rc_db(self.rc_data_path)
+        self._check_if_rollback_is_done(self.rc_db, self.org_rc_db_data)
+        self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
+
     @staticmethod
     def _commit_state_db(db: 'KeyValueDatabase', block_batch: OrderedDict):
         db.write_batch(block_batch.items())
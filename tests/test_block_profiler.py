@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import unittest
+
+from iconservice.base.block import Block
+from iconservice.utils.profiler import BlockProfiler, Phase, measure
+from tests import create_block_hash
+
+
+def create_block(height: int) -> 'Block':
+    return Block(height, create_block_hash(), 0, create_block_hash())
+
+
+class TestBlockProfiler(unittest.TestCase):
+    def setUp(self):
+        self.dump_path = "block_profiles.jsonl"
+        self._remove_dump()
+
+    def tearDown(self):
+        self._remove_dump()
+
+    def _remove_dump(self):
+        if os.path.exists(self.dump_path):
+            os.remove(self.dump_path)
+
+    def test_measure(self):
+        profiler = BlockProfiler(10)
+        block = create_block(1)
+        profile = profiler.start(block)
+
+        for _ in range(3):
+            with measure(profile, Phase.CALL):
+                with measure(profile, Phase.FEE):
+                    pass
+        profiler.add(block.hash, Phase.TYPE_CONVERSION, 0.5, 0.25)
+
+        data: dict = profile.to_dict()
+        self.assertEqual(block.hash.hex(), data["blockHash"])
+        self.assertEqual(3, data["phases"][Phase.CALL]["count"])
+        self.assertEqual(3, data["phases"][Phase.FEE]["count"])
+        self.assertEqual({"wallMs": 500, "cpuMs": 250, "count": 1}, data["phases"][Phase.TYPE_CONVERSION])
+
+        # No-op without a profile
+        with measure(None, Phase.CALL):
+            pass
+
+    def test_ring_buffer(self):
+        profiler = BlockProfiler(2, self.dump_path)
+
+        blocks = [create_block(height) for height in range(3)]
+        for block in blocks:
+            profiler.start(block)
+            profiler.finish(block.hash)
+
+        # Only the profiles of the last 2 blocks are kept
+        self.assertEqual([1, 2], [data["blockHeight"] for data in profiler.to_list()])
+
+        # Every committed block is dumped
+        with open(self.dump_path) as f:
+            self.assertEqual([0, 1, 2], [json.loads(line)["blockHeight"] for line in f])
+
+    def test_discard(self):
+        profiler = BlockProfiler(2)
+        block = create_block(1)
+        profiler.start(block)
+        profiler.discard(block.hash)
+        profiler.finish(block.hash)
+
+        self.assertIsNone(profiler.get(block.hash))
+        self.assertEqual([], profiler.to_list())
+        self.assertFalse(os.path.exists(self.dump_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
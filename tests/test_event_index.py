@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from typing import List
+from unittest.mock import Mock
+
+from iconservice.base.address import AddressPrefix
+from iconservice.base.exception import InvalidParamsException
+from iconservice.event_index import BLOOM_SPANS, EventIndex, convert_indexed
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_event_log import EventLog
+from iconservice.iconscore.icon_score_result import TransactionResult
+from tests import create_address, create_tx_hash, rmtree
+
+TRANSFER = 'Transfer(Address,Address,int,bytes)'
+APPROVAL = 'Approval(Address,Address,int)'
+
+
+class TestEventIndex(unittest.TestCase):
+    _DB_PATH = '.event_index'
+
+    def setUp(self):
+        self.index = EventIndex.from_path(self._DB_PATH)
+        self.score_address = create_address(AddressPrefix.CONTRACT)
+        self.other_score_address = create_address(AddressPrefix.CONTRACT)
+        self.sender = create_address()
+        self.receiver = create_address()
+
+    def tearDown(self):
+        self.index.close()
+        rmtree(self._DB_PATH)
+
+    @staticmethod
+    def _make_tx_result(block_height: int, tx_index: int, event_logs: List['EventLog']) -> 'TransactionResult':
+        tx = Mock()
+        tx.hash = create_tx_hash()
+        tx.index = tx_index
+        block = Mock()
+        block.height = block_height
+
+        return TransactionResult(tx, block,
+                                 event_logs=event_logs,
+                                 logs_bloom=IconServiceEngine._generate_logs_bloom(event_logs))
+
+    def _commit(self, block_height: int, *event_logs_list: List['EventLog']) -> List['TransactionResult']:
+        tx_results = [self._make_tx_result(block_height, i, event_logs) for i, event_logs in enumerate(event_logs_list)]
+
+        logs_bloom: int = 0
+        for tx_result in tx_results:
+            logs_bloom |= int(tx_result.logs_bloom)
+
+        self.index.commit(block_height, tx_results, logs_bloom)
+        return tx_results
+
+    def _transfer(self, value: int) -> 'EventLog':
+        return EventLog(self.score_address, [TRANSFER, self.sender, self.receiver, value], [b'data'])
+
+    def _find(self, from_height: int, to_height: int, score_address=None, indexed=None) -> list:
+        return [(log.block_height, log.tx_index, log.event_log.indexed)
+                for log in self.index.find(from_height, to_height, score_address, indexed)]
+
+    def test_commit_and_find(self):
+        self.assertEqual(-1, self.index.last_block_height)
+
+        approval = EventLog(self.other_score_address, [APPROVAL, self.sender, self.receiver], [1])
+        tx_results = self._commit(0, [self._transfer(1), approval], [], [self._transfer(2)])
+        self._commit(1, [approval])
+        self._commit(2)
+        self.assertEqual(2, self.index.last_block_height)
+
+        logs = list(self.index.find(0, 2))
+        self.assertEqual(4, len(logs))
+        self.assertEqual((0, 0, tx_results[0].tx_hash), logs[0][:3])
+        self.assertEqual(self._transfer(1).indexed, logs[0].event_log.indexed)
+        self.assertEqual(self.score_address, logs[0].event_log.score_address)
+        self.assertEqual([b'data'], logs[0].event_log.data)
+        self.assertEqual([(0, 0), (0, 0), (0, 2), (1, 0)], [log[:2] for log in logs])
+
+        # By the index of a score address and an event signature
+        self.assertEqual([(0, 0, self._transfer(1).indexed), (0, 2, self._transfer(2).indexed)],
+                         self._find(0, 2, self.score_address, [TRANSFER]))
+        self.assertEqual([(0, 2, self._transfer(2).indexed)],
+                         self._find(0, 2, self.score_address, [TRANSFER, None, None, 2]))
+        self.assertEqual([(0, 2, self._transfer(2).indexed)],
+                         self._find(0, 2, self.score_address, [TRANSFER, self.sender, None, 2]))
+        self.assertEqual([], self._find(0, 2, self.score_address, [TRANSFER, self.receiver]))
+        self.assertEqual([], self._find(0, 2, self.score_address, [APPROVAL]))
+        self.assertEqual([(1, 0, approval.indexed)], self._find(1, 2, self.other_score_address, [APPROVAL]))
+
+        # By blooms
+        self.assertEqual([0, 1], [log[0] for log in self._find(0, 2, self.other_score_address)])
+        self.assertEqual([(0, 0, approval.indexed), (1, 0, approval.indexed)], self._find(0, 2, None, [APPROVAL]))
+        self.assertEqual([(0, 2, self._transfer(2).indexed)], self._find(0, 2, None, [None, None, None, 2]))
+        self.assertEqual(4, len(self._find(0, 2, None, [None, self.sender])))
+        self.assertEqual([], self._find(0, 2, None, [None, self.receiver]))
+
+        # Within a range of heights
+        self.assertEqual([(1, 0, approval.indexed)], self._find(1, 1, None, [APPROVAL]))
+        self.assertEqual([], self._find(2, 10))
+
+    def test_find_across_bloom_ranges(self):
+        heights = [BLOOM_SPANS[1] - 1, BLOOM_SPANS[1], BLOOM_SPANS[1] * 3 + 5]
+        for height in heights:
+            self._commit(height, [self._transfer(height)])
+
+        self.assertEqual(heights, [log[0] for log in self._find(0, heights[-1], self.score_address)])
+        self.assertEqual(heights[1:], [log[0] for log in self._find(heights[1], heights[-1], self.score_address)])
+        self.assertEqual(heights[:2], [log[0] for log in self._find(0, heights[-1] - 1, self.score_address)])
+        self.assertEqual([heights[1]], [log[0] for log in self._find(0, heights[-1], None, [None, None, None,
+                                                                                              heights[1]])])
+
+    def test_rollback(self):
+        heights = [1, BLOOM_SPANS[1] + 1, BLOOM_SPANS[1] + 2]
+        for height in heights:
+            self._commit(height, [self._transfer(height)])
+
+        self.index.rollback(heights[1])
+        self.assertEqual(heights[1], self.index.last_block_height)
+        self.assertEqual(heights[:2], [log[0] for log in self._find(0, heights[-1])])
+        self.assertEqual(heights[:2], [log[0] for log in self._find(0, heights[-1], self.score_address, [TRANSFER])])
+        self.assertEqual([], self._find(0, heights[-1], None, [None, None, None, heights[2]]))
+
+        # Blooms of the remaining block ranges are rebuilt
+        self.assertEqual(0, self.index._get_bloom(self.index._make_bloom_key(0, heights[2])))
+        self.assertEqual(self.index._get_bloom(self.index._make_bloom_key(0, heights[1])),
+                         self.index._get_bloom(self.index._make_bloom_key(1, BLOOM_SPANS[1])))
+
+        # Rolling back to a higher height does nothing
+        self.index.rollback(heights[-1])
+        self.assertEqual(heights[1], self.index.last_block_height)
+
+        self.index.rollback(-1)
+        self.assertEqual(-1, self.index.last_block_height)
+        self.assertEqual([], self._find(0, heights[-1]))
+        for level, _ in enumerate(BLOOM_SPANS):
+            self.assertEqual(0, self.index._get_bloom(self.index._make_bloom_key(level, 0)))
+
+        # Blocks can be committed again after rollback
+        self._commit(heights[0], [self._transfer(0)])
+        self.assertEqual([(heights[0], 0, self._transfer(0).indexed)], self._find(0, heights[-1]))
+
+    def test_convert_indexed(self):
+        address = create_address()
+        self.assertEqual([TRANSFER, address, None, 16, b'\x01'],
+                         convert_indexed(TRANSFER, [str(address), None, '0x10', '0x01']))
+        self.assertEqual([APPROVAL], convert_indexed(APPROVAL, []))
+
+        with self.assertRaises(InvalidParamsException):
+            convert_indexed('Transfer', [])
+        with self.assertRaises(InvalidParamsException):
+            convert_indexed(APPROVAL, [None, None, None, None])
+        with self.assertRaises(InvalidParamsException):
+            convert_indexed('Event(list)', ['0x1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from typing import Optional
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.base.exception import InvalidParamsException
+from iconservice.iconscore.icon_score_call_plan import copy_if_mutable, get_call_plan
+from tests import create_address
+
+
+class SampleScore(object):
+    def transfer(self, _to: Address, _value: int, _data: Optional[bytes] = None, _memo: str = "") -> None:
+        pass
+
+    def untyped(self, value) -> None:
+        pass
+
+
+class DerivedScore(SampleScore):
+    def transfer(self, _to: Address, _value: str) -> None:
+        pass
+
+
+class TestCallPlan(unittest.TestCase):
+    def test_convert_params(self):
+        score = SampleScore()
+        to = create_address(AddressPrefix.EOA)
+        params = {"_to": str(to), "_value": "0x10", "_data": "0x1234", "_memo": "hello"}
+
+        plan = get_call_plan(score, "transfer")
+        converted: dict = plan.convert_params(params)
+
+        self.assertEqual({"_to": to, "_value": 16, "_data": b"\x12\x34", "_memo": "hello"}, converted)
+        # The original params must not be changed
+        self.assertEqual(str(to), params["_to"])
+
+        # The plan is cached per class
+        self.assertIs(plan, get_call_plan(SampleScore(), "transfer"))
+
+        self.assertRaises(InvalidParamsException, plan.convert_params, {"_value": 1})
+
+    def test_untyped_params(self):
+        value = {"a": [1, 2]}
+        converted: dict = get_call_plan(SampleScore(), "untyped").convert_params({"value": value})
+
+        self.assertEqual(value, converted["value"])
+        self.assertIsNot(value, converted["value"])
+
+    def test_derived_class(self):
+        get_call_plan(SampleScore(), "transfer")
+
+        converted: dict = get_call_plan(DerivedScore(), "transfer").convert_params({"_value": "0x10"})
+        self.assertEqual("0x10", converted["_value"])
+
+    def test_copy_if_mutable(self):
+        for value in (1, "str", b"bytes", True, None, create_address()):
+            self.assertIs(value, copy_if_mutable(value))
+
+        for value in ({"a": 1}, [1, 2]):
+            copied = copy_if_mutable(value)
+            self.assertEqual(value, copied)
+            self.assertIsNot(value, copied)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from iconservice.base.address import GOVERNANCE_SCORE_ADDRESS
+from iconservice.iconscore.icon_score_query_cache import IconScoreQueryCache
+from tests import create_address, create_block_hash
+
+
+def create_params(method: str, params: dict) -> dict:
+    return {
+        "to": GOVERNANCE_SCORE_ADDRESS,
+        "dataType": "call",
+        "data": {"method": method, "params": params}
+    }
+
+
+class TestIconScoreQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.block_hash = create_block_hash()
+
+    def test_make_key(self):
+        key = IconScoreQueryCache.make_key(self.block_hash, create_params("balanceOf", {"a": "0x1", "b": "0x2"}))
+        # The order of params does not matter
+        self.assertEqual(
+            key, IconScoreQueryCache.make_key(self.block_hash, create_params("balanceOf", {"b": "0x2", "a": "0x1"})))
+        self.assertNotEqual(
+            key, IconScoreQueryCache.make_key(create_block_hash(), create_params("balanceOf", {"a": "0x1", "b": "0x2"})))
+        self.assertNotEqual(
+            key, IconScoreQueryCache.make_key(self.block_hash, create_params("balanceOf", {"a": "0x1"})))
+
+    def test_get_and_put(self):
+        cache = IconScoreQueryCache(1024 * 1024)
+        key = IconScoreQueryCache.make_key(self.block_hash, create_params("getInfo", {}))
+
+        self.assertEqual((False, None), cache.get(key))
+        cache.put_if_unchanged(key, {"value": 1}, cache.generation)
+
+        hit, result = cache.get(key)
+        self.assertTrue(hit)
+        self.assertEqual({"value": 1}, result)
+        # A cached result is not affected by the change of the returned one
+        result["value"] = 2
+        self.assertEqual((True, {"value": 1}), cache.get(key))
+
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertAlmostEqual(2 / 3, cache.hit_rate)
+
+    def test_clear(self):
+        cache = IconScoreQueryCache(1024 * 1024)
+        key = IconScoreQueryCache.make_key(self.block_hash, create_params("getInfo", {}))
+
+        generation: int = cache.generation
+        cache.clear()
+        # A result of the previous block must not be cached after clear()
+        cache.put_if_unchanged(key, 1, generation)
+        self.assertEqual(0, len(cache))
+
+        cache.put_if_unchanged(key, 1, cache.generation)
+        self.assertEqual(1, len(cache))
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.size)
+
+    def test_max_size(self):
+        key0 = IconScoreQueryCache.make_key(self.block_hash, create_params("get", {"index": "0x0"}))
+        key1 = IconScoreQueryCache.make_key(self.block_hash, create_params("get", {"index": "0x1"}))
+        value = "a" * 1000
+
+        cache = IconScoreQueryCache(3000)
+        cache.put_if_unchanged(key0, value, cache.generation)
+        cache.put_if_unchanged(key1, value, cache.generation)
+        # The least recently used result is evicted
+        self.assertEqual(1, len(cache))
+        self.assertEqual((True, value), cache.get(key1))
+        self.assertLessEqual(cache.size, 3000)
+
+        # A result bigger than the cache is not cached
+        cache.put_if_unchanged(key0, value * 10, cache.generation)
+        self.assertEqual((False, None), cache.get(key0))
+
+    def test_excludes(self):
+        address = create_address(1)
+        cache = IconScoreQueryCache(1024, [address])
+        self.assertFalse(cache.is_cacheable(address))
+        self.assertTrue(cache.is_cacheable(GOVERNANCE_SCORE_ADDRESS))
+
+
+if __name__ == '__main__':
+    unittest.main()
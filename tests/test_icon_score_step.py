@@ -31,7 +31,7 @@ from iconservice.iconscore.icon_score_context import ContextContainer, IconScore
 from iconservice.iconscore.icon_score_context_util import IconScoreContextUtil
 from iconservice.iconscore.icon_score_engine import IconScoreEngine
 from iconservice.iconscore.icon_score_step import \
-    StepType, IconScoreStepCounter, IconScoreStepCounterFactory
+    StepType, IconScoreStepCounter, IconScoreStepCounterFactory, OutOfStepException
 from iconservice.icx import IcxEngine
 from iconservice.prep import PRepEngine
 from iconservice.utils import ContextEngine
@@ -49,6 +49,13 @@ class TestIconScoreStepCounter(unittest.TestCase):
 
         factory = self._inner_task._icon_service_engine._step_counter_factory
         self.step_counter = Mock(spec=IconScoreStepCounter)
+        # Record the steps charged on db access as apply_step() calls
+        self.step_counter.charge_get.side_effect = lambda length: self.step_counter.apply_step(StepType.GET, length)
+        self.step_counter.charge_set.side_effect = lambda length: self.step_counter.apply_step(StepType.SET, length)
+        self.step_counter.charge_replace.side_effect = \
+            lambda length: self.step_counter.apply_step(StepType.REPLACE, length)
+        self.step_counter.charge_delete.side_effect = \
+            lambda length: self.step_counter.apply_step(StepType.DELETE, length)
         factory.create = Mock(return_value=self.step_counter)
         self.step_counter.step_used = 0
         self.step_counter.step_price = 0
@@ -708,6 +715,37 @@ class TestIconScoreStepCounter(unittest.TestCase):
         self.assertEqual(
             10, step_counter_factory.get_step_cost(StepType.EVENT_LOG))
 
+    def test_charge_same_as_apply_step(self):
+        charges = [
+            (StepType.GET, IconScoreStepCounter.charge_get),
+            (StepType.SET, IconScoreStepCounter.charge_set),
+            (StepType.REPLACE, IconScoreStepCounter.charge_replace),
+            (StepType.DELETE, IconScoreStepCounter.charge_delete)
+        ]
+
+        expected = IconScoreStepCounter(0, self.step_cost_dict, 5_000_000, step_trace_flag=True)
+        step_counter = IconScoreStepCounter(0, {}, 5_000_000, step_trace_flag=True)
+        # The table is rebuilt on set_step_costs()
+        step_counter.set_step_costs(self.step_cost_dict)
+        expected.reset(step_limit=5_000_000)
+        step_counter.reset(step_limit=5_000_000)
+
+        for i, (step_type, charge) in enumerate(charges * 3):
+            self.assertEqual(expected.apply_step(step_type, i + 1), charge(step_counter, i + 1))
+
+        self.assertEqual(expected.step_used, step_counter.step_used)
+        self.assertEqual(expected.max_step_used, step_counter.max_step_used)
+        self.assertEqual(str(expected.step_tracer), str(step_counter.step_tracer))
+
+        for step_type in StepType:
+            self.assertEqual(self.step_cost_dict.get(step_type, 0), step_counter.get_step_cost(step_type))
+
+        # Out of step is raised with the same values
+        step_counter.reset(step_limit=10)
+        with self.assertRaises(OutOfStepException) as cm:
+            step_counter.charge_set(1)
+        self.assertEqual((10, 0, 20), (cm.exception.step_limit, cm.exception.step_used, cm.exception.requested_step))
+
     @staticmethod
     def _init_step_cost() -> dict:
         raw_step_costs = {
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from typing import Optional
+from unittest.mock import Mock
+
+from iconservice.base.block import Block
+from iconservice.base.exception import InvalidParamsException
+from iconservice.database.batch import BlockBatch
+from iconservice.icon_constant import Revision
+# Load IconServiceEngine first to resolve the circular import between precommit_data_manager and iiss
+from iconservice.icon_service_engine import IconServiceEngine  # noqa: F401
+from iconservice.iconscore.icon_score_mapper import IconScoreMapper
+from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.precommit_data_manager import PrecommitData, PrecommitDataManager, PrecommitFlag
+from iconservice.utils.bloom import BloomFilter
+from tests import create_block_hash
+
+
+def create_precommit_data(block: 'Block',
+                          parent: Optional['PrecommitData'] = None,
+                          precommit_flag: PrecommitFlag = PrecommitFlag.NONE) -> 'PrecommitData':
+    block_batch = BlockBatch(block)
+    if parent is not None:
+        block_batch.parent = parent.block_batch
+
+    return PrecommitData(Revision.LATEST.value, 0, block_batch, [], [], None, None, None, None,
+                         IconScoreMapper(), precommit_flag, None, {}, None)
+
+
+def create_next_block(block: 'Block') -> 'Block':
+    return Block(block.height + 1, create_block_hash(), block.timestamp + 1, block.hash)
+
+
+class TestPrecommitDataManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = PrecommitDataManager()
+        self.last_block = Block(10, create_block_hash(), 0, create_block_hash())
+        self.manager.last_block = self.last_block
+
+    def _invoke(self, block: 'Block', **kwargs) -> 'PrecommitData':
+        parent: Optional['PrecommitData'] = self.manager.validate_block_to_invoke(block)
+        precommit_data = create_precommit_data(block, parent, **kwargs)
+        self.manager.push(precommit_data)
+        return precommit_data
+
+    def test_invoke_on_top_of_precommit_block(self):
+        block1 = create_next_block(self.last_block)
+        self.assertIsNone(self.manager.validate_block_to_invoke(block1))
+        data1 = self._invoke(block1)
+
+        block2 = create_next_block(block1)
+        self.assertIs(data1, self.manager.validate_block_to_invoke(block2))
+        data2 = self._invoke(block2)
+        self.assertIs(data1.block_batch, data2.block_batch.parent)
+
+        # Only the child of the last committed block can be committed
+        self.manager.validate_precommit_block(block1.hash)
+        self.assertRaises(InvalidParamsException, self.manager.validate_precommit_block, block2.hash)
+
+        # block2 remains after block1 is committed
+        self.manager.commit(data1)
+        self.assertEqual(block1, self.manager.last_block)
+        self.assertIsNone(data2.block_batch.parent)
+        self.assertIs(data2, self.manager.get(block2.hash))
+        self.assertIsNone(self.manager.get(block1.hash))
+        self.manager.validate_precommit_block(block2.hash)
+
+        # The tree is kept after commit
+        block3 = create_next_block(block2)
+        self.assertIs(data2, self.manager.validate_block_to_invoke(block3))
+
+    def test_non_chainable_block(self):
+        block1 = create_next_block(self.last_block)
+        self._invoke(block1, precommit_flag=PrecommitFlag.STEP_PRICE_CHANGED)
+
+        block2 = create_next_block(block1)
+        self.assertRaises(InvalidParamsException, self.manager.validate_block_to_invoke, block2)
+
+    def test_commit_removes_other_branches(self):
+        block1 = create_next_block(self.last_block)
+        data1 = self._invoke(block1)
+        block2 = create_next_block(block1)
+        data2 = self._invoke(block2)
+
+        # A competing block at the same height as block1 and its child
+        fork1 = create_next_block(self.last_block)
+        self._invoke(fork1)
+        fork2 = create_next_block(fork1)
+        self._invoke(fork2)
+
+        self.manager.commit(data1)
+        self.assertIs(data2, self.manager.get(block2.hash))
+        self.assertIsNone(self.manager.get(fork1.hash))
+        self.assertIsNone(self.manager.get(fork2.hash))
+
+    def test_remove_precommit_state_cascades(self):
+        block1 = create_next_block(self.last_block)
+        self._invoke(block1)
+        block2 = create_next_block(block1)
+        self._invoke(block2)
+        block3 = create_next_block(block2)
+        self._invoke(block3)
+
+        self.manager.remove_precommit_state(block2.hash)
+        self.assertIsNotNone(self.manager.get(block1.hash))
+        self.assertIsNone(self.manager.get(block2.hash))
+        self.assertIsNone(self.manager.get(block3.hash))
+
+        self.manager.remove_precommit_state(block1.hash)
+        self.assertTrue(self.manager.empty())
+
+    def test_remove_block_on_top_of_precommit_block(self):
+        block1 = create_next_block(self.last_block)
+        self._invoke(block1)
+        block2 = create_next_block(block1)
+        self._invoke(block2)
+        block3 = create_next_block(block2)
+        self._invoke(block3)
+
+        # A block can be removed before its parent is committed but not committed
+        self.manager.validate_precommit_block(block3.hash, allow_uncommitted_parent=True)
+        self.assertRaises(InvalidParamsException, self.manager.validate_precommit_block, block3.hash)
+
+        # A block not invoked on top of the precommit block at the previous height
+        block4 = Block(block3.height + 1, create_block_hash(), 0, block1.hash)
+        self.manager.push(create_precommit_data(block4))
+        self.assertRaises(InvalidParamsException,
+                          self.manager.validate_precommit_block, block4.hash, allow_uncommitted_parent=True)
+
+        engine = IconServiceEngine()
+        engine._precommit_data_manager = self.manager
+        engine.remove_precommit_state(block2.height, block2.hash)
+        self.assertIsNotNone(self.manager.get(block1.hash))
+        self.assertIsNone(self.manager.get(block2.hash))
+        self.assertIsNone(self.manager.get(block3.hash))
+
+    def test_commit_with_final_block_hash(self):
+        block1 = create_next_block(self.last_block)
+        data1 = self._invoke(block1)
+        block2 = create_next_block(block1)
+        data2 = self._invoke(block2)
+
+        # block2 was invoked on top of the instant hash of block1
+        data1.block_batch.update_block_hash(create_block_hash())
+        self.manager.commit(data1)
+
+        self.assertEqual(data1.block, self.manager.last_block)
+        self.assertIsNone(self.manager.get(block2.hash))
+        self.assertTrue(self.manager.empty())
+
+        # A block on top of the final hash is invoked and committed as usual
+        block3 = create_next_block(data1.block)
+        self._invoke(block3)
+        self.manager.validate_precommit_block(block3.hash)
+        self.assertRaises(InvalidParamsException, self.manager.validate_block_to_invoke, data2.block)
+
+    def test_logs_bloom(self):
+        block = create_next_block(self.last_block)
+        tx_results = []
+        for values in ([b'a', b'b'], [], [b'c']):
+            tx_result = TransactionResult(Mock(), block)
+            tx_result.logs_bloom = BloomFilter.from_iterable(values)
+            tx_results.append(tx_result)
+        # A tx_result without logs_bloom
+        tx_results.append(TransactionResult(Mock(), block))
+
+        precommit_data = PrecommitData(Revision.LATEST.value, 0, BlockBatch(block), tx_results, [],
+                                       None, None, None, None, IconScoreMapper(), PrecommitFlag.NONE, None, {}, None)
+
+        # The union of the blooms of all transactions in the block
+        self.assertEqual(int(BloomFilter.from_iterable([b'a', b'b', b'c'])), int(precommit_data.logs_bloom))
+
+
+if __name__ == '__main__':
+    unittest.main()